@@ -104,6 +104,13 @@ SIMPLE_JWT = {
 
 
 
+# Radar adatforrás: "csv" (data/ufcstats CSV-k, worker-szintű cache) vagy "db" (UFCFight / UFCFightStats)
+UFC_RADAR_BACKEND = "csv"
+
+# Ennyi másodpercenként nézzük meg (mtime + méret), változtak-e a data/ufcstats CSV-k
+UFCSTATS_DATASET_CHECK_INTERVAL = 5.0
+
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
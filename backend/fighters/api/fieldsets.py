@@ -0,0 +1,94 @@
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import SAFE_METHODS
+
+
+def _csv_param(request, name: str) -> list[str] | None:
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    return [p.strip() for p in raw.split(",") if p.strip()] or None
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Honours context["fields"] (keep only these) and context["expand"]
+    (swap in the richer representation from ``expandable_fields``).
+    Only the root serializer reads them; nested ones keep their default shape.
+    """
+
+    # mező -> hívható, ami a kibontott (expand) mezőt adja
+    expandable_fields = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        expand = self.context.get("expand") or []
+        fields = self.context.get("fields")
+
+        unknown = set(expand) - set(self.expandable_fields)
+        if unknown:
+            raise ParseError(f"Unknown field(s) in ?expand=: {', '.join(sorted(unknown))}")
+        for name in expand:
+            self.fields[name] = self.expandable_fields[name]()
+
+        if fields is not None:
+            keep = set(fields) | set(expand)
+            unknown = keep - set(self.fields)
+            if unknown:
+                raise ParseError(f"Unknown field(s) in ?fields=: {', '.join(sorted(unknown))}")
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
+
+
+def optimize_queryset(queryset, serializer):
+    """
+    select_related / prefetch_related / only() for exactly what ``serializer``
+    reads, so the number of queries does not depend on the number of rows.
+    """
+    only, related, prefetch = _read_paths(serializer)
+    if related:
+        queryset = queryset.select_related(*related)
+    for path, child in prefetch:
+        model = queryset.model._meta.get_field(path).related_model
+        queryset = queryset.prefetch_related(Prefetch(path, queryset=optimize_queryset(model.objects.all(), child)))
+    return queryset.only(*only)
+
+
+def _read_paths(serializer, prefix=""):
+    only, related, prefetch = [], [], []
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+        path = prefix + field.source.replace(".", "__")
+        if isinstance(field, serializers.ListSerializer):
+            # fordított kapcsolat: külön prefetch query, csak a gyökérszinten
+            if not prefix:
+                prefetch.append((path, field.child))
+        elif isinstance(field, serializers.BaseSerializer):
+            sub_only, sub_related, _ = _read_paths(field, prefix=f"{path}__")
+            only += [path, *sub_only]
+            related += [path, *sub_related]
+        else:
+            only.append(path)
+    return only, related, prefetch
+
+
+class SparseFieldsetViewMixin:
+    """
+    ?fields=a,b&expand=c on the read endpoints of a viewset; the queryset
+    is narrowed to the fields the serializer will read.
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method in SAFE_METHODS:
+            context["fields"] = _csv_param(self.request, "fields")
+            context["expand"] = _csv_param(self.request, "expand")
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        return optimize_queryset(queryset, self.get_serializer())
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class FighterCursorPagination(CursorPagination):
+    """
+    ?cursor=... pages in id order. Stable while fighters are added or
+    removed, and no COUNT(*) query per page.
+    """
+
+    ordering = "id"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
@@ -2,16 +2,68 @@ from rest_framework import serializers
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 from ..models import Fighter, Division
-from ..services.ufcstats_registry import is_known_fighter
+from ..services.ufcstats_registry import registry_snapshot, unknown_name_message, validate_names
+from .fieldsets import SparseFieldsetSerializerMixin
 
 
-class DivisionSerializer(serializers.ModelSerializer):
+class DivisionSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    # ?expand=fighters: a divízió fighterei kompakt sorokként (egy prefetch query)
+    expandable_fields = {
+        "fighters": lambda: FighterListSerializer(many=True, read_only=True),
+    }
+
     class Meta:
         model = Division
         fields = "__all__"
 
 
-class FighterSerializer(serializers.ModelSerializer):
+class DivisionNameSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Division
+        fields = ("id", "name")
+
+
+class FighterListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Compact row for the fighter list / grid; the full profile comes from retrieve."""
+
+    expandable_fields = {
+        "division": lambda: DivisionSerializer(read_only=True),
+    }
+
+    division = DivisionNameSerializer(read_only=True)
+
+    class Meta:
+        model = Fighter
+        fields = ("id", "name", "nickname", "division", "wins", "losses", "draw", "upload_image")
+        read_only_fields = fields
+
+
+def _clean_name(value) -> str:
+    return " ".join((value or "").strip().split())
+
+
+class FighterBulkSerializer(serializers.ListSerializer):
+    """many=True: all names are checked in one validate_names() call against one registry snapshot."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            registry = registry_snapshot()
+            names = [
+                _clean_name(item["name"]) for item in data if isinstance(item, dict) and isinstance(item.get("name"), str)
+            ]
+            self.child.name_checks = {c.input: c for c in validate_names(names, registry)}
+            self.child.registry = registry
+        try:
+            return super().to_internal_value(data)
+        finally:
+            self.child.name_checks = self.child.registry = None
+
+
+class FighterSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    # many=True esetén a FighterBulkSerializer tölti ki (név -> FighterCheck)
+    name_checks = None
+    registry = None
+
     # Kimenethez: részletes division objektum
     division = DivisionSerializer(read_only=True)
 
@@ -26,14 +78,18 @@ class FighterSerializer(serializers.ModelSerializer):
     class Meta:
         model = Fighter
         fields = "__all__"
+        list_serializer_class = FighterBulkSerializer
 
     def validate_name(self, value: str) -> str:
-        name = " ".join((value or "").strip().split())
+        name = _clean_name(value)
         if not name:
             raise serializers.ValidationError("Name cannot be empty.")
 
-        if not is_known_fighter(name):
-            raise serializers.ValidationError("Fighter name is not present in UFCStats CSV reference.")
+        check = (self.name_checks or {}).get(name)
+        if check is None:
+            check = validate_names([name], self.registry)[0]
+        if not check.known:
+            raise serializers.ValidationError(unknown_name_message(name, registry=self.registry))
 
         return name
 
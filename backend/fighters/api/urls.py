@@ -5,13 +5,16 @@ from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 
 
-from .views import FighterViewSet, DivisionViewSet, RegisterView, MeView
+from .views import FighterViewSet, DivisionViewSet, FighterSuggestView, FighterValidateView, RegisterView, MeView
 
 router = DefaultRouter()
 router.register(r"fighters", FighterViewSet, basename="fighters")
 router.register(r"divisions", DivisionViewSet, basename="divisions")
 
 urlpatterns = [
+    # a router elé, különben a fighters/<pk>/ detail route kapja meg
+    path("fighters/suggest/", FighterSuggestView.as_view(), name="fighter_suggest"),
+    path("fighters/validate/", FighterValidateView.as_view(), name="fighter_validate"),
     path("", include(router.urls)),
     path("auth/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("auth/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
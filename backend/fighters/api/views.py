@@ -4,7 +4,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from ..models import Division, Fighter
-from .serializers import DivisionSerializer, FighterSerializer
+from ..services.ufcstats_registry import registry_snapshot, suggest_fighters, validate_names, validate_urls
+from .fieldsets import SparseFieldsetViewMixin
+from .pagination import FighterCursorPagination
+from .serializers import DivisionSerializer, FighterListSerializer, FighterSerializer
 
 User = get_user_model()
 
@@ -21,18 +24,77 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         return bool(request.user and request.user.is_authenticated and request.user.is_staff)
 
 
-class FighterViewSet(viewsets.ModelViewSet):
+class FighterViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    # select_related / only() a kért mezők alapján: SparseFieldsetViewMixin
     queryset = Fighter.objects.all()
     serializer_class = FighterSerializer
     permission_classes = [IsAdminOrReadOnly]
+    pagination_class = FighterCursorPagination
 
+    def get_serializer_class(self):
+        # lista: kompakt sorok, a teljes profil (bio_long, description...) csak a retrieve-ben
+        if self.action == "list":
+            return FighterListSerializer
+        return FighterSerializer
 
-class DivisionViewSet(viewsets.ModelViewSet):
+
+class DivisionViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Division.objects.all()
     serializer_class = DivisionSerializer
     permission_classes = [IsAdminOrReadOnly]
 
 
+class FighterSuggestView(APIView):
+    """
+    GET ?q=jon&limit=10
+
+    Type-ahead over the UFCStats fighter registry: names starting with q
+    (accent/case-insensitive) first, then names with a later word (last
+    name) starting with q.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    MAX_LIMIT = 50
+
+    def get(self, request):
+        q = request.query_params.get("q") or ""
+        try:
+            limit = int(request.query_params.get("limit") or 10)
+        except ValueError:
+            return Response({"detail": "Invalid 'limit' value."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, self.MAX_LIMIT))
+
+        return Response({"query": q, "results": suggest_fighters(q, limit)})
+
+
+class FighterValidateView(APIView):
+    """
+    POST {"names": [...], "urls": [...]}
+
+    Bulk check against the UFCStats registry (e.g. before an admin bulk
+    edit): per item known / canonical name / canonical URL, all against
+    the same registry version.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    MAX_ITEMS = 5000
+
+    def post(self, request):
+        names = request.data.get("names") or []
+        urls = request.data.get("urls") or []
+        if not isinstance(names, list) or not isinstance(urls, list):
+            return Response({"detail": "'names' and 'urls' must be lists."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(names) + len(urls) > self.MAX_ITEMS:
+            return Response({"detail": f"At most {self.MAX_ITEMS} items per call."}, status=status.HTTP_400_BAD_REQUEST)
+
+        registry = registry_snapshot()
+        return Response({
+            "registry_version": registry.version,
+            "names": [c._asdict() for c in validate_names(map(str, names), registry)],
+            "urls": [c._asdict() for c in validate_urls(map(str, urls), registry)],
+        })
+
+
 class RegisterView(APIView):
     permission_classes = [permissions.AllowAny]
 
@@ -1,24 +1,60 @@
+import json
+from itertools import islice
+from pathlib import Path
+
 from django.core.management.base import BaseCommand
 from fighters.models import Fighter
-from fighters.services.ufcstats_registry import is_known_fighter
+from fighters.services.ufcstats_registry import registry_snapshot, validate_names
 
 
 class Command(BaseCommand):
     help = "Checks whether all Fighter names in DB exist in the UFCStats CSV reference."
 
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Fighters read and validated per batch.")
+        parser.add_argument(
+            "--report",
+            default="",
+            help="Write the unknown fighters to this JSON file instead of stdout (constant memory).",
+        )
+
     def handle(self, *args, **options):
+        chunk_size = max(1, options["chunk_size"])
+        registry = registry_snapshot()  # egy snapshot az egész futásra
+        rows = Fighter.objects.values_list("id", "name").iterator(chunk_size=chunk_size)
+
+        report = Path(options["report"]).open("w", encoding="utf-8") if options["report"] else None
         bad = []
+        checked = unknown = 0
+        try:
+            if report:
+                report.write(f'{{"registry_version": {json.dumps(registry.version)}, "unknown": [')
+
+            while chunk := list(islice(rows, chunk_size)):
+                checked += len(chunk)
+                results = validate_names(((name or "").strip() for _, name in chunk), registry)
+                for (fid, name), res in zip(chunk, results):
+                    if res.input and res.known:
+                        continue
+                    if report:
+                        report.write(("," if unknown else "") + "\n  " + json.dumps({"id": fid, "name": name}, ensure_ascii=False))
+                    else:
+                        bad.append((fid, name))
+                    unknown += 1
 
-        for f in Fighter.objects.all().only("id", "name"):
-            name = (f.name or "").strip()
-            if not name or not is_known_fighter(name):
-                bad.append((f.id, f.name))
+            if report:
+                report.write(f'\n], "checked": {checked}, "unknown_count": {unknown}}}\n')
+        finally:
+            if report:
+                report.close()
 
-        if not bad:
-            self.stdout.write(self.style.SUCCESS("OK: All fighters match UFCStats CSV reference."))
+        if not unknown:
+            self.stdout.write(self.style.SUCCESS(f"OK: All {checked} fighters match UFCStats CSV reference."))
             return
 
-        self.stdout.write(self.style.ERROR(f"FAIL: {len(bad)} fighter(s) not found in UFCStats CSV reference:"))
+        self.stdout.write(self.style.ERROR(f"FAIL: {unknown} fighter(s) not found in UFCStats CSV reference:"))
+        if report:
+            self.stdout.write(f"- see {options['report']}")
         for fid, name in bad:
             self.stdout.write(f"- id={fid} name={name}")
 
@@ -1,19 +1,17 @@
-import csv
-import unicodedata
+import json
+from itertools import islice
 from pathlib import Path
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from fighters.models import Fighter
+from ufcstats.services.csv_ingest import parse_fighter_details, parse_fighter_tott
+from ufcstats.services.identity import identity_urls, normalize_name
+from ufcstats.services.ingest_state import RowDelta
 
 CSV_TOTT = Path("data/ufcstats/ufc_fighter_tott.csv")
 CSV_DETAILS = Path("data/ufcstats/ufc_fighter_details.csv")
 
-def norm_name(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii")
-    s = " ".join(s.split())
-    return s
-
 def parse_height_cm(v: str):
     # "5' 11\"" -> cm
     if not v or v.strip() in ("--", ""):
@@ -50,6 +48,9 @@ def parse_reach_cm(v: str):
     except Exception:
         return None
 
+UPDATE_FIELDS = ["height", "weight", "reach", "nickname"]
+
+
 class Command(BaseCommand):
     help = "Import UFC fighter profile data from CSV into existing Fighters (dry-run by default)"
 
@@ -65,11 +66,36 @@ class Command(BaseCommand):
             default=0,
             help="Limit how many Fighters to process (0 = all).",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Changed fighters per bulk_update call.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Fighters fetched per DB round trip while streaming.",
+        )
+        parser.add_argument(
+            "--diff-file",
+            type=str,
+            default="",
+            help="Write the changes / missing fighters as JSON to this path.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Re-check every fighter, ignoring stored CSV row hashes.",
+        )
+        parser.add_argument(
+            "--verbose-rows",
+            action="store_true",
+            help="Print one line per changed / missing fighter.",
+        )
 
     def handle(self, *args, **options):
-        apply = options["apply"]
-        limit = options["limit"]
-
         if not CSV_TOTT.exists():
             self.stderr.write(f"Missing file: {CSV_TOTT.resolve()}")
             return
@@ -77,70 +103,110 @@ class Command(BaseCommand):
             self.stderr.write(f"Missing file: {CSV_DETAILS.resolve()}")
             return
 
+        self.sync(parse_fighter_tott(CSV_TOTT), parse_fighter_details(CSV_DETAILS), options)
+
+    def sync(self, tott, details, options):
+        """DB phase for already parsed CSV rows (also used by import_ufcstats)."""
+        apply = options["apply"]
+        limit = options["limit"]
+        batch_size = max(1, options["batch_size"])
+        verbose = options["verbose_rows"]
+
         # URL -> nickname
-        nick_by_url = {}
-        with CSV_DETAILS.open(newline="", encoding="utf-8") as f:
-            r = csv.DictReader(f)
-            for row in r:
-                url = (row.get("URL") or "").strip()
-                nick = (row.get("NICKNAME") or "").strip()
-                if url:
-                    nick_by_url[url] = nick
-
-        # normalized fighter name -> row
+        nick_by_url = {row.url: row.nickname for row in details if row.url}
+
+        # URL -> row; fallback: normalized fighter name -> row
+        row_by_url = {row.url: row for row in tott if row.url}
         row_by_name = {}
-        with CSV_TOTT.open(newline="", encoding="utf-8") as f:
-            r = csv.DictReader(f)
-            for row in r:
-                nm = norm_name(row.get("FIGHTER"))
-                if nm:
-                    row_by_name[nm] = row
-
-        qs = Fighter.objects.all().order_by("id")
+        for row in tott:
+            nm = normalize_name(row.fighter)
+            if nm:
+                row_by_name[nm] = row
+
+        # név -> ufcstats URL az identity táblából (egy lekérdezés)
+        url_by_alias = identity_urls()
+
+        qs = Fighter.objects.only("id", "name", *UPDATE_FIELDS).order_by("id")
         if limit and limit > 0:
             qs = qs[:limit]
 
+        # URL szerinti hash: csak az új / megváltozott CSV sorokhoz tartozó fightereket nézzük újra
+        delta = RowDelta("fighters", full=options["full"])
+
         updated = 0
         unchanged = 0
         missing = 0
-
-        for fobj in qs:
-            key = norm_name(fobj.name)
-            row = row_by_name.get(key)
-
-            if not row:
-                missing += 1
-                self.stdout.write(f"[MISS] {fobj.name}")
-                continue
-
-            ufc_url = (row.get("URL") or "").strip()
-            h_cm = parse_height_cm(row.get("HEIGHT"))
-            w_kg = parse_weight_kg(row.get("WEIGHT"))
-            r_cm = parse_reach_cm(row.get("REACH"))
-            nick = nick_by_url.get(ufc_url, "") if ufc_url else ""
-
-            changes = {}
-
-            if h_cm is not None and float(fobj.height) != float(h_cm):
-                changes["height"] = h_cm
-            if w_kg is not None and float(fobj.weight) != float(w_kg):
-                changes["weight"] = w_kg
-            if r_cm is not None and fobj.reach != r_cm:
-                changes["reach"] = r_cm
-            if nick and fobj.nickname != nick:
-                changes["nickname"] = nick
-
-            if not changes:
-                unchanged += 1
-                continue
-
-            updated += 1
-            self.stdout.write(f"[{'APPLY' if apply else 'DRY'}] {fobj.name} -> {changes}")
-
+        # a diff csak --diff-file mellett gyűlik, különben nem tartjuk memóriában
+        diff = {"updated": [], "missing": []} if options["diff_file"] else None
+        chunk_size = max(1, options["chunk_size"])
+        rows = qs.iterator(chunk_size=chunk_size)
+
+        with transaction.atomic():
+            # előbb a teljes chunk beolvasva, utána írunk: a bulk_update nem fut
+            # a még olvasott Fighter cursor alatt
+            while chunk := list(islice(rows, chunk_size)):
+                pending = []
+                for fobj in chunk:
+                    key = normalize_name(fobj.name)
+                    row = row_by_url.get(url_by_alias.get(key)) or row_by_name.get(key)
+
+                    if not row:
+                        missing += 1
+                        if diff is not None:
+                            diff["missing"].append({"id": fobj.id, "name": fobj.name})
+                        if verbose:
+                            self.stdout.write(f"[MISS] {fobj.name}")
+                        continue
+
+                    ufc_url = row.url
+                    h_cm = parse_height_cm(row.height)
+                    w_kg = parse_weight_kg(row.weight)
+                    r_cm = parse_reach_cm(row.reach)
+                    nick = nick_by_url.get(ufc_url, "") if ufc_url else ""
+
+                    if ufc_url:
+                        digest = delta.changed(ufc_url, {"fighter_id": fobj.id, "row": row, "nickname": nick})
+                        if digest is None:
+                            unchanged += 1
+                            continue
+                        delta.mark(ufc_url, digest)
+
+                    changes = {}
+
+                    if h_cm is not None and float(fobj.height) != float(h_cm):
+                        changes["height"] = h_cm
+                    if w_kg is not None and float(fobj.weight) != float(w_kg):
+                        changes["weight"] = w_kg
+                    if r_cm is not None and fobj.reach != r_cm:
+                        changes["reach"] = r_cm
+                    if nick and fobj.nickname != nick:
+                        changes["nickname"] = nick
+
+                    if not changes:
+                        unchanged += 1
+                        continue
+
+                    updated += 1
+                    if diff is not None:
+                        diff["updated"].append({"id": fobj.id, "name": fobj.name, "changes": changes})
+                    if verbose:
+                        self.stdout.write(f"[{'APPLY' if apply else 'DRY'}] {fobj.name} -> {changes}")
+
+                    if apply:
+                        for k, v in changes.items():
+                            setattr(fobj, k, v)
+                        pending.append(fobj)
+
+                if pending:
+                    Fighter.objects.bulk_update(pending, UPDATE_FIELDS, batch_size=batch_size)
             if apply:
-                for k, v in changes.items():
-                    setattr(fobj, k, v)
-                fobj.save(update_fields=list(changes.keys()))
+                delta.save()
+
+        if options["diff_file"]:
+            Path(options["diff_file"]).write_text(
+                json.dumps({"apply": apply, **diff}, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
 
         self.stdout.write("")
         self.stdout.write(self.style.SUCCESS(
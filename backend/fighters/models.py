@@ -67,13 +67,13 @@ class Fighter(models.Model):
 
     
         try:
-            from fighters.services.ufcstats_registry import is_known_fighter
+            from fighters.services.ufcstats_registry import is_known_fighter, unknown_name_message
         except Exception:
         
             raise ValidationError({"name": "Name validation service is unavailable."})
 
         if not is_known_fighter(name):
-            raise ValidationError({"name": "Fighter name is not present in UFCStats CSV reference."})
+            raise ValidationError({"name": unknown_name_message(name)})
 
 
         self.name = name
@@ -1,9 +1,27 @@
 import csv
-from functools import lru_cache
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
+import numpy as np
 from django.conf import settings
 
+from ufcstats.services.dataset_cache import DatasetCache, files_signature, signature_version, snapshot_accessor
+from ufcstats.services.identity import normalize_name
+from ufcstats.services.snapshot import (
+    CURRENT_FILE,
+    SNAPSHOT_DIR,
+    SortedStrings,
+    StringTable,
+    fixed_width_array,
+    read_snapshot_part,
+    sorted_strings_array,
+)
+
 
 DATA_DIR = Path(settings.BASE_DIR) / "data" / "ufcstats"
 FIGHTERS_CSV = DATA_DIR / "ufc_fighter_details.csv"
@@ -13,7 +31,7 @@ UFC_FIGHTER_DETAILS_CSV = FIGHTERS_CSV
 
 
 def _normalize_name(name: str) -> str:
-    return " ".join((name or "").strip().split()).lower()
+    return normalize_name(name)
 
 def _normalize_url(url: str) -> str:
     u = (url or "").strip()
@@ -24,80 +42,482 @@ def _normalize_url(url: str) -> str:
         u = u[:-1]
     return u.lower()
 
-@lru_cache(maxsize=1)
-def known_fighters_set() -> set[str]:
-    if not FIGHTERS_CSV.exists():
-        return set()
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    Names and URLs of the fighter details CSV, read together in one pass.
+    From a compiled snapshot the collections are SortedStrings views of the
+    memory-mapped arrays (shared by every worker); from the CSV, frozensets.
+    """
+    names: Collection[str]
+    urls: Collection[str]
+    # normalizált név -> URL; az azonos nevű (több URL-es) fighterek kimaradnak
+    url_by_name: Mapping[str, str]
+    # normalizált név -> név a CSV írásmódjával (ékezetek, kis-nagybetű)
+    display_by_name: Mapping[str, str]
+    # URL -> név a CSV írásmódjával, minden sorból (az azonos nevű fighterekéből is)
+    display_by_url: Mapping[str, str]
+    version: str
+    _memo: dict = field(default_factory=dict, init=False, compare=False, repr=False)
+
+    def bk_tree(self) -> "BKTree":
+        tree = self._memo.get("bk_tree")
+        if tree is None:
+            tree = self._memo["bk_tree"] = BKTree.build(sorted(self.names))
+        return tree
+
+    def name_index(self) -> "NameIndex":
+        index = self._memo.get("name_index")
+        if index is None:
+            index = self._memo["name_index"] = NameIndex.build(self.names)
+        return index
+
+
+def _bit_pattern(a: str):
+    """Per-character bit masks of ``a`` for _distance_from(); build once per query."""
+    peq = {}
+    for i, ch in enumerate(a):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq, (1 << len(a)) - 1, 1 << (len(a) - 1), len(a)
+
+
+def _distance_from(pattern, b: str) -> int:
+    """Levenshtein distance of the pattern's string to ``b`` (Myers / Hyyrö, bit-parallel)."""
+    peq, mask, last, score = pattern
+    pv, mv = mask, 0
+    for ch in b:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Levenshtein distance, bit-parallel (Myers / Hyyrö): one pass over ``b``
+    with a few integer operations per character, whatever the length of ``a``.
+    """
+    if not a or not b:
+        return len(a) + len(b)
+    return _distance_from(_bit_pattern(a), b)
+
+
+class BKTree:
+    """
+    Burkhard-Keller trees over names by edit distance, one tree per name
+    length. Names more than ``max_dist`` characters longer or shorter can
+    never match, so their trees are skipped; inside a tree the triangle
+    inequality prunes every child whose edge is outside d +- radius.
+
+    The nodes are flat arrays (word index, CSR child edges), so a tree
+    compiled into the snapshot is searched in place on the memory-mapped
+    file; ``words`` is only indexed, never copied.
+    """
+
+    def __init__(self, words, arrays: dict):
+        self._words = words
+        self._arrays = arrays
+        # memoryview: egy elem olvasása Python int, a numpy skalár költsége nélkül
+        self._node_word = memoryview(arrays["bk_node_word"])
+        self._edge_start = memoryview(arrays["bk_edge_start"])
+        self._edge_dist = memoryview(arrays["bk_edge_dist"])
+        self._edge_child = memoryview(arrays["bk_edge_child"])
+        # hossz -> gyökér csomópont (néhány tucat elem)
+        self._roots = dict(zip(arrays["bk_root_length"].tolist(), arrays["bk_root_node"].tolist()))
+
+    @classmethod
+    def build(cls, words) -> "BKTree":
+        """Tree over a sequence of distinct words (e.g. the sorted registry names)."""
+        words = words if isinstance(words, SortedStrings) else list(words)
+        node_word = []
+        children = []  # csomópont -> {távolság: gyerek csomópont}
+        roots = {}
+        for wi, word in enumerate(words):
+            node = roots.get(len(word))
+            if node is None:
+                roots[len(word)] = len(node_word)
+                node_word.append(wi)
+                children.append({})
+                continue
+            pattern = _bit_pattern(word)
+            while True:
+                d = _distance_from(pattern, words[node_word[node]])
+                if d == 0:
+                    break
+                child = children[node].get(d)
+                if child is None:
+                    children[node][d] = len(node_word)
+                    node_word.append(wi)
+                    children.append({})
+                    break
+                node = child
+
+        edge_start = np.zeros(len(node_word) + 1, dtype=np.int32)
+        np.cumsum([len(c) for c in children], out=edge_start[1:])
+        arrays = {
+            "bk_node_word": np.array(node_word, dtype=np.int32),
+            "bk_edge_start": edge_start,
+            "bk_edge_dist": np.array([d for c in children for d in c], dtype=np.int16),
+            "bk_edge_child": np.array([n for c in children for n in c.values()], dtype=np.int32),
+            "bk_root_length": np.array(list(roots), dtype=np.int32),
+            "bk_root_node": np.array(list(roots.values()), dtype=np.int32),
+        }
+        return cls(words, arrays)
+
+    def to_arrays(self) -> dict:
+        return dict(self._arrays)
+
+    def search(self, word: str, max_dist: int, limit: int = 3, time_budget: float = 0.05) -> list[tuple[int, str]]:
+        """
+        Up to ``limit`` (distance, word) pairs within ``max_dist``, nearest
+        first. Searches radius 1, 2, ... ``max_dist`` and stops at the first
+        radius with ``limit`` hits, so the closest names are always found
+        first. ``time_budget`` (seconds) only caps pathological lookups;
+        past it the hits found so far are returned.
+        """
+        if not word:
+            return []
+        deadline = time.perf_counter() + time_budget
+        pattern = _bit_pattern(word)
+        # csomópont -> távolság; a nagyobb sugarú bejárás újra ugyanazokat a csomópontokat éri el
+        seen = {}
+        found = {}
+        for radius in range(1, max_dist + 1):
+            for length in range(len(word) - radius, len(word) + radius + 1):
+                root = self._roots.get(length)
+                if root is not None and not self._walk(root, pattern, radius, seen, found, deadline):
+                    return self._hits(found, limit)
+            if len(found) >= limit:
+                break
+        return self._hits(found, limit)
+
+    def _hits(self, found, limit):
+        return sorted((d, self._words[self._node_word[n]]) for n, d in found.items())[:limit]
+
+    def _walk(self, root, pattern, radius, seen, found, deadline) -> bool:
+        """Adds the nodes within ``radius`` to ``found``; False if the deadline passed."""
+        words, node_word = self._words, self._node_word
+        edge_start, edge_dist, edge_child = self._edge_start, self._edge_dist, self._edge_child
+        stack = [root]
+        while stack:
+            if time.perf_counter() > deadline:
+                return False
+            node = stack.pop()
+            d = seen.get(node)
+            if d is None:
+                d = seen[node] = _distance_from(pattern, words[node_word[node]])
+            if d <= radius:
+                found[node] = d
+            for k in range(edge_start[node], edge_start[node + 1]):
+                if d - radius <= edge_dist[k] <= d + radius:
+                    stack.append(edge_child[k])
+        return True
 
-    out: set[str] = set()
 
-    with FIGHTERS_CSV.open(newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        if not r.fieldnames:
-            return set()
-        
+class NameIndex:
+    """
+    Sorted arrays for prefix search: every full name, and every name again
+    keyed from each later word (so "jones" finds "jon jones"). A lookup is
+    a bisect plus a scan of at most ``limit`` (+ duplicate) entries. Like
+    the BK-tree, a compiled index is searched in place on the snapshot.
+    """
 
-        # Elvárt mezők a te CSV-dben
-        has_first = "FIRST" in r.fieldnames
-        has_last = "LAST" in r.fieldnames
+    def __init__(self, names, word_keys, word_names):
+        self._full = names  # rendezett nevek
+        self._word_keys = word_keys  # rendezett "későbbi szótól" kulcsok
+        self._word_names = word_names  # kulcs -> index a _full-ban
 
-        if not (has_first and has_last):
+    @classmethod
+    def build(cls, names) -> "NameIndex":
+        names = names if isinstance(names, SortedStrings) else sorted(names)
+        pairs = sorted(
+            (name[i + 1:], ni) for ni, name in enumerate(names) for i, ch in enumerate(name) if ch == " "
+        )
+        return cls(names, [k for k, _ in pairs], np.array([ni for _, ni in pairs], dtype=np.int32))
+
+    @classmethod
+    def from_arrays(cls, names: SortedStrings, arrays: dict) -> "NameIndex":
+        return cls(names, SortedStrings(arrays["index_word_keys"]), arrays["index_word_names"])
+
+    def to_arrays(self) -> dict:
+        keys = self._word_keys
+        return {
+            "index_word_keys": keys._array if isinstance(keys, SortedStrings) else fixed_width_array(keys),
+            "index_word_names": self._word_names,
+        }
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        q = _normalize_name(query)
+        if not q or limit <= 0:
+            return []
+
+        # előbb a teljes névre illeszkedők, utána a vezetéknévre (későbbi szóra) illeszkedők
+        out = []
+        full = self._full
+        i = bisect_left(full, q)
+        while i < len(full) and len(out) < limit and full[i].startswith(q):
+            out.append(full[i])
+            i += 1
+
+        seen = set(out)
+        keys = self._word_keys
+        i = bisect_left(keys, q)
+        while i < len(keys) and len(out) < limit and keys[i].startswith(q):
+            name = full[int(self._word_names[i])]
+            if name not in seen:
+                seen.add(name)
+                out.append(name)
+            i += 1
+        return out
+
+
+def _registry_paths():
+    return (FIGHTERS_CSV, SNAPSHOT_DIR / CURRENT_FILE)
+
+
+def _registry(urls, url_by_name, display_by_name, display_by_url) -> RegistrySnapshot:
+    return RegistrySnapshot(
+        names=frozenset(display_by_name),
+        urls=frozenset(urls),
+        url_by_name=MappingProxyType(dict(url_by_name)),
+        display_by_name=MappingProxyType(dict(display_by_name)),
+        display_by_url=MappingProxyType(dict(display_by_url)),
+        version=signature_version(files_signature(_registry_paths())),
+    )
+
+
+def _read_registry() -> RegistrySnapshot:
+    display_by_name: dict[str, str] = {}
+    urls: set[str] = set()
+    url_by_name: dict[str, str] = {}
+    display_by_url: dict[str, str] = {}
+    ambiguous: set[str] = set()
+
+    if FIGHTERS_CSV.exists():
+        with FIGHTERS_CSV.open(newline="", encoding="utf-8") as f:
+            r = csv.DictReader(f)
+            header = r.fieldnames or []
             # Ha valamiért más lett a header, inkább legyen üres, mint rossz
-            return set()
+            has_name = "FIRST" in header and "LAST" in header
+            has_url = "URL" in header
+
+            for row in r:
+                name = ""
+                if has_name:
+                    full = " ".join(f"{row.get('FIRST') or ''} {row.get('LAST') or ''}".split())
+                    name = _normalize_name(full)
+                    if name:
+                        display_by_name.setdefault(name, full)
+                url = _normalize_url(row.get("URL") or "") if has_url else ""
+                if url:
+                    urls.add(url)
+                if name and url:
+                    display_by_url.setdefault(url, full)
+                    if url_by_name.setdefault(name, url) != url:
+                        ambiguous.add(name)
+
+    for name in ambiguous:
+        del url_by_name[name]
+    return _registry(urls, url_by_name, display_by_name, display_by_url)
+
+
+class _ParallelMapping(Mapping):
+    """key -> value over SortedStrings keys and a parallel value getter (None = no value)."""
+
+    def __init__(self, keys: SortedStrings, value_at):
+        self._keys = keys
+        self._value_at = value_at
+        self._len = None
+
+    def __getitem__(self, key):
+        i = self._keys.index(key) if isinstance(key, str) else -1
+        value = self._value_at(i) if i >= 0 else None
+        if value is None:
+            raise KeyError(key)
+        return value
 
-        for row in r:
-            first = (row.get("FIRST") or "").strip()
-            last = (row.get("LAST") or "").strip()
-            full = f"{first} {last}".strip()
+    def __iter__(self):
+        return (k for i, k in enumerate(self._keys) if self._value_at(i) is not None)
 
-            if full:
-                out.add(_normalize_name(full))
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+        return self._len
 
+
+def snapshot_part(registry: RegistrySnapshot):
+    """(arrays, StringTable) of the registry for compile_ufcstats_snapshot."""
+    names = sorted_strings_array(registry.names)
+    urls = sorted_strings_array(registry.urls)
+    url_list = list(SortedStrings(urls))
+    url_pos = {u: i for i, u in enumerate(url_list)}
+    name_list = list(SortedStrings(names))
+    arrays = {
+        # rendezett, fix szélességű byte tömbök: a lookup bináris keresés a mmap-elt fájlon
+        "names": names,
+        "urls": urls,
+        # a names tömbbel párhuzamos, -1 ha nincs egyértelmű URL
+        "name_urls": np.array(
+            [url_pos.get(registry.url_by_name.get(n), -1) for n in name_list], dtype=np.int32
+        ),
+        "name_display": fixed_width_array(registry.display_by_name[n] for n in name_list),
+        # az urls tömbbel párhuzamos, "" ha a sorban nem volt név
+        "url_display": fixed_width_array(registry.display_by_url.get(u, "") for u in url_list),
+        # did-you-mean fa és prefix index a names tömb indexeivel: a workerek helyben keresnek benne
+        **BKTree.build(name_list).to_arrays(),
+        **NameIndex.build(name_list).to_arrays(),
+    }
+    return arrays, StringTable()
+
+
+def _load_registry() -> RegistrySnapshot:
+    part = read_snapshot_part("registry", (FIGHTERS_CSV,))
+    if part is None:
+        return _read_registry()
+
+    names = SortedStrings(part.arrays["names"])
+    urls = SortedStrings(part.arrays["urls"])
+    name_urls = part.arrays["name_urls"]
+    name_display = part.arrays["name_display"]
+    url_display = part.arrays["url_display"]
+
+    def url_at(i):
+        u = int(name_urls[i])
+        return urls[u] if u >= 0 else None
+
+    registry = RegistrySnapshot(
+        names=names,
+        urls=urls,
+        url_by_name=_ParallelMapping(names, url_at),
+        display_by_name=_ParallelMapping(names, lambda i: name_display[i].decode("utf-8")),
+        display_by_url=_ParallelMapping(urls, lambda i: url_display[i].decode("utf-8") or None),
+        version=signature_version(files_signature(_registry_paths())),
+    )
+    # a lefordított fa / index a mmap-en: nem épül újra workerenként
+    registry._memo["bk_tree"] = BKTree(names, part.arrays)
+    registry._memo["name_index"] = NameIndex.from_arrays(names, part.arrays)
+    return registry
+
+
+_registry_cache = DatasetCache(_load_registry, _registry_paths)
+
+
+@snapshot_accessor(_registry_cache)
+def registry_snapshot(registry) -> RegistrySnapshot:
+    """The current registry; read it once per request / batch and reuse it."""
+    return registry
+
+
+def reload_registry() -> RegistrySnapshot:
+    """Re-reads the registry and swaps it in atomically (e.g. after a CSV import)."""
+    return _registry_cache.reload()
+
+
+def known_fighters_set() -> Collection[str]:
+    return registry_snapshot().names
+
+
+def known_fighters_urls() -> Collection[str]:
+    return registry_snapshot().urls
+
+
+def suggest_fighters(query: str, limit: int = 10, registry: RegistrySnapshot | None = None) -> list[dict]:
+    """Type-ahead: [{"name", "url"}] of registry fighters matching ``query`` (name or later-word prefix)."""
+    registry = registry or registry_snapshot()
+    return [
+        {"name": registry.display_by_name[n], "url": registry.url_by_name.get(n)}
+        for n in registry.name_index().search(query, limit)
+    ]
+
+
+def did_you_mean(name: str, limit: int = 3, registry: RegistrySnapshot | None = None) -> list[str]:
+    """Nearest registry names (CSV spelling) to an unknown ``name`` by edit distance."""
+    key = _normalize_name(name)
+    if not key:
+        return []
+    registry = registry or registry_snapshot()
+    # rövid névnél 1, hosszabbnál legfeljebb 3 elütés
+    max_dist = max(1, min(3, len(key) // 4))
+    return [registry.display_by_name[n] for _, n in registry.bk_tree().search(key, max_dist, limit)]
+
+
+def unknown_name_message(name: str, registry: RegistrySnapshot | None = None) -> str:
+    """Validation error for a name missing from the registry, with the nearest known names."""
+    msg = "Fighter name is not present in UFCStats CSV reference."
+    suggestions = did_you_mean(name, registry=registry)
+    if suggestions:
+        msg += f" Did you mean: {', '.join(suggestions)}?"
+    return msg
+
+
+FighterCheck = namedtuple("FighterCheck", "input known name url")
+
+
+def validate_names(names, registry: RegistrySnapshot | None = None) -> list[FighterCheck]:
+    """
+    One FighterCheck per name, against one registry snapshot: canonical
+    (CSV) spelling and URL for known names, None for unknown ones. The URL
+    is None too when several fighters share the name.
+    """
+    registry = registry or registry_snapshot()
+    out = []
+    for raw in names:
+        key = _normalize_name(raw)
+        known = key in registry.names
+        out.append(FighterCheck(
+            raw,
+            known,
+            registry.display_by_name[key] if known else None,
+            registry.url_by_name.get(key),
+        ))
     return out
 
-@lru_cache(maxsize=1)
-def known_fighters_urls() -> set[str]:
 
-    if not FIGHTERS_CSV.exists():
-        return set()
-    
-    out: set[str] = set()
-    
-    with FIGHTERS_CSV.open(newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        if not r.fieldnames:
-            return set()
-        
-        if "URL" not in r.fieldnames:
-            return set()
-        
-        for row in r:
-            url = _normalize_url(row.get("URL") or "")
-            if url:
-                out.add(url)     
-                
-    return out                 
-                                
-    
-    
-def is_known_fighter_name(name: str) -> bool:
-    return _normalize_name(name) in known_fighters_set()
+def validate_urls(urls, registry: RegistrySnapshot | None = None) -> list[FighterCheck]:
+    """Same as validate_names() for ufcstats fighter URLs."""
+    registry = registry or registry_snapshot()
+    out = []
+    for raw in urls:
+        u = _normalize_url(raw)
+        known = bool(u) and u in registry.urls
+        out.append(FighterCheck(raw, known, registry.display_by_url.get(u) if known else None, u if known else None))
+    return out
+
+
+def is_known_fighter_name(name: str, registry: RegistrySnapshot | None = None) -> bool:
+    registry = registry or registry_snapshot()
+    return _normalize_name(name) in registry.names
 
-def is_known_fighter_url(url: str) -> bool:
+def is_known_fighter_url(url: str, registry: RegistrySnapshot | None = None) -> bool:
     u = _normalize_url(url)
     if not u:
         return False
-    return u in known_fighters_urls()
+    registry = registry or registry_snapshot()
+    return u in registry.urls
 
-def is_known_fighter(name: str, url: str | None = None) -> bool:
+def is_known_fighter(name: str, url: str | None = None, registry: RegistrySnapshot | None = None) -> bool:
     if url:
-        return is_known_fighter_url(url)
-    return is_known_fighter_name(name)
+        return is_known_fighter_url(url, registry)
+    return is_known_fighter_name(name, registry)
 
 
 def clear_cache():
-    known_fighters_set.cache_clear()
-    known_fighters_urls.cache_clear()
-    
+    _registry_cache.cache_clear()
+
+
+# régi lru_cache API: known_fighter_names.cache_clear()
+known_fighters_set.cache_clear = clear_cache
+known_fighters_urls.cache_clear = clear_cache
+
 known_fighter_names = known_fighters_set
     
@@ -0,0 +1,86 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from fighters.models import Division, Fighter
+
+
+class FighterApiTests(TestCase):
+    def setUp(self):
+        self.division = Division.objects.create(name="Light Heavyweight", min_weight=186, max_weight=205)
+        self.fighters = [
+            Fighter.objects.create(
+                division=self.division, name=f"Fighter {i}", age=30, weight=205, height=193,
+                wins=i, description="x" * 500, bio_long="y" * 5000,
+            )
+            for i in range(5)
+        ]
+        self.client = APIClient()
+
+    def test_list_is_compact_and_cursor_paginated(self):
+        res = self.client.get("/api/fighters/", {"page_size": 2})
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+
+        self.assertEqual([f["name"] for f in body["results"]], ["Fighter 0", "Fighter 1"])
+        self.assertEqual(
+            set(body["results"][0]),
+            {"id", "name", "nickname", "division", "wins", "losses", "draw", "upload_image"},
+        )
+        self.assertEqual(body["results"][0]["division"], {"id": self.division.id, "name": "Light Heavyweight"})
+        self.assertIsNone(body["previous"])
+
+        names = [f["name"] for f in body["results"]]
+        next_url = body["next"]
+        while next_url:
+            body = self.client.get(next_url).json()
+            names += [f["name"] for f in body["results"]]
+            next_url = body["next"]
+        self.assertEqual(names, [f"Fighter {i}" for i in range(5)])
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        other = Division.objects.create(name="Heavyweight", min_weight=206, max_weight=265)
+        for i in range(20):
+            Fighter.objects.create(division=other, name=f"Heavy {i}", age=30, weight=250, height=195)
+
+        for params in ({"page_size": 2}, {"page_size": 25}, {"page_size": 25, "expand": "division"}):
+            with self.subTest(**params), self.assertNumQueries(1):
+                res = self.client.get("/api/fighters/", params)
+            self.assertEqual(len(res.json()["results"]), params["page_size"])
+
+        for heavies in (20, 21):
+            with self.subTest(heavies=heavies), self.assertNumQueries(2):
+                res = self.client.get("/api/divisions/", {"expand": "fighters"})
+            self.assertEqual(sorted(len(d["fighters"]) for d in res.json()), [5, heavies])
+            Fighter.objects.create(division=other, name="Heavy extra", age=30, weight=250, height=195)
+
+    def test_sparse_fieldsets_narrow_payload_and_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get("/api/fighters/", {"fields": "id,name"})
+        self.assertEqual(res.json()["results"][0], {"id": self.fighters[0].id, "name": "Fighter 0"})
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertNotIn("bio_long", sql)
+        self.assertNotIn("fighters_division", sql)
+
+        res = self.client.get("/api/fighters/", {"fields": "name,division", "expand": "division"})
+        self.assertEqual(res.json()["results"][0]["division"]["max_weight"], "205.00")
+
+        with self.assertNumQueries(1):
+            res = self.client.get(f"/api/fighters/{self.fighters[1].id}/", {"fields": "name,wins,division"})
+        self.assertEqual(set(res.json()), {"name", "wins", "division"})
+
+        res = self.client.get("/api/divisions/", {"fields": "name"})
+        self.assertEqual(res.json(), [{"name": "Light Heavyweight"}])
+
+    def test_unknown_sparse_fields_are_rejected(self):
+        self.assertEqual(self.client.get("/api/fighters/", {"fields": "name,password"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/fighters/", {"expand": "events"}).status_code, 400)
+
+    def test_retrieve_returns_full_profile(self):
+        res = self.client.get(f"/api/fighters/{self.fighters[0].id}/")
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+        self.assertEqual(len(body["bio_long"]), 5000)
+        self.assertEqual(body["division"]["min_weight"], "186.00")
@@ -0,0 +1,107 @@
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from fighters.models import Division, Fighter
+
+COMMAND = "fighters.management.commands.import_ufc_fighters"
+
+
+class ImportUfcFightersTests(TestCase):
+    def setUp(self):
+        division = Division.objects.create(name="Lightweight", min_weight="66.00", max_weight="70.00")
+        base = {"division": division, "age": 30, "weight": "70.00", "height": "180.00"}
+        self.jon = Fighter.objects.create(name="Jon Jones", **base)
+        self.tom = Fighter.objects.create(name="Tom Aaron", **{**base, "weight": "70.31", "height": "180.34"})
+        self.ghost = Fighter.objects.create(name="Ghost Fighter", **base)
+
+        self._tmp = TemporaryDirectory()
+        td = Path(self._tmp.name)
+        self.tott_csv = td / "ufc_fighter_tott.csv"
+        self.details_csv = td / "ufc_fighter_details.csv"
+        self.diff_path = td / "diff.json"
+
+        self.tott_csv.write_text(
+            "FIGHTER,HEIGHT,WEIGHT,REACH,STANCE,DOB,URL\n"
+            "Jon Jones,\"6' 4\"\"\",205 lbs.,\"84\"\"\",Orthodox,,http://ufcstats.com/fighter-details/jj\n"
+            "Tom Aaron,\"5' 11\"\"\",155 lbs.,--,,,http://ufcstats.com/fighter-details/ta\n",
+            encoding="utf-8",
+        )
+        self.details_csv.write_text(
+            "FIRST,LAST,NICKNAME,URL\n"
+            "Jon,Jones,Bones,http://ufcstats.com/fighter-details/jj\n"
+            "Tom,Aaron,,http://ufcstats.com/fighter-details/ta\n",
+            encoding="utf-8",
+        )
+        self._patches = [
+            patch(f"{COMMAND}.CSV_TOTT", self.tott_csv),
+            patch(f"{COMMAND}.CSV_DETAILS", self.details_csv),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("import_ufc_fighters", *args, stdout=out)
+        return out.getvalue()
+
+    def test_apply_uses_bulk_update_and_writes_diff_file(self):
+        # row hash SELECT + identity SELECT + savepoint + 1 SELECT (iterator) + 1 UPDATE
+        # + row hash INSERT + release, a változott sorok számától függetlenül
+        with self.assertNumQueries(7):
+            out = self._run("--apply", "--diff-file", str(self.diff_path))
+
+        self.assertIn("updated=1 | unchanged=1 | missing=1", out)
+        self.assertNotIn("Jon Jones ->", out)
+
+        self.jon.refresh_from_db()
+        self.assertEqual((float(self.jon.height), float(self.jon.weight)), (193.04, 92.99))
+        self.assertEqual((self.jon.reach, self.jon.nickname), (213, "Bones"))
+
+        diff = json.loads(self.diff_path.read_text(encoding="utf-8"))
+        self.assertTrue(diff["apply"])
+        self.assertEqual(diff["updated"], [{
+            "id": self.jon.id,
+            "name": "Jon Jones",
+            "changes": {"height": 193.04, "weight": 92.99, "reach": 213, "nickname": "Bones"},
+        }])
+        self.assertEqual(diff["missing"], [{"id": self.ghost.id, "name": "Ghost Fighter"}])
+
+    def test_chunks_are_read_before_they_are_written(self):
+        # chunkonként egy SELECT, az UPDATE csak a beolvasott chunk után jön
+        with patch(f"{COMMAND}.Fighter.objects.bulk_update") as bulk_update:
+            out = self._run("--apply", "--chunk-size", "1")
+
+        self.assertIn("updated=1 | unchanged=1 | missing=1", out)
+        self.assertEqual(bulk_update.call_count, 1)
+        self.assertEqual([f.name for f in bulk_update.call_args.args[0]], ["Jon Jones"])
+        self.assertFalse(self.diff_path.exists())
+
+    def test_dry_run_does_not_write(self):
+        out = self._run("--verbose-rows")
+        self.assertIn("[DRY] Jon Jones ->", out)
+        self.assertIn("[MISS] Ghost Fighter", out)
+
+        self.jon.refresh_from_db()
+        self.assertEqual(self.jon.nickname, "")
+
+    def test_unchanged_csv_rows_are_skipped_until_full_run(self):
+        self._run("--apply")
+        Fighter.objects.filter(pk=self.jon.pk).update(nickname="")
+
+        out = self._run("--apply")
+        self.assertIn("updated=0 | unchanged=2 | missing=1", out)
+
+        out = self._run("--apply", "--full")
+        self.assertIn("updated=1 | unchanged=1 | missing=1", out)
+        self.jon.refresh_from_db()
+        self.assertEqual(self.jon.nickname, "Bones")
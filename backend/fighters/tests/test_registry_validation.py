@@ -0,0 +1,123 @@
+import json
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from fighters.models import Division, Fighter
+from fighters.services import ufcstats_registry
+from fighters.api.serializers import FighterSerializer
+from fighters.services.ufcstats_registry import BKTree, did_you_mean, edit_distance, validate_names, validate_urls
+
+
+class RegistryValidationTests(TestCase):
+    def setUp(self):
+        self.td = TemporaryDirectory()
+        self.addCleanup(self.td.cleanup)
+        csv_path = Path(self.td.name) / "ufc_fighter_details.csv"
+        csv_path.write_text(
+            "FIRST,LAST,NICKNAME,URL\n"
+            "Jon,Jones,Bones,http://ufcstats.com/fighter-details/jj\n"
+            "José,Aldo,,http://ufcstats.com/fighter-details/ja\n"
+            "Bruno,Silva,,http://ufcstats.com/fighter-details/bs1\n"
+            "Bruno,Silva,,http://ufcstats.com/fighter-details/bs2\n",
+            encoding="utf-8",
+        )
+        for p in (
+            patch("fighters.services.ufcstats_registry.FIGHTERS_CSV", csv_path),
+            patch("fighters.services.ufcstats_registry.read_snapshot_part", return_value=None),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(ufcstats_registry.clear_cache)
+        ufcstats_registry.clear_cache()
+
+    def test_batch_results_carry_canonical_name_and_url(self):
+        jones, aldo, silva, nobody = validate_names(["jon  jones", "Jose Aldo", "Bruno Silva", "Nobody"])
+        self.assertEqual(jones, ("jon  jones", True, "Jon Jones", "http://ufcstats.com/fighter-details/jj"))
+        self.assertEqual(aldo.name, "José Aldo")
+        # két azonos nevű fighter: ismert név, de nincs egyértelmű URL
+        self.assertEqual((silva.known, silva.url), (True, None))
+        self.assertEqual(nobody, ("Nobody", False, None, None))
+
+        by_url = validate_urls(["http://ufcstats.com/fighter-details/JA/", "http://x/none", ""])
+        self.assertEqual([c.known for c in by_url], [True, False, False])
+        self.assertEqual(by_url[0].name, "José Aldo")
+
+        # az azonos nevű fightereknél az ismert URL is visszaadja a nevet
+        bs1, bs2 = validate_urls(["http://ufcstats.com/fighter-details/bs1", "http://ufcstats.com/fighter-details/bs2"])
+        self.assertEqual((bs1.known, bs1.name), (True, "Bruno Silva"))
+        self.assertEqual((bs2.url, bs2.name), ("http://ufcstats.com/fighter-details/bs2", "Bruno Silva"))
+
+    def test_many_serializer_validates_names_in_one_batch(self):
+        division = Division.objects.create(name="LHW", min_weight=186, max_weight=205)
+        data = [
+            {"name": name, "division_id": division.id, "age": 30, "weight": 205, "height": 193}
+            for name in ("Jon Jones", "Jon Jnoes", "Bruno  Silva")
+        ]
+        with patch("fighters.api.serializers.validate_names", wraps=validate_names) as batch:
+            serializer = FighterSerializer(data=data, many=True)
+            self.assertFalse(serializer.is_valid())
+        batch.assert_called_once()
+        self.assertEqual(batch.call_args.args[0], ["Jon Jones", "Jon Jnoes", "Bruno Silva"])
+        self.assertEqual(serializer.errors[0], {})
+        self.assertIn("Did you mean: Jon Jones?", str(serializer.errors[1]["name"][0]))
+        self.assertEqual(serializer.errors[2], {})
+
+    def test_validate_endpoint_is_staff_only(self):
+        client = APIClient()
+        payload = {"names": ["Jon Jones", "Nobody"], "urls": ["http://ufcstats.com/fighter-details/jj"]}
+        self.assertEqual(client.post("/api/fighters/validate/", payload, format="json").status_code, 401)
+
+        admin = get_user_model().objects.create_user("admin", password="pw", is_staff=True)
+        client.force_authenticate(admin)
+        res = client.post("/api/fighters/validate/", payload, format="json")
+        self.assertEqual(res.status_code, 200)
+        body = res.json()
+        self.assertEqual([c["known"] for c in body["names"]], [True, False])
+        self.assertEqual(body["urls"][0]["name"], "Jon Jones")
+
+        res = client.post("/api/fighters/validate/", {"names": "Jon Jones"}, format="json")
+        self.assertEqual(res.status_code, 400)
+
+    def test_check_command_streams_json_report_in_chunks(self):
+        division = Division.objects.create(name="LHW", min_weight=186, max_weight=205)
+        for name in ("Jon Jones", "José Aldo", "Nobody", "Somebody Else"):
+            Fighter.objects.create(division=division, name=name, age=30, weight=200, height=190)
+
+        report = Path(self.td.name) / "report.json"
+        out = StringIO()
+        with self.assertRaises(SystemExit):
+            call_command("check_fighter_registry", "--chunk-size=3", f"--report={report}", stdout=out)
+
+        data = json.loads(report.read_text(encoding="utf-8"))
+        self.assertEqual(data["checked"], 4)
+        self.assertEqual(data["unknown_count"], 2)
+        self.assertEqual([r["name"] for r in data["unknown"]], ["Nobody", "Somebody Else"])
+        self.assertIn("FAIL: 2 fighter(s)", out.getvalue())
+
+        Fighter.objects.filter(name__in=["Nobody", "Somebody Else"]).delete()
+        out = StringIO()
+        call_command("check_fighter_registry", stdout=out)
+        self.assertIn("OK: All 2 fighters", out.getvalue())
+
+    def test_did_you_mean_in_validation_errors(self):
+        self.assertEqual(edit_distance("jon jones", "jon jnoes"), 2)
+        self.assertEqual(edit_distance("", "abc"), 3)
+        self.assertEqual(BKTree.build(["jon jones", "jose aldo"]).search("jose ald", max_dist=1), [(1, "jose aldo")])
+
+        self.assertEqual(did_you_mean("Jose Ald"), ["José Aldo"])
+        self.assertEqual(did_you_mean("Jon Jnoes"), ["Jon Jones"])
+        self.assertEqual(did_you_mean("Completely Different"), [])
+
+        division = Division.objects.create(name="LHW", min_weight=186, max_weight=205)
+        serializer = FighterSerializer(data={
+            "name": "Jon Jnoes", "division_id": division.id, "age": 30, "weight": 205, "height": 193,
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("Did you mean: Jon Jones?", str(serializer.errors["name"][0]))
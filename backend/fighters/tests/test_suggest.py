@@ -0,0 +1,56 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from fighters.services import ufcstats_registry
+
+
+class FighterSuggestTests(TestCase):
+    def setUp(self):
+        self.td = TemporaryDirectory()
+        csv_path = Path(self.td.name) / "ufc_fighter_details.csv"
+        csv_path.write_text(
+            "FIRST,LAST,NICKNAME,URL\n"
+            "Jon,Jones,Bones,http://ufcstats.com/fighter-details/jj\n"
+            "Jonathan,Martinez,,http://ufcstats.com/fighter-details/jm\n"
+            "José,Aldo,,http://ufcstats.com/fighter-details/ja\n"
+            "Junior,Dos Santos,,http://ufcstats.com/fighter-details/jds\n"
+            "Chris,Jonson,,http://ufcstats.com/fighter-details/cj\n",
+            encoding="utf-8",
+        )
+        patches = (
+            patch("fighters.services.ufcstats_registry.FIGHTERS_CSV", csv_path),
+            patch("fighters.services.ufcstats_registry.read_snapshot_part", return_value=None),
+        )
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.td.cleanup)
+        self.addCleanup(ufcstats_registry.clear_cache)
+        ufcstats_registry.clear_cache()
+        self.client = APIClient()
+
+    def _names(self, q, **params):
+        res = self.client.get("/api/fighters/suggest/", {"q": q, **params})
+        self.assertEqual(res.status_code, 200)
+        return [r["name"] for r in res.json()["results"]]
+
+    def test_full_name_prefix_before_last_name_prefix(self):
+        self.assertEqual(self._names("jon"), ["Jon Jones", "Jonathan Martinez", "Chris Jonson"])
+        self.assertEqual(self._names("JON", limit=2), ["Jon Jones", "Jonathan Martinez"])
+
+    def test_accent_insensitive_and_multi_word_last_names(self):
+        res = self.client.get("/api/fighters/suggest/", {"q": "jose"})
+        self.assertEqual(res.json()["results"], [{"name": "José Aldo", "url": "http://ufcstats.com/fighter-details/ja"}])
+        self.assertEqual(self._names("aldo"), ["José Aldo"])
+        self.assertEqual(self._names("santos"), ["Junior Dos Santos"])
+        self.assertEqual(self._names("dos s"), ["Junior Dos Santos"])
+
+    def test_empty_and_invalid_queries(self):
+        self.assertEqual(self._names(""), [])
+        self.assertEqual(self._names("zzz"), [])
+        res = self.client.get("/api/fighters/suggest/", {"q": "jon", "limit": "x"})
+        self.assertEqual(res.status_code, 400)
@@ -15,6 +15,7 @@ from ufcstats.api.ufc_radar import (
     _parse_time_mmss,
     _pct,
     _per15,
+    _radar_engine,
     ufc_radar,
 )
 
@@ -52,6 +53,7 @@ class RadarCsvIntegrationTests(SimpleTestCase):
         # Clear caches before each test, otherwise lru_cache keeps old file content
         _event_dates_map.cache_clear()
         _fight_results_map.cache_clear()
+        _radar_engine.cache_clear()
 
     def _write(self, path: Path, content: str):
         path.write_text(content, encoding="utf-8")
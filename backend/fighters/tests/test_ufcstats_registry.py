@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.test import SimpleTestCase
 
+from fighters.services import ufcstats_registry
 from fighters.services.ufcstats_registry import known_fighter_names, is_known_fighter
 
 
@@ -26,3 +27,52 @@ class UfcStatsRegistryTests(SimpleTestCase):
                 self.assertTrue(is_known_fighter("Jon Jones"))
                 self.assertTrue(is_known_fighter("  jon   jones  "))
                 self.assertFalse(is_known_fighter("Jon Jons"))
+
+    def test_snapshot_reads_names_and_urls_in_one_pass(self):
+        with TemporaryDirectory() as td:
+            csv_path = Path(td) / "ufc_fighter_details.csv"
+            csv_path.write_text(
+                "FIRST,LAST,NICKNAME,URL\n"
+                "Jon,Jones,,http://ufcstats.com/fighter-details/x/\n"
+                "Bruno,Silva,,http://ufcstats.com/fighter-details/b1\n"
+                "Bruno,Silva,,http://ufcstats.com/fighter-details/b2\n",
+                encoding="utf-8",
+            )
+
+            with patch("fighters.services.ufcstats_registry.FIGHTERS_CSV", csv_path), patch(
+                "fighters.services.ufcstats_registry.read_snapshot_part", return_value=None
+            ), patch.object(Path, "open", autospec=True, side_effect=Path.open) as opened:
+                ufcstats_registry.clear_cache()
+                registry = ufcstats_registry.registry_snapshot()
+
+                self.assertEqual(opened.call_count, 1)
+                self.assertEqual(registry.names, frozenset({"jon jones", "bruno silva"}))
+                self.assertIn("http://ufcstats.com/fighter-details/b2", registry.urls)
+                self.assertEqual(registry.url_by_name, {"jon jones": "http://ufcstats.com/fighter-details/x"})
+                self.assertIs(ufcstats_registry.known_fighters_urls(), registry.urls)
+
+                # újratöltés: új objektum, a régi változatlan marad
+                csv_path.write_text("FIRST,LAST,NICKNAME,URL\nAlex,Pereira,,http://u/ap\n", encoding="utf-8")
+                reloaded = ufcstats_registry.reload_registry()
+                self.assertIs(ufcstats_registry.registry_snapshot(), reloaded)
+                self.assertTrue(ufcstats_registry.is_known_fighter("Alex Pereira"))
+                self.assertIn("jon jones", registry.names)
+                self.assertNotEqual(reloaded.version, registry.version)
+            ufcstats_registry.clear_cache()
+
+    def test_bk_tree_finds_single_typos_across_the_full_registry(self):
+        names = sorted(ufcstats_registry._read_registry().names)
+        self.assertGreater(len(names), 4000)
+        tree = ufcstats_registry.BKTree.build(names)
+
+        self.assertEqual(tree.search("aisling dalx", 3), [(1, "aisling daly")])
+        self.assertEqual(tree.search("blood diamonx", 3)[0], (1, "blood diamond"))
+
+        # minden ~45. név utolsó betűje elütve: az eredeti névnek a találatok között kell lennie
+        for name in names[::45]:
+            typo = name[:-1] + ("x" if name[-1] != "x" else "y")
+            max_dist = max(1, min(3, len(typo) // 4))
+            with self.subTest(typo=typo):
+                # bő időkeret: itt a keresés teljessége a kérdés, nem a sebessége
+                hits = tree.search(typo, max_dist, limit=3, time_budget=5)
+                self.assertIn(name, [w for _, w in hits])
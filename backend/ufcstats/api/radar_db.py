@@ -0,0 +1,164 @@
+from collections import defaultdict
+from datetime import date
+
+from django.db.models import F, Sum, Window
+from django.db.models.functions import DenseRank
+
+from ufcstats.models import FighterCareerSummary, FighterIdentity, UFCFightStats
+from ufcstats.services.career_summary import SUMMARY_WINDOWS, TOTAL_FIELDS
+from ufcstats.services.identity import normalize_name
+
+from .ufc_radar import Agg, _fight_duration_seconds
+
+
+def _stored_spellings(names):
+    """
+    requested name -> fighter_name spellings to look for: the name itself,
+    plus, through the identity table, every display_name of the same
+    ufcstats URL ("Jonathan Jones" -> "Jon Jones"). One query.
+    An ambiguous alias (several URLs) only matches its own spellings.
+    """
+    aliases = {normalize_name(n) for n in names} - {""}
+    identities = FighterIdentity.objects.filter(
+        url__in=FighterIdentity.objects.filter(alias__in=aliases).values("url")
+    ).values_list("alias", "url", "display_name")
+
+    urls_by_alias = defaultdict(set)
+    spellings_by_alias = defaultdict(set)
+    spellings_by_url = defaultdict(set)
+    for alias, url, display in identities:
+        urls_by_alias[alias].add(url)
+        spellings_by_alias[alias].add(display)
+        spellings_by_url[url].add(display)
+
+    out = {}
+    for n in names:
+        alias = normalize_name(n)
+        if not alias:
+            continue
+        spellings = {" ".join(n.split())} | spellings_by_alias[alias]
+        urls = urls_by_alias[alias]
+        if len(urls) == 1:
+            spellings |= spellings_by_url[next(iter(urls))]
+        out[n] = spellings
+    return out
+
+
+def _owners(spellings):
+    """normalized stored spelling -> requested names it belongs to."""
+    owners = defaultdict(list)
+    for name, variants in spellings.items():
+        for v in {normalize_name(v) for v in variants}:
+            owners[v].append(name)
+    return owners
+
+
+def last_bouts_queryset(names, last_n: int):
+    """
+    One row per (fighter_name, fight) for the last N fights of each stored
+    spelling in ``names``, with the per-round stats summed.
+
+    The inner query ranks the round rows per fighter with DenseRank (all
+    rounds of a fight share a rank), so the last-N fight set and the sums
+    come back from a single statement; fighter_name is indexed.
+    """
+    last_rounds = (
+        UFCFightStats.objects
+        .filter(fighter_name__in=list(names))
+        .annotate(
+            fight_rank=Window(
+                DenseRank(),
+                partition_by=[F("fighter_name")],
+                order_by=[F("fight__event__date").desc(), F("fight__event__name").desc(), F("fight_id").desc()],
+            )
+        )
+        .filter(fight_rank__lte=max(0, int(last_n)))
+        .values("id")
+    )
+
+    return (
+        UFCFightStats.objects
+        .filter(id__in=last_rounds)
+        .values("fighter_name", "fight_id", "fight__event__date", "fight__event__name", "fight__round", "fight__time")
+        .annotate(
+            sig_landed=Sum("sig_str_landed"),
+            sig_att=Sum("sig_str_att"),
+            td_landed=Sum("td_landed"),
+            td_att=Sum("td_att"),
+            kd_sum=Sum("kd"),
+            sub_att_sum=Sum("sub_att"),
+            ctrl_sec=Sum("ctrl_seconds"),
+        )
+        .order_by()
+    )
+
+
+def _from_summaries(spellings, last_n: int, out):
+    """
+    Fills ``out`` from FighterCareerSummary rows; returns the names not
+    found there. A name stored under several spellings has one summary per
+    spelling, which cannot be merged into one last-N window, so it is left
+    to the raw query.
+    """
+    owners = _owners(spellings)
+    found = defaultdict(list)
+    rows = FighterCareerSummary.objects.filter(
+        fighter_name__in={v for variants in spellings.values() for v in variants}, window=last_n
+    ).values_list("fighter_name", "fights", *TOTAL_FIELDS)
+    for db_name, fights, *totals in rows:
+        for name in owners.get(normalize_name(db_name), ()):
+            found[name].append(Agg(fights, *totals))
+
+    for name, aggs in found.items():
+        if len(aggs) == 1:
+            out[name] = aggs[0]
+    return {n: v for n, v in spellings.items() if out[n] is None}
+
+
+def aggregate_for_fighters(names, last_n: int):
+    """
+    fighter name -> Agg (or None) for the given names: one identity query,
+    then one stats query.
+
+    For the materialized windows (last 3 / 5 / 10) the per-fighter summary
+    rows are read; fighters without one fall back to the raw stats query.
+    """
+    out = {n: None for n in names}
+    if last_n <= 0:
+        return out
+    spellings = _stored_spellings(names)
+    if not spellings:
+        return out
+
+    if last_n in SUMMARY_WINDOWS:
+        spellings = _from_summaries(spellings, last_n, out)
+        if not spellings:
+            return out
+
+    # fighter -> meccsek; több írásmód esetén itt választjuk ki az összesített utolsó N-t
+    owners = _owners(spellings)
+    bouts = defaultdict(dict)
+    stored = {v for variants in spellings.values() for v in variants}
+    for row in last_bouts_queryset(stored, last_n):
+        for name in owners.get(normalize_name(row["fighter_name"]), ()):
+            bouts[name].setdefault(row["fight_id"], row)
+
+    for name, rows in bouts.items():
+        newest = sorted(
+            rows.values(),
+            key=lambda r: (r["fight__event__date"] or date.min, r["fight__event__name"], r["fight_id"]),
+            reverse=True,
+        )[:last_n]
+        agg = out[name] = Agg()
+        for row in newest:
+            agg.fights += 1
+            agg.sig_landed += row["sig_landed"] or 0
+            agg.sig_att += row["sig_att"] or 0
+            agg.td_landed += row["td_landed"] or 0
+            agg.td_att += row["td_att"] or 0
+            agg.kd += row["kd_sum"] or 0
+            agg.sub_att += row["sub_att_sum"] or 0
+            agg.ctrl_sec += row["ctrl_sec"] or 0
+            agg.dur_sec += _fight_duration_seconds(row["fight__round"] or 0, row["fight__time"] or "")
+
+    return out
@@ -0,0 +1,242 @@
+import numpy as np
+
+
+# Oszlopok sorrendje a tömbökben (= Agg mezők, fights nélkül)
+COLUMNS = (
+    "sig_landed",
+    "sig_att",
+    "td_landed",
+    "td_att",
+    "kd",
+    "sub_att",
+    "ctrl_sec",
+    "dur_sec",
+)
+_COL = {name: i for i, name in enumerate(COLUMNS)}
+
+# Menetenkénti bontás: 1..MAX_ROUNDS, oszlopok: COLUMNS + "fights" (volt-e adat abban a menetben)
+MAX_ROUNDS = 5
+ROUND_COLUMNS = COLUMNS + ("fights",)
+
+# bouts tömb oszlopai: event és bout id a strings táblában, dátum ordinal (0 = ismeretlen)
+_EVENT, _BOUT, _DATE = 0, 1, 2
+
+
+class RadarEngine:
+    """
+    Columnar radar aggregates for every fighter.
+
+    Bouts are stored fighter by fighter, newest first, so a fighter's last N
+    bouts are always a contiguous block starting at ``starts[i]``. With a
+    cumulative sum over that layout any (fighter, last_n) total is a single
+    prefix-sum difference, and all fighters can be summed in one call.
+
+    Strings (names, events, bouts) live in ``strings``; the arrays only hold
+    ids into it, so the whole engine can be written to / mapped from a
+    binary snapshot.
+    """
+
+    def __init__(self, strings, name_ids, display_ids, starts, counts, cum, bouts, round_cum):
+        self.strings = strings
+        self.names = [strings[i] for i in name_ids]
+        self.display_names = [strings[i] for i in display_ids]
+        self.starts = starts
+        self.counts = counts
+        self.cum = cum
+        self.bouts = bouts
+        self.round_cum = round_cum
+        self.pos = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_index(cls, index):
+        """index: normalized name -> list[BoutStats], newest first."""
+        strings, ids = [], {}
+
+        def intern(s):
+            i = ids.get(s)
+            if i is None:
+                i = ids[s] = len(strings)
+                strings.append(s)
+            return i
+
+        names = sorted(index)
+        counts = np.fromiter((len(index[n]) for n in names), dtype=np.int64, count=len(names))
+        starts = np.zeros(len(names), dtype=np.int64)
+        if len(names):
+            np.cumsum(counts[:-1], out=starts[1:])
+
+        all_bouts = [b for n in names for b in index[n]]
+        values = np.array(
+            [[getattr(b, c) for c in COLUMNS] for b in all_bouts],
+            dtype=np.int64,
+        ).reshape(-1, len(COLUMNS))
+        cum = np.zeros((values.shape[0] + 1, len(COLUMNS)), dtype=np.int64)
+        np.cumsum(values, axis=0, out=cum[1:])
+
+        round_values = np.zeros((len(all_bouts), MAX_ROUNDS, len(ROUND_COLUMNS)), dtype=np.int64)
+        for row, b in enumerate(all_bouts):
+            for rnd, *vals in b.rounds:
+                if 1 <= rnd <= MAX_ROUNDS:
+                    round_values[row, rnd - 1, :-1] = vals
+                    round_values[row, rnd - 1, -1] = 1
+        round_cum = np.zeros((len(all_bouts) + 1, MAX_ROUNDS, len(ROUND_COLUMNS)), dtype=np.int64)
+        np.cumsum(round_values, axis=0, out=round_cum[1:])
+
+        bouts = np.array(
+            [[intern(b.event), intern(b.bout), b.date.toordinal() if b.date else 0] for b in all_bouts],
+            dtype=np.int32,
+        ).reshape(-1, 3)
+
+        name_ids = [intern(n) for n in names]
+        display_ids = [intern(index[n][0].fighter if index[n] else n) for n in names]
+        return cls(strings, name_ids, display_ids, starts, counts, cum, bouts, round_cum)
+
+    def to_arrays(self, intern):
+        """Arrays for a snapshot; string ids are remapped through ``intern``."""
+        remap = np.array([intern(s) for s in self.strings], dtype=np.int32)
+        bouts = self.bouts.copy()
+        if len(remap):
+            bouts[:, _EVENT] = remap[bouts[:, _EVENT]]
+            bouts[:, _BOUT] = remap[bouts[:, _BOUT]]
+        return {
+            "names": np.array([intern(n) for n in self.names], dtype=np.int32),
+            "display": np.array([intern(n) for n in self.display_names], dtype=np.int32),
+            "starts": self.starts,
+            "counts": self.counts,
+            "cum": self.cum,
+            "bouts": bouts,
+            "round_cum": self.round_cum,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays, strings):
+        return cls(
+            strings, arrays["names"], arrays["display"],
+            arrays["starts"], arrays["counts"], arrays["cum"], arrays["bouts"],
+            arrays["round_cum"],
+        )
+
+    def _block(self, name: str, last_n: int):
+        i = self.pos.get(name)
+        if i is None:
+            return None, 0
+        return int(self.starts[i]), min(int(self.counts[i]), max(0, int(last_n)))
+
+    def totals(self, name: str, last_n: int):
+        """(fights, column sums) for one fighter, or None if unknown."""
+        start, take = self._block(name, last_n)
+        if take == 0:
+            return None
+        return take, self.cum[start + take] - self.cum[start]
+
+    def round_totals(self, name: str, last_n: int):
+        """
+        (fights, (MAX_ROUNDS, ROUND_COLUMNS) sums) over the fighter's last N
+        bouts, or None. Same prefix-sum difference as ``totals``, per round.
+        """
+        start, take = self._block(name, last_n)
+        if take == 0:
+            return None
+        return take, self.round_cum[start + take] - self.round_cum[start]
+
+    def date_block(self, name: str, since: int = 0, until: int = 0):
+        """
+        (lo, hi) row range of the fighter's bouts with since <= date <= until
+        (date ordinals, 0 = open end). Rows are newest first, so the range is
+        two binary searches over the fighter's block. Bouts of unknown date
+        only match when neither bound is set.
+        """
+        i = self.pos.get(name)
+        if i is None:
+            return 0, 0
+        start = int(self.starts[i])
+        end = start + int(self.counts[i])
+
+        neg_dates = -self.bouts[start:end, _DATE].astype(np.int64)  # növekvő sorrend
+        lo = start + int(np.searchsorted(neg_dates, -until, side="left")) if until else start
+        if not (since or until):
+            return lo, end
+        # az ismeretlen dátumú (0) sorok a blokk végén vannak: bármely dátumszűrő kizárja őket
+        hi = start + int(np.searchsorted(neg_dates, -max(since, 1), side="right"))
+        return lo, max(lo, hi)
+
+    def row_values(self, lo: int, hi: int):
+        """Per-bout column values of rows [lo, hi)."""
+        return self.cum[lo + 1:hi + 1] - self.cum[lo:hi]
+
+    def bout_keys(self, name: str, last_n: int):
+        """[(event, bout), ...] of the fighter's last N bouts, newest first."""
+        start, take = self._block(name, last_n)
+        rows = self.bouts[start:start + take]
+        return [(self.strings[ev], self.strings[bout]) for ev, bout, _ in rows.tolist()]
+
+    def totals_all(self, last_n: int):
+        """(fights per fighter, column sums per fighter) in ``names`` order."""
+        take = np.minimum(self.counts, max(0, int(last_n)))
+        sums = self.cum[self.starts + take] - self.cum[self.starts]
+        return take, sums
+
+    def metrics_all(self, last_n: int):
+        """Radar metrics for all fighters as arrays (same formulas as the view)."""
+        take, sums = self.totals_all(last_n)
+        return {
+            "fights_count": take,
+            "duration_total_sec": sums[:, _COL["dur_sec"]],
+            **_metrics(sums.astype(np.float64)),
+        }
+
+    def metrics_row(self, name: str, last_n: int):
+        """Unrounded metrics of one fighter (for percentile lookups), or None."""
+        start, take = self._block(name, last_n)
+        if take == 0:
+            return None
+        sums = (self.cum[start + take] - self.cum[start]).astype(np.float64)[None, :]
+        return {m: float(v[0]) for m, v in _metrics(sums).items()}
+
+    def distributions(self, group_of, last_n: int):
+        """
+        group -> {metric: sorted values} over every fighter with a group.
+
+        ``group_of`` lists a group key (or "") per fighter in ``names`` order.
+        """
+        take, sums = self.totals_all(last_n)
+        metrics = _metrics(sums.astype(np.float64))
+        groups = np.array(group_of, dtype=object)
+
+        out = {}
+        for g in set(group_of):
+            if not g:
+                continue
+            mask = (groups == g) & (take > 0)
+            if mask.any():
+                out[g] = {m: np.sort(v[mask]) for m, v in metrics.items()}
+        return out
+
+
+def percentile_rank(sorted_values, value: float) -> float:
+    """Share of the distribution below ``value`` (ties count half), 0-100."""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    below = np.searchsorted(sorted_values, value, side="left")
+    not_above = np.searchsorted(sorted_values, value, side="right")
+    return float((below + not_above) / 2.0 / n * 100.0)
+
+
+def _metrics(sums):
+    """Radar metric formulas over a (fighters, COLUMNS) float array."""
+    col = lambda c: sums[:, _COL[c]]
+    dur_min = col("dur_sec") / 60.0
+    return {
+        "sig_str_acc_pct": _ratio(col("sig_landed"), col("sig_att")) * 100.0,
+        "td_acc_pct": _ratio(col("td_landed"), col("td_att")) * 100.0,
+        "kd_per15": _ratio(col("kd"), dur_min) * 15.0,
+        "sub_att_per15": _ratio(col("sub_att"), dur_min) * 15.0,
+        "ctrl_sec_per15": _ratio(col("ctrl_sec"), dur_min) * 15.0,
+    }
+
+
+def _ratio(num, den):
+    out = np.zeros_like(num)
+    np.divide(num, den, out=out, where=den > 0)
+    return out
@@ -1,13 +1,22 @@
 import csv
-from dataclasses import dataclass
-from functools import lru_cache
+import hashlib
+from dataclasses import dataclass, field
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 
+import numpy as np
 from django.conf import settings
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 
+from ufcstats.services.dataset_cache import DatasetCache, snapshot_accessor
+from ufcstats.services.identity import normalize_name
+from ufcstats.services.snapshot import CURRENT_FILE, SNAPSHOT_DIR, StringTable, read_snapshot_part
+
+from .radar_engine import COLUMNS, MAX_ROUNDS, RadarEngine, percentile_rank
+
 
 DATA_DIR = Path(settings.BASE_DIR) / "data" / "ufcstats"
 EVENTS_CSV = DATA_DIR / "ufc_event_details.csv"
@@ -50,8 +59,7 @@ def _fight_duration_seconds(finish_round: int, finish_time_mmss: str):
     return (finish_round - 1) * 300 + _parse_time_mmss(finish_time_mmss)
 
 
-@lru_cache(maxsize=1)
-def _event_dates_map():
+def _read_event_dates():
     if not EVENTS_CSV.exists():
         return {}
 
@@ -70,8 +78,7 @@ def _event_dates_map():
     return out
 
 
-@lru_cache(maxsize=1)
-def _fight_results_map():
+def _read_fight_results():
     if not RESULTS_CSV.exists():
         return {}
 
@@ -106,80 +113,423 @@ class Agg:
     dur_sec: int = 0
 
 
-def _fighter_last_fights_keys(fighter_name: str, last_n: int):
-    fighter_name = (fighter_name or "").strip()
-    if not fighter_name:
-        return []
+@dataclass(frozen=True)
+class BoutStats:
+    """One fighter's totals for one bout (all rounds summed)."""
+    fighter: str
+    event: str
+    bout: str
+    date: date | None
+    sig_landed: int = 0
+    sig_att: int = 0
+    td_landed: int = 0
+    td_att: int = 0
+    kd: int = 0
+    sub_att: int = 0
+    ctrl_sec: int = 0
+    dur_sec: int = 0
+    # (round, *COLUMNS) per round with stats; dur_sec = time fought in that round
+    rounds: tuple = ()
 
-    event_dates = _event_dates_map()
-    fights_set = set()
 
+_NO_DATE = date(1900, 1, 1)
+
+
+def _normalize_fighter(name: str) -> str:
+    return normalize_name(name)
+
+
+def _parse_count(s: str):
+    try:
+        return int(float((s or "").strip() or 0))
+    except ValueError:
+        return 0
+
+
+def _finish(res):
+    """(finish round, seconds into that round) from a results row."""
+    if not res:
+        return 0, 0
+    try:
+        r = int(res.get("round") or 0)
+    except ValueError:
+        r = 0
+    return r, _parse_time_mmss(res.get("time") or "")
+
+
+def _bout_duration(res) -> int:
+    r, t = _finish(res)
+    return (r - 1) * 300 + t if r > 0 else 0
+
+
+def _round_duration(res, rnd: int) -> int:
+    r, t = _finish(res)
+    if rnd <= 0 or rnd > r:
+        return 0
+    return 300 if rnd < r else t
+
+
+def _parse_round(s: str) -> int:
+    """'Round 2' / '2' -> 2; 0 if missing."""
+    digits = "".join(ch for ch in (s or "") if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _build_fighter_index(event_dates, results):
+    """
+    normalized fighter name -> list[BoutStats], newest bout first.
+
+    The stats CSV is round-level, so rows are summed per (fighter, event, bout)
+    once here, keeping the per-round values too; requests then only slice.
+    """
+    if not STATS_CSV.exists():
+        return {}
+
+    # (fighter, event, bout) -> {round: [sig_l, sig_a, td_l, td_a, kd, sub_att, ctrl]}
+    per_bout = {}
+    display = {}
     with STATS_CSV.open(newline="", encoding="utf-8") as f:
         r = csv.DictReader(f)
         for row in r:
-            if (row.get("FIGHTER") or "").strip() != fighter_name:
-                continue
+            raw_name = (row.get("FIGHTER") or "").strip()
+            name = _normalize_fighter(raw_name)
             ev = (row.get("EVENT") or "").strip()
             bout = (row.get("BOUT") or "").strip()
-            if ev and bout:
-                fights_set.add((ev, bout))
-
-    fights = list(fights_set)
-
-    # 🔧 FIX: determinisztikus rendezés (nem flaky többé)
-    fights.sort(
-        key=lambda k: (
-            event_dates.get(k[0], datetime(1900, 1, 1).date()),
-            k[0],  # tie-breaker
-        ),
-        reverse=True,
+            if not name or not ev or not bout:
+                continue
+
+            rounds = per_bout.get((name, ev, bout))
+            if rounds is None:
+                rounds = per_bout[(name, ev, bout)] = {}
+                display.setdefault(name, raw_name)
+
+            rnd = _parse_round(row.get("ROUND"))
+            acc = rounds.get(rnd)
+            if acc is None:
+                acc = rounds[rnd] = [0] * 7
+
+            sig_l, sig_a = _parse_of(row.get("SIG.STR.") or "")
+            td_l, td_a = _parse_of(row.get("TD") or "")
+            acc[0] += sig_l
+            acc[1] += sig_a
+            acc[2] += td_l
+            acc[3] += td_a
+            acc[4] += _parse_count(row.get("KD"))
+            acc[5] += _parse_count(row.get("SUB.ATT"))
+            acc[6] += _parse_time_mmss(row.get("CTRL") or "")
+
+    index = {}
+    for (name, ev, bout), rounds in per_bout.items():
+        res = results.get((ev, bout))
+        totals = [sum(col) for col in zip(*rounds.values())]
+        index.setdefault(name, []).append(BoutStats(
+            display[name], ev, bout, event_dates.get(ev), *totals,
+            dur_sec=_bout_duration(res),
+            rounds=tuple(
+                (rnd, *acc, _round_duration(res, rnd))
+                for rnd, acc in sorted(rounds.items())
+                if rnd > 0
+            ),
+        ))
+
+    # determinisztikus rendezés: dátum, majd event név mint tie-breaker
+    for bouts in index.values():
+        bouts.sort(key=lambda b: (b.date or _NO_DATE, b.event), reverse=True)
+
+    return index
+
+
+# Hosszabb név előbb: "Light Heavyweight" tartalmazza a "Heavyweight"-et
+_DIVISIONS = (
+    "Strawweight",
+    "Flyweight",
+    "Bantamweight",
+    "Featherweight",
+    "Light Heavyweight",
+    "Lightweight",
+    "Welterweight",
+    "Middleweight",
+    "Heavyweight",
+)
+
+
+def _division_of(weightclass: str) -> str:
+    """'UFC Women's Flyweight Title Bout' -> "Women's Flyweight"; "" for catch/open weight."""
+    wc = (weightclass or "").lower()
+    for name in _DIVISIONS:
+        if name.lower() in wc:
+            return f"Women's {name}" if "women's" in wc else name
+    return ""
+
+
+@dataclass(frozen=True)
+class RadarDataset:
+    """Everything the radar reads, built together from one set of CSV files."""
+    event_dates: dict
+    results: dict
+    engine: RadarEngine
+    # Származtatott adatok (pl. divízió eloszlások) ehhez a snapshothoz
+    _memo: dict = field(default_factory=dict, init=False, compare=False, repr=False)
+
+    def bout_divisions(self):
+        """Normalized division per engine bout row ("" for catch/open weight or unknown)."""
+        divisions = self._memo.get("bout_divisions")
+        if divisions is None:
+            divisions = np.array(
+                [_division_of(wc) for wc in self._bout_weightclasses()], dtype=object
+            )
+            self._memo["bout_divisions"] = divisions
+        return divisions
+
+    def bout_titles(self):
+        """True for title bouts, per engine bout row."""
+        titles = self._memo.get("bout_titles")
+        if titles is None:
+            titles = np.array(["Title" in wc for wc in self._bout_weightclasses()], dtype=bool)
+            self._memo["bout_titles"] = titles
+        return titles
+
+    def _bout_weightclasses(self):
+        strings = self.engine.strings
+        out = []
+        for ev, bout, _ in self.engine.bouts.tolist():
+            res = self.results.get((strings[ev], strings[bout]))
+            out.append(res["weightclass"] if res else "")
+        return out
+
+    def fighter_divisions(self):
+        """Division per fighter (engine.names order): the newest bout with a standard division."""
+        divisions = self._memo.get("divisions")
+        if divisions is None:
+            bout_divisions = self.bout_divisions()
+            divisions = []
+            for start, count in zip(self.engine.starts.tolist(), self.engine.counts.tolist()):
+                divisions.append(next((d for d in bout_divisions[start:start + count] if d), ""))
+            self._memo["divisions"] = divisions
+        return divisions
+
+    def division_distributions(self, last_n: int):
+        """division -> {metric: sorted values} for the last-N window, built once per snapshot."""
+        # last_n a leghosszabb karrier fölött már ugyanazt adja -> korlátos cache
+        max_count = int(self.engine.counts.max()) if len(self.engine.counts) else 0
+        key = ("distributions", min(max(0, int(last_n)), max_count))
+        dist = self._memo.get(key)
+        if dist is None:
+            dist = self._memo[key] = self.engine.distributions(self.fighter_divisions(), key[1])
+        return dist
+
+
+_RESULT_FIELDS = ("outcome", "method", "round", "time", "weightclass")
+
+
+def _dataset_from_csv():
+    event_dates = _read_event_dates()
+    results = _read_fight_results()
+    index = _build_fighter_index(event_dates, results)
+    return RadarDataset(event_dates, results, RadarEngine.from_index(index))
+
+
+def snapshot_part(ds: RadarDataset):
+    """(arrays, StringTable) of a dataset for compile_ufcstats_snapshot."""
+    table = StringTable()
+    events = np.array(
+        [[table.intern(ev), d.toordinal()] for ev, d in ds.event_dates.items()],
+        dtype=np.int32,
+    ).reshape(-1, 2)
+    results = np.array(
+        [
+            [table.intern(ev), table.intern(bout), *(table.intern(res[k]) for k in _RESULT_FIELDS)]
+            for (ev, bout), res in ds.results.items()
+        ],
+        dtype=np.int32,
+    ).reshape(-1, 2 + len(_RESULT_FIELDS))
+
+    arrays = {"events": events, "results": results}
+    arrays.update({f"engine_{k}": v for k, v in ds.engine.to_arrays(table.intern).items()})
+    return arrays, table
+
+
+def _dataset_from_snapshot(part):
+    strings = part.strings
+    event_dates = {
+        strings[ev]: date.fromordinal(d) for ev, d in part.arrays["events"].tolist()
+    }
+    results = {
+        (strings[row[0]], strings[row[1]]): dict(zip(_RESULT_FIELDS, (strings[i] for i in row[2:])))
+        for row in part.arrays["results"].tolist()
+    }
+    engine = RadarEngine.from_arrays(
+        {k[len("engine_"):]: v for k, v in part.arrays.items() if k.startswith("engine_")},
+        strings,
     )
+    return RadarDataset(event_dates, results, engine)
+
+
+def _load_dataset():
+    part = read_snapshot_part("radar", (EVENTS_CSV, RESULTS_CSV, STATS_CSV))
+    if part is not None:
+        return _dataset_from_snapshot(part)
+    return _dataset_from_csv()
+
+
+_dataset = DatasetCache(
+    _load_dataset,
+    lambda: (EVENTS_CSV, RESULTS_CSV, STATS_CSV, SNAPSHOT_DIR / CURRENT_FILE),
+)
+
 
-    return fights[: max(0, int(last_n))]
+@snapshot_accessor(_dataset)
+def _event_dates_map(ds):
+    return ds.event_dates
+
+
+@snapshot_accessor(_dataset)
+def _fight_results_map(ds):
+    return ds.results
+
+
+@snapshot_accessor(_dataset)
+def _radar_engine(ds):
+    return ds.engine
+
+
+def _fighter_last_fights_keys(fighter_name: str, last_n: int):
+    return _radar_engine().bout_keys(_normalize_fighter(fighter_name), last_n)
 
 
 def _aggregate_for_fighter(fighter_name: str, last_n: int):
-    keys = _fighter_last_fights_keys(fighter_name, last_n)
-    if not keys:
+    totals = _radar_engine().totals(_normalize_fighter(fighter_name), last_n)
+    if totals is None:
         return None
 
-    results = _fight_results_map()
-    agg = Agg(fights=len(keys))
+    fights, sums = totals
+    return Agg(fights, **{c: int(v) for c, v in zip(COLUMNS, sums)})
 
-    for ev, bout in keys:
-        res = results.get((ev, bout))
-        if not res:
-            continue
+
+@dataclass(frozen=True)
+class RadarFilters:
+    since: date | None = None
+    until: date | None = None
+    weightclass: str = ""
+    title_only: bool = False
+
+    def __bool__(self):
+        return bool(self.since or self.until or self.weightclass or self.title_only)
+
+    def as_dict(self):
+        return {
+            "since": self.since.isoformat() if self.since else None,
+            "until": self.until.isoformat() if self.until else None,
+            "weightclass": self.weightclass or None,
+            "title_only": self.title_only,
+        }
+
+
+def _parse_filters(params) -> RadarFilters:
+    """?since=YYYY-MM-DD&until=YYYY-MM-DD&weightclass=Lightweight&title=1; ValueError on bad input."""
+    def parse_day(key):
+        raw = str(params.get(key) or "").strip()
+        if not raw:
+            return None
         try:
-            r = int(res.get("round") or 0)
+            return date.fromisoformat(raw)
         except ValueError:
-            r = 0
-        agg.dur_sec += _fight_duration_seconds(r, res.get("time") or "")
+            raise ValueError(f"Invalid '{key}' date, expected YYYY-MM-DD.")
 
-    with STATS_CSV.open(newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            if (row.get("FIGHTER") or "").strip() != fighter_name:
-                continue
-            ev = (row.get("EVENT") or "").strip()
-            bout = (row.get("BOUT") or "").strip()
-            if (ev, bout) not in set(keys):
-                continue
+    weightclass = str(params.get("weightclass") or "").strip()
+    if weightclass and not _division_of(weightclass):
+        raise ValueError(f"Unknown weightclass '{weightclass}'.")
 
-            agg.kd += int(float(row.get("KD") or 0))
-            agg.sub_att += int(float(row.get("SUB.ATT") or 0))
+    return RadarFilters(
+        since=parse_day("since"),
+        until=parse_day("until"),
+        weightclass=_division_of(weightclass),
+        title_only=_is_true(params.get("title")),
+    )
 
-            sig_l, sig_a = _parse_of(row.get("SIG.STR.") or "")
-            agg.sig_landed += sig_l
-            agg.sig_att += sig_a
 
-            td_l, td_a = _parse_of(row.get("TD") or "")
-            agg.td_landed += td_l
-            agg.td_att += td_a
+def _aggregate_filtered(fighter_name: str, last_n: int | None, filters: RadarFilters):
+    """
+    Agg over the fighter's bouts matching the filters, newest first, capped at
+    last_n (None = every matching bout).
+    """
+    ds = _dataset.get()
+    engine = ds.engine
+    lo, hi = engine.date_block(
+        _normalize_fighter(fighter_name),
+        since=filters.since.toordinal() if filters.since else 0,
+        until=filters.until.toordinal() if filters.until else 0,
+    )
+    if lo == hi:
+        return None
+
+    keep = np.ones(hi - lo, dtype=bool)
+    if filters.weightclass:
+        keep &= ds.bout_divisions()[lo:hi] == filters.weightclass
+    if filters.title_only:
+        keep &= ds.bout_titles()[lo:hi]
+
+    rows = np.flatnonzero(keep)
+    if last_n is not None:
+        rows = rows[: max(0, int(last_n))]
+    if not len(rows):
+        return None
 
-            agg.ctrl_sec += _parse_time_mmss(row.get("CTRL") or "")
+    sums = engine.row_values(lo, hi)[rows].sum(axis=0)
+    return Agg(len(rows), **{c: int(v) for c, v in zip(COLUMNS, sums)})
+
+
+def _division_percentiles(fighter_name: str, last_n: int):
+    """
+    (division, division size, {metric: percentile}) of one fighter against
+    every fighter of the same division over the same last-N window.
+    """
+    ds = _dataset.get()
+    name = _normalize_fighter(fighter_name)
+    i = ds.engine.pos.get(name)
+    if i is None:
+        return None
+
+    division = ds.fighter_divisions()[i]
+    dist = ds.division_distributions(last_n).get(division)
+    values = ds.engine.metrics_row(name, last_n)
+    if not dist or values is None:
+        return None
 
-    return agg
+    size = len(next(iter(dist.values())))
+    return division, size, {m: round(percentile_rank(dist[m], v), 1) for m, v in values.items()}
+
+
+def clear_cache():
+    _dataset.cache_clear()
+
+
+def dataset_version() -> str:
+    return _dataset.version
+
+
+def _radar_etag(request, *args, **kwargs):
+    """
+    dataset version + the request params; None (no conditional handling)
+    for the DB backend and for POST.
+    """
+    if _radar_backend() == "db" or request.method not in ("GET", "HEAD"):
+        return None
+
+    # a válasz a nyers (strip-elt) nevet adja vissza, így az ETag is abból készül
+    names = [f"fighter={n.strip()}" for n in request.GET.getlist("fighter")]
+    params = sorted(
+        f"{k}={v.strip()}" for k, vs in request.GET.lists() if k != "fighter" for v in vs
+    )
+    key = "\n".join([request.path, *params, *names])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return f'"{dataset_version()}-{digest}"'
+
+
+def _radar_last_modified(request, *args, **kwargs):
+    if _radar_backend() == "db" or request.method not in ("GET", "HEAD"):
+        return None
+    return _dataset.last_modified
 
 
 def _pct(landed: int, att: int):
@@ -194,31 +544,245 @@ def _per15(count: int, dur_sec: int):
     return (count / (dur_sec / 60.0)) * 15.0
 
 
+RADAR_BATCH_MAX = 32
+
+
+def _metrics(agg: Agg):
+    return {
+        "sig_str_acc_pct": round(_pct(agg.sig_landed, agg.sig_att), 2),
+        "td_acc_pct": round(_pct(agg.td_landed, agg.td_att), 2),
+        "kd_per15": round(_per15(agg.kd, agg.dur_sec), 3),
+        "sub_att_per15": round(_per15(agg.sub_att, agg.dur_sec), 3),
+        "ctrl_sec_per15": round(_per15(agg.ctrl_sec, agg.dur_sec), 1),
+    }
+
+
+def _radar_payload(fighter: str, last_n: int, agg: Agg):
+    return {
+        "fighter": fighter,
+        "last": last_n,
+        "fights_count": agg.fights,
+        "duration_total_sec": agg.dur_sec,
+        "metrics": _metrics(agg),
+    }
+
+
+def _round_payload(row):
+    """Payload of one round (or round group) from a ROUND_COLUMNS sums row."""
+    agg = Agg(int(row[-1]), **{c: int(v) for c, v in zip(COLUMNS, row[:-1])})
+    return {
+        "fights_count": agg.fights,
+        "duration_total_sec": agg.dur_sec,
+        "metrics": _metrics(agg),
+    }
+
+
+def _is_true(value) -> bool:
+    return str(value or "").strip().lower() in ("1", "true", "yes")
+
+
+def _add_percentiles(payload: dict, fighter: str, last_n: int):
+    found = _division_percentiles(fighter, last_n)
+    division, size, percentiles = found if found else ("", 0, None)
+    payload["division"] = division
+    payload["division_size"] = size
+    payload["percentiles"] = percentiles
+    return payload
+
+
+def _radar_backend() -> str:
+    return getattr(settings, "UFC_RADAR_BACKEND", "csv")
+
+
+def _missing_csv_files():
+    if _radar_backend() == "db":
+        return False
+    return not EVENTS_CSV.exists() or not RESULTS_CSV.exists() or not STATS_CSV.exists()
+
+
+def _aggregate_many(fighters, last_n: int | None, filters: RadarFilters | None = None):
+    """fighter -> Agg | None, from the configured backend (settings.UFC_RADAR_BACKEND)."""
+    if _radar_backend() == "db":
+        from .radar_db import aggregate_for_fighters
+
+        return aggregate_for_fighters(fighters, last_n)
+
+    if filters:
+        return {name: _aggregate_filtered(name, last_n, filters) for name in fighters}
+    return {name: _aggregate_for_fighter(name, last_n) for name in fighters}
+
+
+def _parse_options(params):
+    """
+    (last_n, filters, percentiles) shared by both radar views; ValueError with
+    a client-facing message on bad input.
+
+    With date/weightclass/title filters and no explicit 'last', every matching
+    fight counts; otherwise 'last' defaults to 5.
+    """
+    filters = _parse_filters(params)
+    # percentiles=division: a divíziós percentilis kérés régi írásmódja
+    raw_percentiles = params.get("percentiles")
+    percentiles = _is_true(raw_percentiles) or str(raw_percentiles or "").strip().lower() == "division"
+
+    last_raw = params.get("last")
+    if last_raw in (None, "") and filters:
+        last_n = None
+    else:
+        try:
+            last_n = int(last_raw or 5)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid 'last' value.")
+
+    if _radar_backend() == "db" and (filters or percentiles):
+        raise ValueError("Filters and percentiles are only available with the CSV radar backend.")
+    if filters and percentiles:
+        raise ValueError("Percentiles cannot be combined with date/weightclass/title filters.")
+
+    return last_n, filters, percentiles
+
+
+def _fighter_payload(fighter: str, last_n, filters: RadarFilters, percentiles: bool, agg: Agg):
+    payload = _radar_payload(fighter, last_n, agg)
+    if filters:
+        payload["filters"] = filters.as_dict()
+    if percentiles:
+        _add_percentiles(payload, fighter, last_n)
+    return payload
+
+
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_radar_etag, last_modified_func=_radar_last_modified)
 @api_view(["GET"])
 def ufc_radar(request):
+    """
+    GET ?fighter=Name&last=5
+        [&percentiles=1]
+        [&since=YYYY-MM-DD&until=YYYY-MM-DD&weightclass=Lightweight&title=1]
+    """
     fighter = (request.query_params.get("fighter") or "").strip()
-    last_n = int(request.query_params.get("last") or 5)
 
     if not fighter:
         return Response({"error": "Missing ?fighter="}, status=400)
 
-    if not EVENTS_CSV.exists() or not RESULTS_CSV.exists() or not STATS_CSV.exists():
+    try:
+        last_n, filters, percentiles = _parse_options(request.query_params)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    if _missing_csv_files():
         return Response({"error": "Missing CSV files."}, status=500)
 
-    agg = _aggregate_for_fighter(fighter, last_n)
+    agg = _aggregate_many([fighter], last_n, filters)[fighter]
     if not agg:
         return Response({"error": f"No fights found for fighter '{fighter}'."}, status=404)
 
+    return Response(_fighter_payload(fighter, last_n, filters, percentiles, agg))
+
+
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_radar_etag, last_modified_func=_radar_last_modified)
+@api_view(["GET", "POST"])
+def ufc_radar_batch(request):
+    """
+    Radar for several fighters in one request.
+
+    GET  ?fighter=A&fighter=B&last=5[&percentiles=1]
+    POST {"fighters": ["A", "B"], "last": 5, "percentiles": true}
+
+    The date/weightclass/title filters of the single view work here too.
+    Results keep the request order; unknown fighters get an "error" entry
+    instead of failing the whole batch.
+    """
+    if request.method == "POST":
+        params = request.data
+        names = params.get("fighters") or []
+        if not isinstance(names, list):
+            return Response({"error": "'fighters' must be a list."}, status=400)
+    else:
+        params = request.query_params
+        names = params.getlist("fighter")
+
+    try:
+        last_n, filters, percentiles = _parse_options(params)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    fighters = []
+    for name in names:
+        name = (str(name) if name is not None else "").strip()
+        if name and name not in fighters:
+            fighters.append(name)
+
+    if not fighters:
+        return Response({"error": "Missing fighter names."}, status=400)
+    if len(fighters) > RADAR_BATCH_MAX:
+        return Response({"error": f"At most {RADAR_BATCH_MAX} fighters per request."}, status=400)
+
+    if _missing_csv_files():
+        return Response({"error": "Missing CSV files."}, status=500)
+
+    aggs = _aggregate_many(fighters, last_n, filters)
+
+    results = []
+    for fighter in fighters:
+        agg = aggs[fighter]
+        if not agg:
+            results.append({"fighter": fighter, "error": f"No fights found for fighter '{fighter}'."})
+            continue
+        results.append(_fighter_payload(fighter, last_n, filters, percentiles, agg))
+
+    return Response({"last": last_n, "results": results})
+
+
+# "Bajnoki" menetek: csak 5 menetes meccseken léteznek
+CHAMPIONSHIP_ROUNDS = (4, 5)
+
+
+@cache_control(public=True, no_cache=True)
+@condition(etag_func=_radar_etag, last_modified_func=_radar_last_modified)
+@api_view(["GET"])
+def ufc_radar_rounds(request):
+    """
+    GET ?fighter=Name&last=5
+
+    Radar metrics of the fighter's last N fights split by round number,
+    plus rounds 4-5 combined as "championship_rounds". Rounds the fighter
+    never reached in those fights are left out.
+    """
+    fighter = (request.query_params.get("fighter") or "").strip()
+    if not fighter:
+        return Response({"error": "Missing ?fighter="}, status=400)
+
+    try:
+        last_n = int(request.query_params.get("last") or 5)
+    except ValueError:
+        return Response({"error": "Invalid 'last' value."}, status=400)
+
+    if _radar_backend() == "db":
+        return Response({"error": "The round breakdown is only available with the CSV radar backend."}, status=400)
+    if _missing_csv_files():
+        return Response({"error": "Missing CSV files."}, status=500)
+
+    totals = _radar_engine().round_totals(_normalize_fighter(fighter), last_n)
+    if totals is None:
+        return Response({"error": f"No fights found for fighter '{fighter}'."}, status=404)
+
+    fights, per_round = totals
+    rounds = [
+        {"round": rnd, **_round_payload(per_round[rnd - 1])}
+        for rnd in range(1, MAX_ROUNDS + 1)
+        if per_round[rnd - 1][-1] > 0
+    ]
+
+    championship = per_round[[r - 1 for r in CHAMPIONSHIP_ROUNDS]].sum(axis=0)
+    # a "fights" oszlop itt menetszám lenne -> meccsszám: volt-e 4. menet
+    championship[-1] = per_round[CHAMPIONSHIP_ROUNDS[0] - 1][-1]
+
     return Response({
         "fighter": fighter,
         "last": last_n,
-        "fights_count": agg.fights,
-        "duration_total_sec": agg.dur_sec,
-        "metrics": {
-            "sig_str_acc_pct": round(_pct(agg.sig_landed, agg.sig_att), 2),
-            "td_acc_pct": round(_pct(agg.td_landed, agg.td_att), 2),
-            "kd_per15": round(_per15(agg.kd, agg.dur_sec), 3),
-            "sub_att_per15": round(_per15(agg.sub_att, agg.dur_sec), 3),
-            "ctrl_sec_per15": round(_per15(agg.ctrl_sec, agg.dur_sec), 1),
-        }
+        "fights_count": fights,
+        "rounds": rounds,
+        "championship_rounds": _round_payload(championship) if championship[-1] > 0 else None,
     })
@@ -1,6 +1,8 @@
 from django.urls import path
-from .ufc_radar import ufc_radar
+from .ufc_radar import ufc_radar, ufc_radar_batch, ufc_radar_rounds
 
 urlpatterns = [
     path("ufc/radar/", ufc_radar),
+    path("ufc/radar/batch/", ufc_radar_batch),
+    path("ufc/radar/rounds/", ufc_radar_rounds),
 ]
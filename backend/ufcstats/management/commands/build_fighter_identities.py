@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from fighters.management.commands import import_ufc_fighters
+from ufcstats.services.csv_ingest import parse_fighter_details, parse_fighter_tott
+from ufcstats.services.identity import rebuild_identities
+
+
+def identity_pairs(details, tott):
+    """(name, URL) pairs from parsed fighter details + tale-of-the-tape rows."""
+    pairs = [(f"{row.first} {row.last}", row.url) for row in details]
+    pairs += [(row.fighter, row.url) for row in tott]
+    return pairs
+
+
+class Command(BaseCommand):
+    help = "Rebuild the fighter name -> UFCStats URL identity table from the fighter CSVs"
+
+    def handle(self, *args, **options):
+        details_csv = import_ufc_fighters.CSV_DETAILS
+        tott_csv = import_ufc_fighters.CSV_TOTT
+        if not details_csv.exists():
+            self.stderr.write(f"Missing file: {details_csv.resolve()}")
+            return
+
+        tott = parse_fighter_tott(tott_csv) if tott_csv.exists() else []
+        count = rebuild_identities(identity_pairs(parse_fighter_details(details_csv), tott))
+        self.stdout.write(self.style.SUCCESS(f"Done. aliases={count}"))
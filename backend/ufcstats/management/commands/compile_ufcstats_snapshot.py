@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from fighters.services import ufcstats_registry as registry
+from ufcstats.api import ufc_radar as radar
+from ufcstats.services.snapshot import SNAPSHOT_DIR, write_snapshot
+
+
+class Command(BaseCommand):
+    help = "Compile the UFCStats CSVs into a memory-mappable binary snapshot (data/ufcstats/snapshot/)"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+
+        ds = radar._dataset_from_csv()
+        fighters = registry._read_registry()
+
+        target = write_snapshot(
+            {
+                "radar": radar.snapshot_part(ds),
+                "registry": registry.snapshot_part(fighters),
+            },
+            sources=(radar.EVENTS_CSV, radar.RESULTS_CSV, radar.STATS_CSV, registry.FIGHTERS_CSV),
+            directory=SNAPSHOT_DIR,
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Done. {target} | events={len(ds.event_dates)} results={len(ds.results)} "
+            f"fighters={len(ds.engine.names)} registry_names={len(fighters.names)} "
+            f"({time.perf_counter() - started:.2f}s)"
+        ))
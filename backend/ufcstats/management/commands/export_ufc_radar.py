@@ -0,0 +1,53 @@
+import csv
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from ufcstats.api.ufc_radar import _radar_engine
+
+METRIC_DIGITS = {
+    "sig_str_acc_pct": 2,
+    "td_acc_pct": 2,
+    "kd_per15": 3,
+    "sub_att_per15": 3,
+    "ctrl_sec_per15": 1,
+}
+
+
+class Command(BaseCommand):
+    help = "Export radar metrics for every fighter in the UFCStats stats CSV (one vectorized pass)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--last", type=int, default=5, help="Use each fighter's last N fights.")
+        parser.add_argument("--out", type=str, default="", help="Output CSV path (default: stdout).")
+
+    def handle(self, *args, **options):
+        last_n = options["last"]
+        out_path = options["out"]
+
+        engine = _radar_engine()
+        metrics = engine.metrics_all(last_n)
+
+        header = ["fighter", "last", "fights_count", "duration_total_sec", *METRIC_DIGITS]
+
+        f = Path(out_path).open("w", newline="", encoding="utf-8") if out_path else sys.stdout
+        try:
+            w = csv.writer(f)
+            w.writerow(header)
+            for i, name in enumerate(engine.display_names):
+                w.writerow([
+                    name,
+                    last_n,
+                    int(metrics["fights_count"][i]),
+                    int(metrics["duration_total_sec"][i]),
+                    *(round(float(metrics[m][i]), d) for m, d in METRIC_DIGITS.items()),
+                ])
+        finally:
+            if out_path:
+                f.close()
+
+        if out_path:
+            self.stdout.write(self.style.SUCCESS(
+                f"Done. fighters={len(engine.names)} last={last_n} -> {out_path}"
+            ))
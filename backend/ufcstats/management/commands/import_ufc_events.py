@@ -0,0 +1,113 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from ufcstats.models import UFCEvent, UFCFightStats
+from ufcstats.services.career_summary import refresh_career_summaries
+from ufcstats.services.csv_ingest import parse_events
+from ufcstats.services.ingest_state import RowDelta
+
+CSV_EVENTS = Path(settings.BASE_DIR) / "data" / "ufcstats" / "ufc_event_details.csv"
+
+UPDATE_FIELDS = ("name", "url", "date", "location")
+# ezek az összesítőkben is szerepelnek (sorrend / utolsó meccs)
+SUMMARY_FIELDS = {"name", "date"}
+
+
+class Command(BaseCommand):
+    help = "Import UFC events from CSV into ufcstats.UFCEvent (set-based upsert, dry-run by default)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--apply", action="store_true", help="Save to DB (otherwise dry-run).")
+        parser.add_argument("--limit", type=int, default=0, help="Process only N rows (0 = all).")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per bulk_create / bulk_update call.")
+        parser.add_argument("--full", action="store_true", help="Re-check every row, ignoring stored row hashes.")
+
+    def handle(self, *args, **options):
+        if not CSV_EVENTS.exists():
+            self.stderr.write(f"Missing file: {CSV_EVENTS.resolve()}")
+            return
+
+        self.sync(parse_events(CSV_EVENTS), options)
+
+    def sync(self, parsed, options):
+        """DB phase for already parsed EventRows (also used by import_ufcstats)."""
+        apply = options["apply"]
+        batch_size = max(1, options["batch_size"])
+        if options["limit"]:
+            parsed = parsed[:options["limit"]]
+
+        rows = [r for r in parsed if r.name and r.url and r.date]
+        skipped = len(parsed) - len(rows)
+        delta = RowDelta("events", full=options["full"])
+
+        # egy lekérdezés: URL szerint, a régi (URL nélküli) sorokat név szerint párosítjuk
+        existing = list(UFCEvent.objects.all())
+        by_url = {e.url: e for e in existing if e.url}
+        by_name = {e.name: e for e in existing if not e.url}
+        next_event_id = max((e.event_id for e in existing), default=0) + 1
+
+        to_create = []
+        to_update = []
+        seen = set()
+        unchanged = 0
+        # azok a meglévő események, amelyeknek a neve / dátuma változott
+        reordered = []
+
+        # legrégebbi eseménnyel kezdünk, így az új event_id-k időrendben nőnek
+        for row in sorted(rows, key=lambda r: (r.date, r.name)):
+            data = row._asdict()
+            if data["url"] in seen:
+                skipped += 1
+                continue
+            seen.add(data["url"])
+
+            # csak az új / megváltozott sorok: a watermark előtti eseményeket nem is hash-eljük
+            if delta.is_before_watermark(data["date"]):
+                unchanged += 1
+                continue
+            digest = delta.changed(data["url"], row)
+            if digest is None:
+                unchanged += 1
+                continue
+            delta.mark(data["url"], digest, data["date"])
+
+            obj = by_url.get(data["url"]) or by_name.pop(data["name"], None)
+            if obj is None:
+                to_create.append(UFCEvent(event_id=next_event_id, **data))
+                next_event_id += 1
+                self.stdout.write(f"[{'APPLY' if apply else 'DRY'}] create: {data['name']} {data['date']}")
+                continue
+
+            changes = {k: v for k, v in data.items() if getattr(obj, k) != v}
+            if changes:
+                for k, v in changes.items():
+                    setattr(obj, k, v)
+                to_update.append(obj)
+                if SUMMARY_FIELDS & changes.keys():
+                    reordered.append(obj.id)
+                self.stdout.write(f"[{'APPLY' if apply else 'DRY'}] update: {data['name']} -> {changes}")
+
+        summaries = 0
+        if apply and delta.pending:
+            with transaction.atomic():
+                if to_update:
+                    UFCEvent.objects.bulk_update(to_update, UPDATE_FIELDS, batch_size=batch_size)
+                if to_create:
+                    UFCEvent.objects.bulk_create(to_create, batch_size=batch_size)
+                delta.save(batch_size)
+                # az átdatált események fightereinek "utolsó N meccse" is változhat
+                if reordered:
+                    summaries = refresh_career_summaries(
+                        UFCFightStats.objects.filter(fight__event_id__in=reordered)
+                        .values_list("fighter_name", flat=True)
+                        .distinct(),
+                        batch_size=batch_size,
+                    )
+
+        self.stdout.write("")
+        self.stdout.write(self.style.SUCCESS(
+            f"Done. apply={apply} created={len(to_create)} updated={len(to_update)} skipped={skipped} "
+            f"unchanged={unchanged} summaries_refreshed={summaries}"
+        ))
@@ -0,0 +1,274 @@
+from collections import defaultdict
+from itertools import groupby
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ufcstats.models import UFCEvent, UFCFight, UFCFightStats
+from ufcstats.services.csv_ingest import (
+    STATS_INT_COLUMNS,
+    STATS_OF_FIELDS,
+    STATS_TEXT_COLUMNS,
+    iter_fight_stats,
+    parse_fight_details,
+    parse_fight_results,
+    parse_mmss,
+    parse_of,
+)
+from ufcstats.services.career_summary import refresh_career_summaries
+from ufcstats.services.ingest_state import RowDelta, row_digest
+
+DATA_DIR = Path(settings.BASE_DIR) / "data" / "ufcstats"
+CSV_RESULTS = DATA_DIR / "ufc_fight_results.csv"
+CSV_FIGHT_DETAILS = DATA_DIR / "ufc_fight_details.csv"
+CSV_STATS = DATA_DIR / "ufc_fight_stats.csv"
+
+FIGHT_UPDATE_FIELDS = ["event", "bout", "outcome", "weightclass", "method", "round", "time", "time_format", "referee"]
+
+
+def _clip(model, field: str, value: str) -> str:
+    # Postgres-en a túl hosszú érték az egész batch-et elbuktatná
+    max_length = model._meta.get_field(field).max_length
+    return value[:max_length] if max_length else value
+
+
+def _numeric_columns(row):
+    """Integer columns parsed from the "X of Y" / "m:ss" texts of a FightStatsRow."""
+    out = {"ctrl_seconds": parse_mmss(row.ctrl)}
+    for f in STATS_OF_FIELDS:
+        out[f"{f}_landed"], out[f"{f}_att"] = parse_of(getattr(row, f))
+    return out
+
+
+def _parse_round_number(s: str):
+    try:
+        return int(s) if s else None
+    except ValueError:
+        return None
+
+
+class Command(BaseCommand):
+    help = "Bulk import UFC fights and per-round fight stats from CSV into ufcstats (dry-run by default)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--apply", action="store_true", help="Save to DB (otherwise dry-run).")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows per bulk_create / bulk_update call.")
+        parser.add_argument("--skip-stats", action="store_true", help="Import fights only.")
+        parser.add_argument("--full", action="store_true", help="Re-check every row, ignoring stored row hashes.")
+
+    def handle(self, *args, **options):
+        if not CSV_RESULTS.exists():
+            self.stderr.write(f"Missing file: {CSV_RESULTS.resolve()}")
+            return
+
+        details = parse_fight_details(CSV_FIGHT_DETAILS) if CSV_FIGHT_DETAILS.exists() else []
+        stats = None
+        if not options["skip_stats"] and CSV_STATS.exists():
+            # lustán olvasva: a stats CSV soha nincs egyben a memóriában
+            stats = iter_fight_stats(CSV_STATS)
+        self.sync(parse_fight_results(CSV_RESULTS), details, stats, options)
+
+    def sync(self, results, details, stats, options):
+        """DB phase for already parsed rows (also used by import_ufcstats); stats=None skips stats."""
+        apply = options["apply"]
+        batch_size = max(1, options["batch_size"])
+
+        # az összes meglévő eseményt / meccset egy-egy lekérdezéssel töltjük be;
+        # URL alapján párosítunk, a név csak tartalék (két azonos nevű esemény is lehet)
+        events_by_url = {}
+        events_by_name = defaultdict(list)
+        for name, url, pk, dt in UFCEvent.objects.values_list("name", "url", "id", "date"):
+            if url:
+                events_by_url[url] = (pk, dt)
+            events_by_name[name].append((pk, dt))
+        fight_ids = dict(UFCFight.objects.values_list("url", "id"))
+        delta = RowDelta("fights", full=options["full"])
+
+        url_by_bout = {(r.event, r.bout): r.url for r in details if r.url}
+
+        new_fights = []
+        changed_fights = []
+        seen_urls = set()
+        unchanged = 0
+        missing_event = 0
+        ambiguous_events = set()
+        skipped = 0
+
+        for row in results:
+            url = row.url or url_by_bout.get((row.event, row.bout), "")
+            if not row.event or not row.bout or not url or url in seen_urls:
+                skipped += 1
+                continue
+            seen_urls.add(url)
+            url_by_bout.setdefault((row.event, row.bout), url)
+
+            if row.event_url:
+                event_id, event_date = events_by_url.get(row.event_url, (None, None))
+            else:
+                candidates = events_by_name.get(row.event, [])
+                if len(candidates) > 1:
+                    ambiguous_events.add(row.event)
+                    skipped += 1
+                    continue
+                event_id, event_date = candidates[0] if candidates else (None, None)
+            # régi kártya (watermark előtt) vagy változatlan sor: nem nyúlunk hozzá
+            if delta.is_before_watermark(event_date):
+                unchanged += 1
+                continue
+            digest = delta.changed(url, row)
+            if digest is None:
+                unchanged += 1
+                continue
+
+            if event_id is None:
+                missing_event += 1
+                continue
+
+            fight = UFCFight(
+                id=fight_ids.get(url),
+                event_id=event_id,
+                bout=_clip(UFCFight, "bout", row.bout),
+                url=url,
+                outcome=_clip(UFCFight, "outcome", row.outcome),
+                weightclass=_clip(UFCFight, "weightclass", row.weightclass),
+                method=_clip(UFCFight, "method", row.method),
+                round=_parse_round_number(row.round),
+                time=_clip(UFCFight, "time", row.time),
+                time_format=_clip(UFCFight, "time_format", row.time_format),
+                referee=_clip(UFCFight, "referee", row.referee),
+            )
+            (changed_fights if fight.id else new_fights).append(fight)
+            delta.mark(url, digest, event_date)
+
+        stats_created = 0
+        stats_skipped = 0
+        touched = set()
+        with transaction.atomic():
+            if apply and changed_fights:
+                UFCFight.objects.bulk_update(changed_fights, FIGHT_UPDATE_FIELDS, batch_size=batch_size)
+            if apply and new_fights:
+                UFCFight.objects.bulk_create(new_fights, batch_size=batch_size)
+                fight_ids = dict(UFCFight.objects.values_list("url", "id"))
+
+            stats_replaced = 0
+            if stats is not None:
+                # a fights watermark itt nem használható: egy --skip-stats futás után
+                # a régi kártyák statjai soha nem jönnének be; meccsenkénti hash dönt
+                stats_delta = RowDelta("fight_stats", full=options["full"])
+                stats_created, stats_replaced, stats_skipped, touched = self._import_stats(
+                    stats, url_by_bout, fight_ids, {f.url for f in new_fights}, stats_delta, apply, batch_size,
+                )
+                if apply:
+                    stats_delta.save(batch_size)
+
+            summaries = 0
+            if apply:
+                delta.save(batch_size)
+                # csak az érintett fighterek összesítőit építjük újra
+                if changed_fights:
+                    touched.update(
+                        UFCFightStats.objects.filter(fight_id__in=[f.id for f in changed_fights])
+                        .values_list("fighter_name", flat=True)
+                    )
+                summaries = refresh_career_summaries(touched, batch_size=batch_size)
+
+        for name in sorted(ambiguous_events):
+            self.stderr.write(f"Ambiguous event name (several events, no EVENT URL in the CSV): {name}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Done. apply={apply} fights_created={len(new_fights)} fights_updated={len(changed_fights)} "
+            f"fights_unchanged={unchanged} "
+            f"missing_event={missing_event} ambiguous_event={len(ambiguous_events)} skipped={skipped} "
+            f"stats_created={stats_created} stats_replaced={stats_replaced} stats_skipped={stats_skipped} "
+            f"summaries_refreshed={summaries}"
+        ))
+
+    def _import_stats(self, stats, url_by_bout, fight_ids, new_urls, delta, apply, batch_size):
+        """
+        Loads the round-level stats one fight at a time. A fight's rows are
+        hashed together: new or changed fights (every fight with --full) get
+        their old stats rows deleted and the CSV rows bulk_created, deduped on
+        (fighter, round); unchanged fights are left alone. Returns (created,
+        fights replaced, skipped, fighter names whose rows changed).
+        """
+        with_stats = set(UFCFightStats.objects.values_list("fight_id", flat=True).distinct())
+
+        created = 0
+        replaced = 0
+        skipped = 0
+        touched = set()
+        to_delete = []
+        batch = []
+        digests = {}  # fight_id -> a meccs eddigi sorainak hash-e ebben a futásban
+        seen = set()  # (fight_id, fighter, round): a CSV-ben lehet duplikált sor
+
+        def flush():
+            if to_delete:
+                stale = UFCFightStats.objects.filter(fight_id__in=to_delete)
+                touched.update(stale.values_list("fighter_name", flat=True).distinct())
+                stale.delete()
+                to_delete.clear()
+            if batch:
+                UFCFightStats.objects.bulk_create(batch, batch_size=batch_size)
+                batch.clear()
+
+        # a CSV meccsenként egymás után adja a menetsorokat; ha egy meccs később
+        # újra előjön, a sorait hozzáadjuk, és a hash-e a két rész együttes hash-e
+        for url, rows in groupby(stats, key=lambda r: r.url or url_by_bout.get((r.event, r.bout))):
+            rows = list(rows)
+            valid = [r for r in rows if r.fighter and r.round > 0]
+            skipped += len(rows) - len(valid)
+            rows = valid
+            fight_id = fight_ids.get(url)
+            if fight_id is None:
+                # dry-run: az új meccseknek még nincs id-ja, de számoljuk őket
+                if not apply and url in new_urls:
+                    created += len({(r.fighter, r.round) for r in rows})
+                else:
+                    skipped += len(rows)
+                continue
+
+            if fight_id in digests:
+                digests[fight_id] = row_digest([digests[fight_id], row_digest(rows)])
+                delta.mark(url, digests[fight_id])
+            else:
+                digest = delta.changed(url, rows)
+                if digest is None:
+                    digests[fight_id] = row_digest(rows)
+                    seen.update((fight_id, _clip(UFCFightStats, "fighter_name", r.fighter), r.round) for r in rows)
+                    skipped += len(rows)
+                    continue
+                digests[fight_id] = digest
+                delta.mark(url, digest)
+                if fight_id in with_stats:
+                    replaced += 1
+                    to_delete.append(fight_id)
+
+            for row in rows:
+                fighter = _clip(UFCFightStats, "fighter_name", row.fighter)
+                key = (fight_id, fighter, row.round)
+                if key in seen:
+                    skipped += 1
+                    continue
+                seen.add(key)
+                created += 1
+                touched.add(fighter)
+                batch.append(UFCFightStats(
+                    fight_id=fight_id,
+                    fighter_name=fighter,
+                    round=row.round,
+                    **{f: getattr(row, f) for f in STATS_INT_COLUMNS.values()},
+                    **{f: _clip(UFCFightStats, f, getattr(row, f)) for f in STATS_TEXT_COLUMNS.values()},
+                    **_numeric_columns(row),
+                ))
+            if apply and len(batch) >= batch_size:
+                flush()
+            elif not apply:
+                to_delete.clear()
+                batch.clear()
+
+        if apply:
+            flush()
+        return created, replaced, skipped, touched
@@ -0,0 +1,81 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from fighters.management.commands import import_ufc_fighters
+from ufcstats.management.commands import import_ufc_events, import_ufc_fights
+from ufcstats.management.commands.build_fighter_identities import identity_pairs
+from ufcstats.services.csv_ingest import (
+    parse_events,
+    parse_fight_details,
+    parse_fight_results,
+    parse_fight_stats,
+    parse_fighter_details,
+    parse_fighter_tott,
+    parse_files,
+)
+from ufcstats.services.identity import rebuild_identities
+
+
+class Command(BaseCommand):
+    help = (
+        "Full ufcstats refresh: parse every CSV in parallel worker processes, "
+        "then import events, fights (+ stats) and fighter profiles (dry-run by default)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--apply", action="store_true", help="Save to DB (otherwise dry-run).")
+        parser.add_argument("--workers", type=int, default=0, help="Parser processes (0 = one per file, up to CPU count; 1 = no pool).")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per bulk_create / bulk_update call.")
+        parser.add_argument("--skip-stats", action="store_true", help="Do not import per-round fight stats.")
+        parser.add_argument("--full", action="store_true", help="Re-check every row, ignoring stored row hashes.")
+
+    def handle(self, *args, **options):
+        common = {"apply": options["apply"], "batch_size": options["batch_size"], "full": options["full"]}
+
+        jobs = {
+            "events": (parse_events, import_ufc_events.CSV_EVENTS),
+            "results": (parse_fight_results, import_ufc_fights.CSV_RESULTS),
+            "fight_details": (parse_fight_details, import_ufc_fights.CSV_FIGHT_DETAILS),
+            "fighter_tott": (parse_fighter_tott, import_ufc_fighters.CSV_TOTT),
+            "fighter_details": (parse_fighter_details, import_ufc_fighters.CSV_DETAILS),
+        }
+        if not options["skip_stats"]:
+            jobs["stats"] = (parse_fight_stats, import_ufc_fights.CSV_STATS)
+
+        started = time.perf_counter()
+        parsed = parse_files(jobs, workers=options["workers"] or None)
+        self.stdout.write(f"Parsed {len(jobs)} file(s) in {time.perf_counter() - started:.2f}s")
+
+        # DB írás a fő folyamatban, függőségi sorrendben: események -> meccsek -> fighterek
+        if parsed["events"] is None:
+            self.stderr.write(f"Missing file: {import_ufc_events.CSV_EVENTS.resolve()}")
+        else:
+            self._command(import_ufc_events).sync(parsed["events"], {**common, "limit": 0})
+
+        if parsed["results"] is None:
+            self.stderr.write(f"Missing file: {import_ufc_fights.CSV_RESULTS.resolve()}")
+        else:
+            self._command(import_ufc_fights).sync(
+                parsed["results"], parsed["fight_details"] or [], parsed.get("stats"), common
+            )
+
+        if parsed["fighter_tott"] is None or parsed["fighter_details"] is None:
+            self.stderr.write("Missing fighter CSV file(s), skipping fighter profiles.")
+        else:
+            # előbb az identity tábla, a fighter import már ezen keresztül párosít
+            if options["apply"]:
+                aliases = rebuild_identities(identity_pairs(parsed["fighter_details"], parsed["fighter_tott"]))
+                self.stdout.write(f"Fighter identities: aliases={aliases}")
+            self._command(import_ufc_fighters).sync(parsed["fighter_tott"], parsed["fighter_details"], {
+                **common,
+                "limit": 0,
+                "chunk_size": 2000,
+                "diff_file": "",
+                "verbose_rows": False,
+            })
+
+        self.stdout.write(self.style.SUCCESS(f"All done in {time.perf_counter() - started:.2f}s"))
+
+    def _command(self, module):
+        return module.Command(stdout=self.stdout, stderr=self.stderr)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ufcstats.services.career_summary import refresh_career_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the FighterCareerSummary table from UFCFightStats (all fighters or the given ones)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fighter", action="append", default=[], help="Only this fighter (repeatable).")
+
+    def handle(self, *args, **options):
+        count = refresh_career_summaries(options["fighter"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Done. fighters={count}"))
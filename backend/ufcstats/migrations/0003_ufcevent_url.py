@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0002_alter_ufcfight_round'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ufcevent',
+            name='url',
+            field=models.URLField(blank=True, null=True, unique=True),
+        ),
+    ]
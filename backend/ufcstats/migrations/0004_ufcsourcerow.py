@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0003_ufcevent_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UFCSourceRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=30)),
+                ('key', models.CharField(max_length=255)),
+                ('digest', models.CharField(max_length=40)),
+                ('event_date', models.DateField(blank=True, null=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('source', 'key'), name='ufcsourcerow_source_key')],
+            },
+        ),
+    ]
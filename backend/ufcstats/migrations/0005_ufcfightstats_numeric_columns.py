@@ -0,0 +1,98 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0004_ufcsourcerow'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='body_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='body_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='clinch_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='clinch_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='ctrl_seconds',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='distance_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='distance_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='ground_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='ground_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='head_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='head_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='leg_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='leg_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='sig_str_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='sig_str_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='td_att',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='ufcfightstats',
+            name='td_landed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:29
+
+from django.db import migrations
+
+
+OF_FIELDS = ("sig_str", "td", "head", "body", "leg", "distance", "clinch", "ground")
+BATCH_SIZE = 2000
+
+
+def _parse_of(s):
+    # "10 of 20" -> (10, 20); "---" / üres -> (0, 0)
+    parts = (s or "").split(" of ")
+    if len(parts) != 2:
+        return 0, 0
+    try:
+        return int(parts[0].strip()), int(parts[1].strip())
+    except ValueError:
+        return 0, 0
+
+
+def _parse_mmss(s):
+    mm, sep, ss = (s or "").strip().partition(":")
+    try:
+        return int(mm) * 60 + int(ss) if sep else 0
+    except ValueError:
+        return 0
+
+
+def fill_numeric_columns(apps, schema_editor):
+    UFCFightStats = apps.get_model("ufcstats", "UFCFightStats")
+    numeric = [f"{f}_{part}" for f in OF_FIELDS for part in ("landed", "att")] + ["ctrl_seconds"]
+
+    batch = []
+    for obj in UFCFightStats.objects.only("id", "ctrl", *OF_FIELDS).iterator(chunk_size=BATCH_SIZE):
+        for f in OF_FIELDS:
+            landed, att = _parse_of(getattr(obj, f))
+            setattr(obj, f"{f}_landed", landed)
+            setattr(obj, f"{f}_att", att)
+        obj.ctrl_seconds = _parse_mmss(obj.ctrl)
+        batch.append(obj)
+        if len(batch) >= BATCH_SIZE:
+            UFCFightStats.objects.bulk_update(batch, numeric)
+            batch = []
+
+    if batch:
+        UFCFightStats.objects.bulk_update(batch, numeric)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0005_ufcfightstats_numeric_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_numeric_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0006_fill_ufcfightstats_numeric_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FighterCareerSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fighter_name', models.CharField(max_length=255)),
+                ('window', models.PositiveSmallIntegerField()),
+                ('fights', models.PositiveIntegerField(default=0)),
+                ('last_fight_date', models.DateField(blank=True, null=True)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('losses', models.PositiveIntegerField(default=0)),
+                ('draws', models.PositiveIntegerField(default=0)),
+                ('no_contests', models.PositiveIntegerField(default=0)),
+                ('ko_tko_wins', models.PositiveIntegerField(default=0)),
+                ('sub_wins', models.PositiveIntegerField(default=0)),
+                ('dec_wins', models.PositiveIntegerField(default=0)),
+                ('ko_tko_losses', models.PositiveIntegerField(default=0)),
+                ('sub_losses', models.PositiveIntegerField(default=0)),
+                ('dec_losses', models.PositiveIntegerField(default=0)),
+                ('sig_landed', models.PositiveIntegerField(default=0)),
+                ('sig_att', models.PositiveIntegerField(default=0)),
+                ('td_landed', models.PositiveIntegerField(default=0)),
+                ('td_att', models.PositiveIntegerField(default=0)),
+                ('kd', models.PositiveIntegerField(default=0)),
+                ('sub_att', models.PositiveIntegerField(default=0)),
+                ('ctrl_sec', models.PositiveIntegerField(default=0)),
+                ('dur_sec', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('fighter_name', 'window'), name='fightercareersummary_fighter_window')],
+            },
+        ),
+    ]
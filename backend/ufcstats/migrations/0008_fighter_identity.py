@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ufcstats', '0007_fightercareersummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FighterIdentity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(db_index=True, max_length=255)),
+                ('url', models.URLField()),
+                ('display_name', models.CharField(max_length=255)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('alias', 'url'), name='fighteridentity_alias_url')],
+            },
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.db import models
 class UFCEvent(models.Model):
     event_id = models.IntegerField(unique=True)
     name = models.CharField(max_length=255)
+    url = models.URLField(unique=True, null=True, blank=True)
     date = models.DateField()
     location = models.CharField(max_length=255)
 
@@ -46,6 +47,25 @@ class UFCFightStats(models.Model):
         distance = models.CharField(max_length=30, blank=True)
         clinch = models.CharField(max_length=30, blank=True)
         ground = models.CharField(max_length=30, blank=True)
+
+        # a fenti "X of Y" / "m:ss" szövegek számként, importkor töltve (SQL SUM-hoz)
+        sig_str_landed = models.PositiveIntegerField(default=0)
+        sig_str_att = models.PositiveIntegerField(default=0)
+        td_landed = models.PositiveIntegerField(default=0)
+        td_att = models.PositiveIntegerField(default=0)
+        head_landed = models.PositiveIntegerField(default=0)
+        head_att = models.PositiveIntegerField(default=0)
+        body_landed = models.PositiveIntegerField(default=0)
+        body_att = models.PositiveIntegerField(default=0)
+        leg_landed = models.PositiveIntegerField(default=0)
+        leg_att = models.PositiveIntegerField(default=0)
+        distance_landed = models.PositiveIntegerField(default=0)
+        distance_att = models.PositiveIntegerField(default=0)
+        clinch_landed = models.PositiveIntegerField(default=0)
+        clinch_att = models.PositiveIntegerField(default=0)
+        ground_landed = models.PositiveIntegerField(default=0)
+        ground_att = models.PositiveIntegerField(default=0)
+        ctrl_seconds = models.PositiveIntegerField(default=0)
         
         class Meta:
             indexes = [
@@ -54,4 +74,75 @@ class UFCFightStats(models.Model):
         ]
         
         def __str__(self):
-            return f"{self.fighter_name} - Round {self.round} ({self.fight.bout})"
\ No newline at end of file
+            return f"{self.fighter_name} - Round {self.round} ({self.fight.bout})"
+
+class UFCSourceRow(models.Model):
+    """Content hash of one imported CSV row, for delta imports."""
+    source = models.CharField(max_length=30)
+    key = models.CharField(max_length=255)
+    digest = models.CharField(max_length=40)
+    event_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["source", "key"], name="ufcsourcerow_source_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.source}: {self.key}"
+
+
+class FighterCareerSummary(models.Model):
+    """
+    Materialized per-fighter totals, rebuilt by ufcstats.services.career_summary
+    after imports. One row per (fighter, window): the last ``window`` fights,
+    0 = whole career.
+    """
+    fighter_name = models.CharField(max_length=255)
+    window = models.PositiveSmallIntegerField()
+
+    fights = models.PositiveIntegerField(default=0)
+    last_fight_date = models.DateField(null=True, blank=True)
+
+    wins = models.PositiveIntegerField(default=0)
+    losses = models.PositiveIntegerField(default=0)
+    draws = models.PositiveIntegerField(default=0)
+    no_contests = models.PositiveIntegerField(default=0)
+    ko_tko_wins = models.PositiveIntegerField(default=0)
+    sub_wins = models.PositiveIntegerField(default=0)
+    dec_wins = models.PositiveIntegerField(default=0)
+    ko_tko_losses = models.PositiveIntegerField(default=0)
+    sub_losses = models.PositiveIntegerField(default=0)
+    dec_losses = models.PositiveIntegerField(default=0)
+
+    sig_landed = models.PositiveIntegerField(default=0)
+    sig_att = models.PositiveIntegerField(default=0)
+    td_landed = models.PositiveIntegerField(default=0)
+    td_att = models.PositiveIntegerField(default=0)
+    kd = models.PositiveIntegerField(default=0)
+    sub_att = models.PositiveIntegerField(default=0)
+    ctrl_sec = models.PositiveIntegerField(default=0)
+    dur_sec = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["fighter_name", "window"], name="fightercareersummary_fighter_window"),
+        ]
+
+    def __str__(self):
+        return f"{self.fighter_name} (last {self.window or 'all'})"
+
+
+class FighterIdentity(models.Model):
+    """Normalized name alias -> UFCStats fighter URL (ufcstats.services.identity)."""
+    alias = models.CharField(max_length=255, db_index=True)
+    url = models.URLField()
+    display_name = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["alias", "url"], name="fighteridentity_alias_url"),
+        ]
+
+    def __str__(self):
+        return f"{self.alias} -> {self.url}"
@@ -0,0 +1,128 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Sum
+
+from ufcstats.api.ufc_radar import _fight_duration_seconds
+from ufcstats.models import FighterCareerSummary, UFCFightStats
+
+
+# 0 = teljes karrier
+SUMMARY_WINDOWS = (0, 3, 5, 10)
+TOTAL_FIELDS = ("sig_landed", "sig_att", "td_landed", "td_att", "kd", "sub_att", "ctrl_sec", "dur_sec")
+
+
+def _fight_rows(names=None):
+    """One row per (fighter, fight) with the per-round stats summed in SQL."""
+    qs = UFCFightStats.objects.all()
+    if names is not None:
+        qs = qs.filter(fighter_name__in=list(names))
+    return (
+        qs.values(
+            "fighter_name", "fight_id", "fight__event__date", "fight__event__name",
+            "fight__bout", "fight__outcome", "fight__method", "fight__round", "fight__time",
+        )
+        .annotate(
+            sig_landed=Sum("sig_str_landed"),
+            sig_att=Sum("sig_str_att"),
+            td_landed=Sum("td_landed"),
+            td_att=Sum("td_att"),
+            kd_sum=Sum("kd"),
+            sub_att_sum=Sum("sub_att"),
+            ctrl_sec=Sum("ctrl_seconds"),
+        )
+        .order_by()
+    )
+
+
+def _result_for(fighter: str, bout: str, outcome: str) -> str:
+    """'W' / 'L' / 'D' / 'NC' for the fighter, '' if it cannot be told."""
+    names = [" ".join(n.split()).lower() for n in (bout or "").split(" vs. ")]
+    results = (outcome or "").split("/")
+    me = " ".join(fighter.split()).lower()
+    if len(names) != 2 or len(results) != 2 or me not in names:
+        return ""
+    return results[names.index(me)].strip().upper()
+
+
+def _method_kind(method: str) -> str:
+    m = (method or "").upper()
+    if "KO" in m:
+        return "ko_tko"
+    if "SUB" in m:
+        return "sub"
+    if "DEC" in m:
+        return "dec"
+    return ""
+
+
+def _summary(fighter: str, window: int, fights) -> FighterCareerSummary:
+    """fights: the fighter's per-fight rows, newest first."""
+    s = FighterCareerSummary(fighter_name=fighter, window=window, fights=len(fights))
+    s.last_fight_date = fights[0]["fight__event__date"] if fights else None
+
+    for row in fights:
+        result = _result_for(fighter, row["fight__bout"], row["fight__outcome"])
+        kind = _method_kind(row["fight__method"])
+        if result == "W":
+            s.wins += 1
+            if kind:
+                setattr(s, f"{kind}_wins", getattr(s, f"{kind}_wins") + 1)
+        elif result == "L":
+            s.losses += 1
+            if kind:
+                setattr(s, f"{kind}_losses", getattr(s, f"{kind}_losses") + 1)
+        elif result == "D":
+            s.draws += 1
+        elif result == "NC":
+            s.no_contests += 1
+
+        s.sig_landed += row["sig_landed"] or 0
+        s.sig_att += row["sig_att"] or 0
+        s.td_landed += row["td_landed"] or 0
+        s.td_att += row["td_att"] or 0
+        s.kd += row["kd_sum"] or 0
+        s.sub_att += row["sub_att_sum"] or 0
+        s.ctrl_sec += row["ctrl_sec"] or 0
+        s.dur_sec += _fight_duration_seconds(row["fight__round"] or 0, row["fight__time"] or "")
+    return s
+
+
+def build_summaries(rows):
+    """FighterCareerSummary objects (unsaved) for every fighter in ``rows``."""
+    by_fighter = defaultdict(list)
+    for row in rows:
+        by_fighter[row["fighter_name"]].append(row)
+
+    out = []
+    for fighter, fights in by_fighter.items():
+        # legújabb elöl, ugyanaz a sorrend mint a radar DB backendben
+        fights.sort(
+            key=lambda r: (r["fight__event__date"], r["fight__event__name"], r["fight_id"]),
+            reverse=True,
+        )
+        for window in SUMMARY_WINDOWS:
+            out.append(_summary(fighter, window, fights[:window] if window else fights))
+    return out
+
+
+def refresh_career_summaries(names=None, batch_size: int = 1000) -> int:
+    """
+    Rebuilds the summary rows of ``names`` (all fighters if None) from
+    UFCFightStats in one aggregate query; returns the number of fighters.
+    """
+    if names is not None:
+        names = {n for n in names if n}
+        if not names:
+            return 0
+
+    summaries = build_summaries(_fight_rows(names))
+
+    with transaction.atomic():
+        stale = FighterCareerSummary.objects.all()
+        if names is not None:
+            stale = stale.filter(fighter_name__in=list(names))
+        stale.delete()
+        FighterCareerSummary.objects.bulk_create(summaries, batch_size=batch_size)
+
+    return len(summaries) // len(SUMMARY_WINDOWS)
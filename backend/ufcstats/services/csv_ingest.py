@@ -0,0 +1,180 @@
+"""
+Plain-Python parsers for the ufcstats CSV files.
+
+Each parser turns one file into a list of namedtuples (compact, picklable)
+so the files can be parsed in worker processes and handed to the importers.
+Deliberately free of Django imports: spawned workers only import this module.
+"""
+import csv
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+
+EventRow = namedtuple("EventRow", "name url date location")
+# event_url: az esemény ufcstats URL-je, ha a CSV-ben van ilyen oszlop (különben "")
+FightResultRow = namedtuple(
+    "FightResultRow", "event bout outcome weightclass method round time time_format referee url event_url"
+)
+FightDetailRow = namedtuple("FightDetailRow", "event bout url")
+FighterTottRow = namedtuple("FighterTottRow", "fighter height weight reach url")
+FighterDetailRow = namedtuple("FighterDetailRow", "url nickname first last")
+
+# CSV oszlop -> mező; a stats sorok egész és szöveges (szövegként tárolt "X of Y", "m:ss") értékei
+STATS_INT_COLUMNS = {
+    "KD": "kd",
+    "SUB.ATT": "sub_att",
+    "REV.": "rev",
+}
+STATS_TEXT_COLUMNS = {
+    "SIG.STR.": "sig_str",
+    "SIG.STR. %": "sig_str_pct",
+    "TOTAL STR.": "total_str",
+    "TD": "td",
+    "TD %": "td_pct",
+    "CTRL": "ctrl",
+    "HEAD": "head",
+    "BODY": "body",
+    "LEG": "leg",
+    "DISTANCE": "distance",
+    "CLINCH": "clinch",
+    "GROUND": "ground",
+}
+# ezekből a szöveges oszlopokból lesz <mező>_landed / <mező>_att egész oszloppár
+STATS_OF_FIELDS = ("sig_str", "td", "head", "body", "leg", "distance", "clinch", "ground")
+FightStatsRow = namedtuple(
+    "FightStatsRow",
+    ["event", "bout", "round", "fighter", "url", *STATS_INT_COLUMNS.values(), *STATS_TEXT_COLUMNS.values()],
+)
+
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ("January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"),
+        start=1,
+    )
+}
+
+
+def parse_event_date(s: str):
+    """'December 13, 2025' -> date (no strptime); None if malformed."""
+    try:
+        month, day, year = s.replace(",", " ").split()
+        return date(int(year), _MONTHS[month], int(day))
+    except (KeyError, ValueError):
+        return None
+
+
+def _int(s: str) -> int:
+    try:
+        return int(float(s or 0))
+    except ValueError:
+        return 0
+
+
+def _round_no(s: str) -> int:
+    # "Round 2" / "2" -> 2
+    digits = "".join(ch for ch in s if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def parse_of(s: str):
+    """'10 of 20' -> (10, 20); (0, 0) for '---' / empty."""
+    parts = (s or "").split(" of ")
+    if len(parts) != 2:
+        return 0, 0
+    try:
+        return int(parts[0].strip()), int(parts[1].strip())
+    except ValueError:
+        return 0, 0
+
+
+def parse_mmss(s: str) -> int:
+    """'2:15' -> 135; 0 for '--' / empty."""
+    mm, sep, ss = (s or "").strip().partition(":")
+    try:
+        return int(mm) * 60 + int(ss) if sep else 0
+    except ValueError:
+        return 0
+
+
+def _rows(path, columns):
+    """Stripped cells of ``columns`` per CSV row ("" for a missing column)."""
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        r = csv.reader(f)
+        header = [h.strip() for h in next(r, [])]
+        idx = [header.index(c) if c in header else -1 for c in columns]
+        for raw in r:
+            n = len(raw)
+            yield [raw[i].strip() if 0 <= i < n else "" for i in idx]
+
+
+def parse_events(path):
+    return [
+        EventRow(name, url, parse_event_date(ds), location)
+        for name, url, ds, location in _rows(path, ("EVENT", "URL", "DATE", "LOCATION"))
+    ]
+
+
+def parse_fight_results(path):
+    columns = (
+        "EVENT", "BOUT", "OUTCOME", "WEIGHTCLASS", "METHOD", "ROUND", "TIME", "TIME FORMAT", "REFEREE", "URL",
+        "EVENT URL",
+    )
+    return [FightResultRow(*cells) for cells in _rows(path, columns)]
+
+
+def parse_fight_details(path):
+    return [FightDetailRow(*cells) for cells in _rows(path, ("EVENT", "BOUT", "URL"))]
+
+
+def iter_fight_stats(path):
+    """Lazy FightStatsRow reader: one row in memory at a time (the stats file is the largest)."""
+    columns = ("EVENT", "BOUT", "ROUND", "FIGHTER", "URL", *STATS_INT_COLUMNS, *STATS_TEXT_COLUMNS)
+    n_int = len(STATS_INT_COLUMNS)
+    for cells in _rows(path, columns):
+        ev, bout, rnd, fighter, url = cells[:5]
+        yield FightStatsRow(
+            ev, bout, _round_no(rnd), " ".join(fighter.split()), url,
+            *(_int(v) for v in cells[5:5 + n_int]),
+            *cells[5 + n_int:],
+        )
+
+
+def parse_fight_stats(path):
+    # lista kell: a worker processből picklezve jön vissza
+    return list(iter_fight_stats(path))
+
+
+def parse_fighter_tott(path):
+    return [FighterTottRow(*cells) for cells in _rows(path, ("FIGHTER", "HEIGHT", "WEIGHT", "REACH", "URL"))]
+
+
+def parse_fighter_details(path):
+    return [FighterDetailRow(*cells) for cells in _rows(path, ("URL", "NICKNAME", "FIRST", "LAST"))]
+
+
+def parse_files(jobs: dict, workers: int | None = None) -> dict:
+    """
+    jobs: name -> (parser, path); returns name -> rows (None for a missing file).
+
+    The files are independent, so each one is parsed in its own worker
+    process and the wall-clock time follows the largest file. ``workers``
+    <= 1 parses in-process.
+    """
+    jobs = {name: (parser, Path(path)) for name, (parser, path) in jobs.items()}
+    out = {name: None for name, (_, path) in jobs.items() if not path.exists()}
+    todo = {name: job for name, job in jobs.items() if name not in out}
+
+    if workers is None:
+        workers = min(len(todo), os.cpu_count() or 1)
+    if workers <= 1 or len(todo) <= 1:
+        out.update({name: parser(path) for name, (parser, path) in todo.items()})
+        return out
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(parser, str(path)) for name, (parser, path) in todo.items()}
+        out.update({name: f.result() for name, f in futures.items()})
+    return out
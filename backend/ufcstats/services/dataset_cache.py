@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def files_signature(paths):
+    """(path, mtime_ns, size) per file; None for a missing file."""
+    sig = []
+    for p in paths:
+        try:
+            st = p.stat()
+        except OSError:
+            sig.append((str(p), None))
+            continue
+        sig.append((str(p), st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def signature_version(sig) -> str:
+    """Short id of a ``files_signature()``."""
+    return hashlib.sha1(repr(sig).encode("utf-8")).hexdigest()[:12]
+
+
+class DatasetCache:
+    """
+    Holds one snapshot built from a set of data files and rebuilds it when the
+    files change.
+
+    - The first ``get()`` (or the first after ``cache_clear()``) builds
+      synchronously.
+    - After that, at most every ``UFCSTATS_DATASET_CHECK_INTERVAL`` seconds a
+      ``get()`` stats the files (mtime + size). On a change a background thread
+      builds the new snapshot; until it is ready every caller keeps getting
+      the old one, then the reference is swapped in one assignment.
+
+    ``paths`` is a callable so module-level path constants are read at build
+    time (tests patch them).
+    """
+
+    def __init__(self, build, paths):
+        self._build = build
+        self._paths = paths
+        self._lock = threading.Lock()
+        self._entry = None  # (signature, snapshot)
+        self._checked_at = 0.0
+        self._rebuilding = False
+        self._generation = 0
+
+    def get(self):
+        entry = self._entry
+        if entry is None:
+            return self._load_now()
+
+        interval = getattr(settings, "UFCSTATS_DATASET_CHECK_INTERVAL", 5.0)
+        now = time.monotonic()
+        if now - self._checked_at >= interval:
+            self._checked_at = now
+            sig = files_signature(self._paths())
+            if sig != entry[0]:
+                self._start_rebuild()
+
+        return entry[1]
+
+    @property
+    def version(self) -> str:
+        """Short id of the files the current snapshot was built from."""
+        return signature_version(self._checked_entry()[0])
+
+    @property
+    def last_modified(self):
+        """Newest mtime among the files of the current snapshot (UTC), or None."""
+        entry = self._checked_entry()
+        mtimes = [item[1] for item in entry[0] if item[1] is not None]
+        if not mtimes:
+            return None
+        return datetime.fromtimestamp(max(mtimes) / 1e9, tz=timezone.utc)
+
+    def _checked_entry(self):
+        """
+        (signature, snapshot) after the same interval check as get(): a 304
+        answered from ``version`` alone must still notice changed files.
+        """
+        self.get()
+        entry = self._entry
+        if entry is None:  # közben cache_clear()
+            self._load_now()
+            entry = self._entry
+        return entry
+
+    def cache_clear(self):
+        with self._lock:
+            self._entry = None
+            self._generation += 1
+
+    def reload(self):
+        """
+        Builds a new snapshot now and swaps it in with one assignment;
+        readers keep the old one until then. Returns the new snapshot.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        sig = files_signature(self._paths())
+        snapshot = self._build()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entry = (sig, snapshot)
+                self._checked_at = time.monotonic()
+        return snapshot
+
+    def _load_now(self):
+        with self._lock:
+            if self._entry is None:
+                sig = files_signature(self._paths())
+                self._entry = (sig, self._build())
+                self._checked_at = time.monotonic()
+            return self._entry[1]
+
+    def _start_rebuild(self):
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+            generation = self._generation
+
+        threading.Thread(target=self._rebuild, args=(generation,), daemon=True).start()
+
+    def _rebuild(self, generation):
+        try:
+            sig = files_signature(self._paths())
+            snapshot = self._build()
+        except Exception:
+            logger.exception("Dataset rebuild failed, keeping the previous snapshot.")
+            with self._lock:
+                self._rebuilding = False
+            return
+
+        with self._lock:
+            self._rebuilding = False
+            # cache_clear() közben: ez a build már elavult
+            if generation == self._generation:
+                self._entry = (sig, snapshot)
+
+
+def snapshot_accessor(cache: DatasetCache):
+    """
+    Decorator for ``fn(snapshot)`` -> zero-argument accessor reading the
+    current snapshot. Keeps the ``cache_clear()`` API of the lru_cache
+    functions it replaces.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def accessor():
+            return fn(cache.get())
+
+        accessor.cache_clear = cache.cache_clear
+        return accessor
+
+    return decorator
@@ -0,0 +1,50 @@
+import unicodedata
+
+from django.db import transaction
+
+from ufcstats.models import FighterIdentity
+
+
+def normalize_name(name: str) -> str:
+    """
+    The one fighter-name key used everywhere (registry, radar, importers):
+    accents stripped, lowercase, whitespace collapsed.
+    """
+    s = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode("ascii")
+    return " ".join(s.split()).lower()
+
+
+def rebuild_identities(fighters, batch_size: int = 2000) -> int:
+    """
+    Replaces the identity table. ``fighters``: (display name, ufcstats URL)
+    pairs, e.g. FIRST + LAST from the fighter details CSV and FIGHTER from
+    the tale-of-the-tape CSV. Returns the number of aliases.
+    """
+    display = {}
+    for name, url in fighters:
+        alias = normalize_name(name)
+        url = (url or "").strip()
+        if alias and url:
+            display.setdefault((alias, url), " ".join(name.split()))
+
+    with transaction.atomic():
+        FighterIdentity.objects.all().delete()
+        FighterIdentity.objects.bulk_create(
+            [FighterIdentity(alias=a, url=u, display_name=d) for (a, u), d in display.items()],
+            batch_size=batch_size,
+        )
+    return len(display)
+
+
+def identity_urls() -> dict[str, str]:
+    """alias -> URL for every unambiguous alias, in one query (for bulk jobs)."""
+    out = {}
+    ambiguous = set()
+    for alias, url in FighterIdentity.objects.values_list("alias", "url"):
+        if out.get(alias, url) != url:
+            ambiguous.add(alias)
+        out[alias] = url
+    for alias in ambiguous:
+        del out[alias]
+    return out
+
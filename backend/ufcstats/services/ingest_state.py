@@ -0,0 +1,73 @@
+import hashlib
+import json
+
+from ufcstats.models import UFCSourceRow
+
+
+def row_digest(row: dict) -> str:
+    return hashlib.sha1(
+        json.dumps(row, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class RowDelta:
+    """
+    Row hashes of one source (events, fights, fighters) from the previous
+    import, keyed by URL.
+
+    - ``changed(key, row)`` returns the row's digest when it is new or differs
+      from the stored one, else None.
+    - ``watermark`` is the newest event date seen so far; rows of older events
+      can be skipped without hashing, so a new card only touches its own rows.
+    - ``mark()`` records processed rows, ``save()`` writes them back.
+
+    ``full=True`` ignores both (every row counts as changed).
+    """
+
+    def __init__(self, source: str, full: bool = False):
+        self.source = source
+        self.full = full
+        self._stored = {}
+        newest = None
+        rows = UFCSourceRow.objects.filter(source=source).values_list("id", "key", "digest", "event_date")
+        for pk, key, digest, event_date in rows:
+            self._stored[key] = (pk, digest)
+            if event_date is not None and (newest is None or event_date > newest):
+                newest = event_date
+        self.watermark = None if full else newest
+        self._marked = {}
+
+    def is_before_watermark(self, event_date) -> bool:
+        # ugyanaznapi kártya még bővülhet, ezért szigorúan kisebb
+        wm = self.watermark
+        return wm is not None and event_date is not None and event_date < wm
+
+    def changed(self, key: str, row: dict):
+        digest = row_digest(row)
+        stored = self._stored.get(key)
+        if not self.full and stored is not None and stored[1] == digest:
+            return None
+        return digest
+
+    def mark(self, key: str, digest: str, event_date=None):
+        self._marked[key] = (digest, event_date)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._marked)
+
+    def save(self, batch_size: int = 1000):
+        to_create = []
+        to_update = []
+        for key, (digest, event_date) in self._marked.items():
+            stored = self._stored.get(key)
+            if stored is None:
+                to_create.append(UFCSourceRow(source=self.source, key=key, digest=digest, event_date=event_date))
+            else:
+                to_update.append(UFCSourceRow(id=stored[0], source=self.source, key=key, digest=digest, event_date=event_date))
+
+        if to_create:
+            UFCSourceRow.objects.bulk_create(to_create, batch_size=batch_size)
+        if to_update:
+            UFCSourceRow.objects.bulk_update(to_update, ["digest", "event_date"], batch_size=batch_size)
+        self._marked = {}
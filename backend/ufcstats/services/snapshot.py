@@ -0,0 +1,210 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(settings.BASE_DIR) / "data" / "ufcstats" / "snapshot"
+SNAPSHOT_FORMAT = 8
+
+# SNAPSHOT_DIR/CURRENT -> az aktuális verzió alkönyvtára
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+KEEP_VERSIONS = 2
+
+
+def file_digest(path: Path) -> str | None:
+    try:
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha1").hexdigest()
+    except OSError:
+        return None
+
+
+def file_stat(path: Path) -> list | None:
+    """[size, mtime_ns]: the cheap check before the content hash."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class StringTable:
+    """Interned strings; arrays store ids into ``strings``."""
+
+    def __init__(self):
+        self.strings: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, s: str) -> int:
+        i = self._ids.get(s)
+        if i is None:
+            i = self._ids[s] = len(self.strings)
+            self.strings.append(s)
+        return i
+
+
+def fixed_width_array(strings) -> np.ndarray:
+    """UTF-8 encoded strings as a fixed-width numpy bytes array (mmap-able, no pickle)."""
+    encoded = [s.encode("utf-8") for s in strings]
+    width = max((len(b) for b in encoded), default=0) or 1
+    return np.array(encoded, dtype=f"S{width}")
+
+
+def sorted_strings_array(strings) -> np.ndarray:
+    """fixed_width_array() in byte order, as SortedStrings expects."""
+    return fixed_width_array(sorted(strings, key=lambda s: s.encode("utf-8")))
+
+
+class SortedStrings(Collection):
+    """
+    Read-only string set over a sorted fixed-width bytes array (typically
+    memory-mapped): membership is a binary search, nothing is copied into
+    the process, so every worker shares the file through the page cache.
+    """
+
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    def index(self, s: str) -> int:
+        """Position of ``s``, -1 if absent."""
+        key = s.encode("utf-8")
+        arr = self._array
+        # hosszabb kulcs csonkolva összehasonlítódna
+        if not key or len(key) > arr.dtype.itemsize:
+            return -1
+        i = int(np.searchsorted(arr, key))
+        return i if i < len(arr) and arr[i] == key else -1
+
+    def __getitem__(self, i: int) -> str:
+        return self._array[i].decode("utf-8")
+
+    def __contains__(self, s) -> bool:
+        return isinstance(s, str) and self.index(s) >= 0
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self):
+        return (b.decode("utf-8") for b in self._array)
+
+
+@dataclass(frozen=True)
+class SnapshotPart:
+    arrays: dict
+    strings: list
+
+
+def write_snapshot(parts: dict, sources, directory: Path | None = None) -> Path:
+    """
+    parts: part name -> (arrays dict, StringTable).
+
+    Each call writes a new version directory and then replaces CURRENT, so
+    readers never see a half-written snapshot.
+    """
+    directory = directory or SNAPSHOT_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # a stat a hash előtt: ha közben módosul a fájl, a következő olvasás újrahash-el
+    source_stats = {p.name: file_stat(p) for p in sources}
+    source_digests = {p.name: file_digest(p) for p in sources}
+    version = hashlib.sha1(json.dumps(source_digests, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+    target = directory / version
+    tmp = directory / f".{version}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "sources": source_digests,
+        "source_stats": source_stats,
+        "parts": {},
+    }
+    for part, (arrays, table) in parts.items():
+        for key, arr in arrays.items():
+            np.save(tmp / f"{part}.{key}.npy", np.ascontiguousarray(arr), allow_pickle=False)
+        manifest["parts"][part] = {"arrays": sorted(arrays), "strings": table.strings}
+
+    (tmp / MANIFEST_FILE).write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp, target)
+
+    current_tmp = directory / f".{CURRENT_FILE}.tmp"
+    current_tmp.write_text(version, encoding="utf-8")
+    os.replace(current_tmp, directory / CURRENT_FILE)
+
+    _prune_versions(directory, keep=version)
+    return target
+
+
+def _prune_versions(directory: Path, keep: str):
+    # az előző verziót megtartjuk: egy worker épp most olvashatta ki a régi CURRENT-et
+    others = sorted(
+        (p for p in directory.iterdir() if p.is_dir() and not p.name.startswith(".") and p.name != keep),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for p in others[KEEP_VERSIONS - 1:]:
+        shutil.rmtree(p, ignore_errors=True)
+
+
+def current_version_dir(directory: Path | None = None) -> Path | None:
+    directory = directory or SNAPSHOT_DIR
+    try:
+        version = (directory / CURRENT_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return directory / version if version else None
+
+
+def read_snapshot_part(part: str, sources, directory: Path | None = None) -> SnapshotPart | None:
+    """
+    Memory-mapped arrays + strings of one part, or None when there is no
+    snapshot or it was compiled from different source files. Size and mtime
+    are compared first; only files whose stat differs are hashed, so a plain
+    copy/deploy of the same CSVs keeps the snapshot valid.
+    """
+    version_dir = current_version_dir(directory)
+    if version_dir is None:
+        return None
+
+    try:
+        manifest = json.loads((version_dir / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("format") != SNAPSHOT_FORMAT or part not in manifest.get("parts", {}):
+        return None
+
+    recorded = manifest.get("sources", {})
+    recorded_stats = manifest.get("source_stats", {})
+    for p in sources:
+        if recorded_stats.get(p.name) == file_stat(p) and p.name in recorded:
+            continue
+        if recorded.get(p.name) != file_digest(p):
+            logger.info("ufcstats snapshot is stale for %s, falling back to CSV.", p.name)
+            return None
+
+    meta = manifest["parts"][part]
+    try:
+        arrays = {
+            key: np.load(version_dir / f"{part}.{key}.npy", mmap_mode="r", allow_pickle=False)
+            for key in meta["arrays"]
+        }
+    except (OSError, ValueError):
+        return None
+
+    return SnapshotPart(arrays, meta["strings"])
@@ -0,0 +1,53 @@
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.test import SimpleTestCase, override_settings
+
+from ufcstats.services.dataset_cache import DatasetCache
+
+
+class DatasetCacheTests(SimpleTestCase):
+    def _wait_for(self, cache, expected, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if cache.get() == expected:
+                return
+            time.sleep(0.01)
+        self.fail(f"snapshot never became {expected!r}")
+
+    @override_settings(UFCSTATS_DATASET_CHECK_INTERVAL=0)
+    def test_rebuilds_in_background_when_file_changes(self):
+        with TemporaryDirectory() as td:
+            path = Path(td) / "data.csv"
+            path.write_text("v1", encoding="utf-8")
+
+            cache = DatasetCache(lambda: path.read_text(encoding="utf-8"), lambda: (path,))
+            self.assertEqual(cache.get(), "v1")
+            v1 = cache.version
+
+            path.write_text("v2-longer", encoding="utf-8")
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+            # a régi snapshot azonnal kiszolgálható, az új a háttérben készül
+            self.assertIn(cache.get(), ("v1", "v2-longer"))
+            self._wait_for(cache, "v2-longer")
+            self.assertNotEqual(cache.version, v1)
+
+    @override_settings(UFCSTATS_DATASET_CHECK_INTERVAL=3600)
+    def test_does_not_stat_files_within_interval(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return len(calls)
+
+        cache = DatasetCache(build, lambda: ())
+        self.assertEqual(cache.get(), 1)
+        self.assertEqual(cache.get(), 1)
+        self.assertEqual(len(calls), 1)
+
+        cache.cache_clear()
+        self.assertEqual(cache.get(), 2)
@@ -0,0 +1,90 @@
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ufcstats.api.radar_db import aggregate_for_fighters
+from ufcstats.models import FighterIdentity, UFCEvent, UFCFight, UFCFightStats
+from ufcstats.services.career_summary import refresh_career_summaries
+from ufcstats.services.identity import identity_urls, normalize_name, rebuild_identities
+
+
+class FighterIdentityTests(TestCase):
+    def setUp(self):
+        rebuild_identities([
+            ("Jon Jones", "http://ufcstats.com/fighter-details/jj"),
+            ("José Aldo", "http://ufcstats.com/fighter-details/ja"),
+            ("Bruno Silva", "http://ufcstats.com/fighter-details/bs1"),
+            ("Bruno Silva", "http://ufcstats.com/fighter-details/bs2"),
+            ("Jon  Jones", "http://ufcstats.com/fighter-details/jj"),  # tott duplikátum
+            ("Jonathan Jones", "http://ufcstats.com/fighter-details/jj"),
+        ])
+
+    def test_every_code_path_uses_the_same_key(self):
+        self.assertEqual(normalize_name("  JOSÉ   Aldo "), "jose aldo")
+        self.assertEqual(FighterIdentity.objects.get(alias="jon jones").display_name, "Jon Jones")
+
+        urls = identity_urls()
+        self.assertEqual(urls["jose aldo"], "http://ufcstats.com/fighter-details/ja")
+        self.assertEqual(urls["jon jones"], "http://ufcstats.com/fighter-details/jj")
+        # két azonos nevű fighter: név alapján nem dönthető el
+        self.assertNotIn("bruno silva", urls)
+        self.assertNotIn("nobody", urls)
+
+    def test_db_radar_resolves_names_through_identities(self):
+        ev = UFCEvent.objects.create(event_id=1, name="EV1", date=date(2024, 1, 1), location="")
+        fight = UFCFight.objects.create(event=ev, bout="José Aldo vs. Jon Jones", url="http://x/1", round=1, time="1:00")
+        UFCFightStats.objects.create(fight=fight, fighter_name="José Aldo", round=1, sig_str_landed=3, sig_str_att=4)
+
+        with self.assertNumQueries(2):
+            aggs = aggregate_for_fighters(["jose   ALDO"], last_n=4)
+        self.assertEqual(aggs["jose   ALDO"].sig_landed, 3)
+
+    def test_db_radar_follows_other_aliases_of_the_same_url(self):
+        ev1 = UFCEvent.objects.create(event_id=1, name="EV1", date=date(2024, 1, 1), location="")
+        ev2 = UFCEvent.objects.create(event_id=2, name="EV2", date=date(2024, 2, 1), location="")
+        f1 = UFCFight.objects.create(event=ev1, bout="Jon Jones vs. X", url="http://x/1", round=1, time="1:00")
+        f2 = UFCFight.objects.create(event=ev2, bout="Jonathan Jones vs. Y", url="http://x/2", round=1, time="1:00")
+        # ugyanaz a fighter két írásmóddal a stats táblában
+        UFCFightStats.objects.create(fight=f1, fighter_name="Jon Jones", round=1, sig_str_landed=5)
+        UFCFightStats.objects.create(fight=f2, fighter_name="Jonathan Jones", round=1, sig_str_landed=7)
+        refresh_career_summaries()
+
+        for last_n in (4, 5):
+            aggs = aggregate_for_fighters(["Jonathan Jones", "jon jones"], last_n=last_n)
+            self.assertEqual((aggs["Jonathan Jones"].fights, aggs["Jonathan Jones"].sig_landed), (2, 12))
+            self.assertEqual(aggs["jon jones"], aggs["Jonathan Jones"])
+
+        # last=1: a két írásmód közös utolsó meccse
+        self.assertEqual(aggregate_for_fighters(["Jon Jones"], last_n=1)["Jon Jones"].sig_landed, 7)
+
+    def test_build_command_reads_fighter_csvs(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            details = td / "ufc_fighter_details.csv"
+            tott = td / "ufc_fighter_tott.csv"
+            details.write_text(
+                "FIRST,LAST,NICKNAME,URL\n"
+                "Jon,Jones,Bones,http://ufcstats.com/fighter-details/jj\n",
+                encoding="utf-8",
+            )
+            tott.write_text(
+                "FIGHTER,HEIGHT,WEIGHT,REACH,STANCE,DOB,URL\n"
+                "Jonathan Jones,--,--,--,,,http://ufcstats.com/fighter-details/jj\n",
+                encoding="utf-8",
+            )
+            with patch("fighters.management.commands.import_ufc_fighters.CSV_DETAILS", details), patch(
+                "fighters.management.commands.import_ufc_fighters.CSV_TOTT", tott
+            ):
+                out = StringIO()
+                call_command("build_fighter_identities", stdout=out)
+
+        self.assertIn("aliases=2", out.getvalue())
+        self.assertEqual(identity_urls(), {
+            "jon jones": "http://ufcstats.com/fighter-details/jj",
+            "jonathan jones": "http://ufcstats.com/fighter-details/jj",
+        })
@@ -0,0 +1,359 @@
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from fighters.models import Division, Fighter
+from ufcstats.models import FighterCareerSummary, UFCEvent, UFCFight, UFCFightStats
+from ufcstats.services.career_summary import refresh_career_summaries
+from ufcstats.services.csv_ingest import parse_events, parse_fight_stats, parse_files
+
+COMMANDS = "ufcstats.management.commands"
+
+
+class ImportFightsTests(TestCase):
+    def setUp(self):
+        UFCEvent.objects.create(event_id=1, name="EV1", date=date(2024, 1, 1), location="")
+        UFCEvent.objects.create(event_id=2, name="EV2", date=date(2024, 2, 1), location="")
+
+        self._tmp = TemporaryDirectory()
+        td = Path(self._tmp.name)
+        self.results_csv = td / "ufc_fight_results.csv"
+        self.details_csv = td / "ufc_fight_details.csv"
+        self.stats_csv = td / "ufc_fight_stats.csv"
+
+        # a results CSV-ben az esemény neve végén szóköz van, mint az élő adatban
+        self.results_csv.write_text(
+            "EVENT,BOUT,OUTCOME,WEIGHTCLASS,METHOD,ROUND,TIME,TIME FORMAT,REFEREE,DETAILS,URL\n"
+            "EV1 ,John Doe vs. Jane Roe,W/L,Lightweight Bout,KO/TKO ,1,1:00,3 Rnd (5-5-5),Herb Dean,,http://ufcstats.com/fight-details/1\n"
+            "EV2 ,John Doe vs. Max Moe,W/L,Lightweight Bout,Decision ,3,5:00,3 Rnd (5-5-5),Herb Dean,,http://ufcstats.com/fight-details/2\n"
+            "EV9 ,Unknown vs. Event,W/L,Lightweight Bout,Decision ,3,5:00,3 Rnd (5-5-5),Herb Dean,,http://ufcstats.com/fight-details/9\n",
+            encoding="utf-8",
+        )
+        self.details_csv.write_text(
+            "EVENT,BOUT,URL\n"
+            "EV1,John Doe vs. Jane Roe,http://ufcstats.com/fight-details/1\n"
+            "EV2,John Doe vs. Max Moe,http://ufcstats.com/fight-details/2\n",
+            encoding="utf-8",
+        )
+        self.stats_csv.write_text(
+            "EVENT,BOUT,ROUND,FIGHTER,KD,SIG.STR.,SIG.STR. %,TOTAL STR.,TD,TD %,SUB.ATT,REV.,CTRL\n"
+            "EV1,John Doe vs. Jane Roe,Round 1,John Doe,1,10 of 20,50%,12 of 22,0 of 0,---,0,0,0:10\n"
+            "EV1,John Doe vs. Jane Roe,Round 1,Jane Roe,0,5 of 50,10%,5 of 50,0 of 3,0%,0,0,0:00\n"
+            "EV2,John Doe vs. Max Moe,Round 1,John Doe,0,20 of 30,66%,20 of 30,1 of 2,50%,1,0,1:30\n"
+            "EV2,John Doe vs. Max Moe,Round 2,John Doe,0,10 of 10,100%,10 of 10,---,---,0,1,0:30\n"
+            "EV9,Unknown vs. Event,Round 1,Nobody,0,1 of 1,100%,1 of 1,---,---,0,0,0:00\n",
+            encoding="utf-8",
+        )
+
+        self._patches = [
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_RESULTS", self.results_csv),
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_FIGHT_DETAILS", self.details_csv),
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_STATS", self.stats_csv),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("import_ufc_fights", *args, stdout=out)
+        return out.getvalue()
+
+    def test_dry_run_counts_without_writing(self):
+        out = self._run()
+        self.assertIn("fights_created=2", out)
+        self.assertIn("missing_event=1", out)
+        self.assertIn("stats_created=4", out)
+        self.assertFalse(UFCFight.objects.exists())
+        self.assertFalse(UFCFightStats.objects.exists())
+
+    def test_apply_bulk_creates_fights_and_stats_in_constant_queries(self):
+        # --batch-size 2: a stats és az összesítő sorok két-két INSERT-ben mennek;
+        # a meccsenkénti stats hash egy SELECT + egy INSERT
+        with self.assertNumQueries(21):
+            out = self._run("--apply", "--batch-size", "2")
+        self.assertIn("summaries_refreshed=2", out)
+
+        summary = FighterCareerSummary.objects.get(fighter_name="John Doe", window=0)
+        self.assertEqual((summary.fights, summary.wins, summary.ko_tko_wins, summary.dec_wins), (2, 2, 1, 1))
+        self.assertEqual((summary.sig_landed, summary.dur_sec, summary.last_fight_date), (40, 960, date(2024, 2, 1)))
+        jane = FighterCareerSummary.objects.get(fighter_name="Jane Roe", window=5)
+        self.assertEqual((jane.losses, jane.ko_tko_losses), (1, 1))
+
+        fight = UFCFight.objects.get(url="http://ufcstats.com/fight-details/2")
+        self.assertEqual(fight.event.name, "EV2")
+        self.assertEqual((fight.method, fight.round, fight.time_format), ("Decision", 3, "3 Rnd (5-5-5)"))
+
+        rounds = UFCFightStats.objects.filter(fight=fight).order_by("round")
+        self.assertEqual([(s.round, s.sig_str, s.sub_att, s.rev) for s in rounds], [
+            (1, "20 of 30", 1, 0),
+            (2, "10 of 10", 0, 1),
+        ])
+        self.assertEqual(UFCFightStats.objects.count(), 4)
+        self.assertEqual(
+            [(s.sig_str_landed, s.sig_str_att, s.td_landed, s.td_att, s.ctrl_seconds) for s in rounds],
+            [(20, 30, 1, 2, 90), (10, 10, 0, 0, 30)],
+        )
+
+        # újrafuttatás: semmi sem duplikálódik
+        out = self._run("--apply")
+        self.assertIn("fights_created=0 fights_updated=0 fights_unchanged=2", out)
+        self.assertIn("stats_created=0", out)
+        self.assertEqual(UFCFight.objects.count(), 2)
+        self.assertEqual(UFCFightStats.objects.count(), 4)
+
+    def test_stats_of_older_events_load_after_a_skip_stats_run(self):
+        self._run("--apply", "--skip-stats")
+        self.assertFalse(UFCFightStats.objects.exists())
+
+        # a fights watermark már EV2-n áll, az EV1 statjainak is be kell jönniük
+        out = self._run("--apply")
+        self.assertIn("fights_unchanged=2", out)
+        self.assertIn("stats_created=4", out)
+        self.assertEqual(
+            set(UFCFightStats.objects.values_list("fight__event__name", flat=True)), {"EV1", "EV2"}
+        )
+
+    def test_changed_stats_replace_the_fight_rows_and_duplicates_are_dropped(self):
+        self._run("--apply")
+        self.assertEqual(UFCFightStats.objects.count(), 4)
+
+        # újraszkrépelt EV1 statok: javított érték, plusz egy duplikált sor
+        self.stats_csv.write_text(
+            "EVENT,BOUT,ROUND,FIGHTER,KD,SIG.STR.,SIG.STR. %,TOTAL STR.,TD,TD %,SUB.ATT,REV.,CTRL\n"
+            "EV1,John Doe vs. Jane Roe,Round 1,John Doe,1,12 of 20,60%,14 of 22,0 of 0,---,0,0,0:10\n"
+            "EV1,John Doe vs. Jane Roe,Round 1,John Doe,1,12 of 20,60%,14 of 22,0 of 0,---,0,0,0:10\n"
+            "EV1,John Doe vs. Jane Roe,Round 1,Jane Roe,0,5 of 50,10%,5 of 50,0 of 3,0%,0,0,0:00\n"
+            "EV2,John Doe vs. Max Moe,Round 1,John Doe,0,20 of 30,66%,20 of 30,1 of 2,50%,1,0,1:30\n"
+            "EV2,John Doe vs. Max Moe,Round 2,John Doe,0,10 of 10,100%,10 of 10,---,---,0,1,0:30\n",
+            encoding="utf-8",
+        )
+        out = self._run("--apply")
+        self.assertIn("stats_created=2 stats_replaced=1 stats_skipped=3", out)
+        self.assertEqual(UFCFightStats.objects.count(), 4)
+        john = UFCFightStats.objects.get(fight__url="http://ufcstats.com/fight-details/1", fighter_name="John Doe")
+        self.assertEqual((john.sig_str, john.sig_str_landed), ("12 of 20", 12))
+        summary = FighterCareerSummary.objects.get(fighter_name="John Doe", window=0)
+        self.assertEqual(summary.sig_landed, 42)
+
+        # --full: minden meccs statjai újratöltődnek, duplikátum nélkül
+        out = self._run("--apply", "--full")
+        self.assertIn("stats_created=4 stats_replaced=2 stats_skipped=1", out)
+        self.assertEqual(UFCFightStats.objects.count(), 4)
+
+    def test_handle_streams_the_stats_csv(self):
+        from ufcstats.management.commands.import_ufc_fights import Command
+
+        with patch.object(Command, "sync") as sync:
+            call_command("import_ufc_fights", stdout=StringIO())
+        stats = sync.call_args.args[2]
+        # generátor, nem lista: a stats CSV soronként jön
+        self.assertFalse(isinstance(stats, list))
+        self.assertEqual(next(stats).fighter, "John Doe")
+        self.assertEqual(len(list(stats)), 4)
+
+    def test_fights_link_to_events_by_url_and_report_ambiguous_names(self):
+        UFCEvent.objects.create(event_id=3, name="Dup", url="http://ufcstats.com/event-details/a", date=date(2020, 1, 1), location="")
+        second = UFCEvent.objects.create(
+            event_id=4, name="Dup", url="http://ufcstats.com/event-details/b", date=date(2021, 1, 1), location="",
+        )
+        self.results_csv.write_text(
+            "EVENT,BOUT,OUTCOME,WEIGHTCLASS,METHOD,ROUND,TIME,TIME FORMAT,REFEREE,DETAILS,URL,EVENT URL\n"
+            "Dup,A vs. B,W/L,Lightweight Bout,KO/TKO,1,1:00,3 Rnd (5-5-5),Herb Dean,,http://ufcstats.com/fight-details/a,"
+            "http://ufcstats.com/event-details/b\n"
+            "Dup,C vs. D,W/L,Lightweight Bout,KO/TKO,1,1:00,3 Rnd (5-5-5),Herb Dean,,http://ufcstats.com/fight-details/c,\n"
+            "EV1,John Doe vs. Jane Roe,W/L,Lightweight Bout,KO/TKO,1,1:00,3 Rnd (5-5-5),Herb Dean,,"
+            "http://ufcstats.com/fight-details/1,\n",
+            encoding="utf-8",
+        )
+        out, err = StringIO(), StringIO()
+        call_command("import_ufc_fights", "--apply", "--skip-stats", stdout=out, stderr=err)
+
+        self.assertIn("fights_created=2", out.getvalue())
+        self.assertIn("ambiguous_event=1", out.getvalue())
+        self.assertIn("Ambiguous event name (several events, no EVENT URL in the CSV): Dup", err.getvalue())
+        self.assertEqual(UFCFight.objects.get(url="http://ufcstats.com/fight-details/a").event, second)
+        # URL nélküli sor, egyértelmű név: név szerinti tartalék
+        self.assertEqual(UFCFight.objects.get(url="http://ufcstats.com/fight-details/1").event.name, "EV1")
+        self.assertFalse(UFCFight.objects.filter(url="http://ufcstats.com/fight-details/c").exists())
+
+
+class ImportEventsTests(TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        self.events_csv = Path(self._tmp.name) / "ufc_event_details.csv"
+        self.events_csv.write_text(
+            "EVENT,URL,DATE,LOCATION\n"
+            "EV2,http://ufcstats.com/event-details/2,\"February 01, 2024\",\"Las Vegas, Nevada, USA\"\n"
+            "EV1,http://ufcstats.com/event-details/1,\"January 01, 2024\",\"Paris, France\"\n"
+            "EV3,http://ufcstats.com/event-details/3,\"March 01, 2024\",\"London, England\"\n"
+            "Broken,,\"March 01, 2024\",\n",
+            encoding="utf-8",
+        )
+        self._patch = patch(f"{COMMANDS}.import_ufc_events.CSV_EVENTS", self.events_csv)
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("import_ufc_events", *args, stdout=out)
+        return out.getvalue()
+
+    def test_upsert_runs_in_constant_queries(self):
+        # régi, URL nélküli sor: név alapján párosul és megkapja az URL-t
+        UFCEvent.objects.create(event_id=7, name="EV1", date=date(2023, 12, 31), location="Paris, France")
+        UFCEvent.objects.create(
+            event_id=8, name="EV2", url="http://ufcstats.com/event-details/2",
+            date=date(2024, 2, 1), location="Las Vegas, Nevada, USA",
+        )
+
+        # +1 SELECT: az átdatált EV1 fighterei (összesítő frissítéshez)
+        with self.assertNumQueries(8):
+            out = self._run("--apply")
+        self.assertIn("created=1 updated=1 skipped=1", out)
+
+        ev1 = UFCEvent.objects.get(name="EV1")
+        self.assertEqual((ev1.event_id, ev1.url, ev1.date), (7, "http://ufcstats.com/event-details/1", date(2024, 1, 1)))
+        self.assertEqual(UFCEvent.objects.get(name="EV3").event_id, 9)
+
+        # változatlan CSV: csak a két SELECT fut
+        with self.assertNumQueries(2):
+            out = self._run("--apply")
+        self.assertIn("created=0 updated=0 skipped=1 unchanged=3", out)
+
+    def test_dry_run_does_not_write(self):
+        out = self._run()
+        self.assertIn("created=3 updated=0", out)
+        self.assertFalse(UFCEvent.objects.exists())
+
+    def test_redated_event_refreshes_the_summaries_of_its_fighters(self):
+        self._run("--apply")
+        ev1 = UFCEvent.objects.get(name="EV1")
+        ev2 = UFCEvent.objects.get(name="EV2")
+        for n, event in enumerate((ev1, ev2)):
+            fight = UFCFight.objects.create(event=event, bout=f"John Doe vs. X{n}", url=f"http://ufcstats.com/fight-details/{n}")
+            UFCFightStats.objects.create(fight=fight, round=1, fighter_name="John Doe")
+        refresh_career_summaries()
+        summary = FighterCareerSummary.objects.get(fighter_name="John Doe", window=0)
+        self.assertEqual(summary.last_fight_date, date(2024, 2, 1))
+
+        # EV1 átkerül EV2 utánra: az utolsó meccs most már az EV1-es
+        self.events_csv.write_text(
+            "EVENT,URL,DATE,LOCATION\n"
+            "EV1,http://ufcstats.com/event-details/1,\"March 02, 2024\",\"Paris, France\"\n"
+            "EV2,http://ufcstats.com/event-details/2,\"February 01, 2024\",\"Las Vegas, Nevada, USA\"\n",
+            encoding="utf-8",
+        )
+        out = self._run("--apply", "--full")
+        self.assertIn("updated=1", out)
+        self.assertIn("summaries_refreshed=1", out)
+        summary = FighterCareerSummary.objects.get(fighter_name="John Doe", window=0)
+        self.assertEqual(summary.last_fight_date, date(2024, 3, 2))
+
+    def test_delta_run_touches_only_rows_after_the_watermark(self):
+        self._run("--apply")
+
+        # EV1 (régi kártya) helyszíne változik, EV4 új kártya
+        self.events_csv.write_text(
+            "EVENT,URL,DATE,LOCATION\n"
+            "EV4,http://ufcstats.com/event-details/4,\"April 01, 2024\",\"Tokyo, Japan\"\n"
+            "EV3,http://ufcstats.com/event-details/3,\"March 01, 2024\",\"London, England\"\n"
+            "EV2,http://ufcstats.com/event-details/2,\"February 01, 2024\",\"Las Vegas, Nevada, USA\"\n"
+            "EV1,http://ufcstats.com/event-details/1,\"January 01, 2024\",\"Lyon, France\"\n",
+            encoding="utf-8",
+        )
+        out = self._run("--apply")
+        self.assertIn("created=1 updated=0 skipped=0 unchanged=3", out)
+        self.assertEqual(UFCEvent.objects.get(name="EV1").location, "Paris, France")
+
+        out = self._run("--apply", "--full")
+        self.assertIn("created=0 updated=1", out)
+        self.assertEqual(UFCEvent.objects.get(name="EV1").location, "Lyon, France")
+
+
+class ImportUfcstatsTests(TestCase):
+    def setUp(self):
+        self._tmp = TemporaryDirectory()
+        td = Path(self._tmp.name)
+        files = {
+            "events": ("ufc_event_details.csv",
+                       "EVENT,URL,DATE,LOCATION\n"
+                       "EV1,http://ufcstats.com/event-details/1,\"January 01, 2024\",\"Paris, France\"\n"),
+            "results": ("ufc_fight_results.csv",
+                        "EVENT,BOUT,OUTCOME,WEIGHTCLASS,METHOD,ROUND,TIME,TIME FORMAT,REFEREE,DETAILS,URL\n"
+                        "EV1 ,John Doe vs. Jane Roe,W/L,Lightweight Bout,KO/TKO ,1,1:00,3 Rnd (5-5-5),Herb Dean,,"
+                        "http://ufcstats.com/fight-details/1\n"),
+            "details": ("ufc_fight_details.csv", "EVENT,BOUT,URL\n"),
+            "stats": ("ufc_fight_stats.csv",
+                      "EVENT,BOUT,ROUND,FIGHTER,KD,SIG.STR.,TD,SUB.ATT,REV.,CTRL\n"
+                      "EV1,John Doe vs. Jane Roe,Round 1,John  Doe,1,10 of 20,0 of 0,0,0,0:10\n"),
+            "tott": ("ufc_fighter_tott.csv",
+                     "FIGHTER,HEIGHT,WEIGHT,REACH,STANCE,DOB,URL\n"
+                     "John Doe,--,155 lbs.,--,,,http://ufcstats.com/fighter-details/jd\n"),
+            "fighters": ("ufc_fighter_details.csv",
+                         "FIRST,LAST,NICKNAME,URL\n"
+                         "John,Doe,The Test,http://ufcstats.com/fighter-details/jd\n"),
+        }
+        self.paths = {}
+        for key, (name, content) in files.items():
+            self.paths[key] = td / name
+            self.paths[key].write_text(content, encoding="utf-8")
+
+        self._patches = [
+            patch(f"{COMMANDS}.import_ufc_events.CSV_EVENTS", self.paths["events"]),
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_RESULTS", self.paths["results"]),
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_FIGHT_DETAILS", self.paths["details"]),
+            patch(f"{COMMANDS}.import_ufc_fights.CSV_STATS", self.paths["stats"]),
+            patch("fighters.management.commands.import_ufc_fighters.CSV_TOTT", self.paths["tott"]),
+            patch("fighters.management.commands.import_ufc_fighters.CSV_DETAILS", self.paths["fighters"]),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def test_parallel_parse_matches_in_process_parse(self):
+        jobs = {
+            "events": (parse_events, self.paths["events"]),
+            "stats": (parse_fight_stats, self.paths["stats"]),
+            "missing": (parse_events, self.paths["events"].with_name("nope.csv")),
+        }
+        parallel = parse_files(jobs, workers=2)
+        self.assertEqual(parallel, parse_files(jobs, workers=1))
+        self.assertIsNone(parallel["missing"])
+
+        row = parallel["stats"][0]
+        self.assertEqual((row.fighter, row.round, row.kd, row.sig_str, row.head), ("John Doe", 1, 1, "10 of 20", ""))
+        self.assertEqual(parallel["events"][0].date, date(2024, 1, 1))
+
+    def test_full_refresh_imports_every_source(self):
+        division = Division.objects.create(name="Lightweight", min_weight="66.00", max_weight="70.00")
+        fighter = Fighter.objects.create(
+            name="John Doe", division=division, age=30, weight="70.00", height="180.00",
+        )
+
+        out = StringIO()
+        call_command("import_ufcstats", "--apply", "--workers", "2", stdout=out)
+
+        self.assertEqual(UFCEvent.objects.get().url, "http://ufcstats.com/event-details/1")
+        fight = UFCFight.objects.get()
+        self.assertEqual(fight.event.name, "EV1")
+        self.assertEqual(UFCFightStats.objects.get(fight=fight).fighter_name, "John Doe")
+
+        fighter.refresh_from_db()
+        self.assertEqual((fighter.nickname, float(fighter.weight)), ("The Test", 70.31))
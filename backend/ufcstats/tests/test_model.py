@@ -1,8 +1,10 @@
+import os
+import time
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, override_settings
 from rest_framework.test import APIRequestFactory
 
 from ufcstats.api.ufc_radar import (
@@ -15,7 +17,10 @@ from ufcstats.api.ufc_radar import (
     _parse_time_mmss,
     _pct,
     _per15,
+    _radar_engine,
     ufc_radar,
+    ufc_radar_batch,
+    ufc_radar_rounds,
 )
 
 
@@ -52,6 +57,7 @@ class RadarCsvIntegrationTests(SimpleTestCase):
         # Clear caches before each test, otherwise lru_cache keeps old file content
         _event_dates_map.cache_clear()
         _fight_results_map.cache_clear()
+        _radar_engine.cache_clear()
 
     def _write(self, path: Path, content: str):
         path.write_text(content, encoding="utf-8")
@@ -138,6 +144,87 @@ class RadarCsvIntegrationTests(SimpleTestCase):
                 self.assertEqual(agg.ctrl_sec, 30)
                 self.assertEqual(agg.dur_sec, 60)
 
+    def test_index_sums_rounds_per_bout(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(events_csv, "EVENT,DATE\nEV1,\"January 01, 2024\"\n")
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,Win,Decision,2,5:00,Lightweight\n",
+            )
+
+            # Round-level rows: one bout, two rounds
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,0,10 of 20,1 of 2,0:30\n"
+                "EV1,B1,John Doe,0,1,5 of 10,0 of 1,1:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                agg = _aggregate_for_fighter("  john   DOE ", last_n=5)
+                self.assertIsNotNone(agg)
+                self.assertEqual(agg.fights, 1)
+                self.assertEqual(agg.kd, 1)
+                self.assertEqual(agg.sub_att, 1)
+                self.assertEqual(agg.sig_landed, 15)
+                self.assertEqual(agg.sig_att, 30)
+                self.assertEqual(agg.ctrl_sec, 90)
+                self.assertEqual(agg.dur_sec, 600)
+
+    def test_engine_bulk_totals_match_single_lookups(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(
+                events_csv,
+                "EVENT,DATE\n"
+                "EV1,\"January 01, 2024\"\n"
+                "EV2,\"February 01, 2024\"\n",
+            )
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,W/L,KO,1,1:00,Lightweight\n"
+                "EV2,B2,W/L,Decision,3,5:00,Lightweight\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,0,10 of 20,0 of 0,0:00\n"
+                "EV2,B2,John Doe,0,1,30 of 40,2 of 4,3:00\n"
+                "EV2,B2,Jane Roe,0,0,5 of 50,0 of 0,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                engine = _radar_engine()
+                self.assertEqual(engine.display_names, ["Jane Roe", "John Doe"])
+
+                # last=1 -> only the EV2 bout (newest)
+                agg = _aggregate_for_fighter("John Doe", last_n=1)
+                self.assertEqual((agg.fights, agg.sig_landed, agg.dur_sec), (1, 30, 900))
+
+                metrics = engine.metrics_all(last_n=2)
+                self.assertEqual(list(metrics["fights_count"]), [1, 2])
+                self.assertEqual(list(metrics["duration_total_sec"]), [900, 960])
+                self.assertAlmostEqual(metrics["sig_str_acc_pct"][0], 10.0)
+                self.assertAlmostEqual(metrics["sig_str_acc_pct"][1], 40 / 60 * 100)
+                self.assertAlmostEqual(metrics["kd_per15"][1], _per15(1, 960))
+
     def test_view_returns_400_when_missing_fighter(self):
         factory = APIRequestFactory()
         request = factory.get("/api/ufc/radar")
@@ -165,3 +252,354 @@ class RadarCsvIntegrationTests(SimpleTestCase):
                 request = factory.get("/api/ufc/radar?fighter=John%20Doe&last=5")
                 response = ufc_radar(request)
                 self.assertEqual(response.status_code, 404)
+
+    def test_batch_view_returns_results_in_request_order(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(events_csv, "EVENT,DATE\nEV1,\"January 01, 2024\"\n")
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,A vs. B,W/L,KO,1,1:00,Lightweight\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,A vs. B,Fighter A,1,0,10 of 20,0 of 0,0:00\n"
+                "EV1,A vs. B,Fighter B,0,0,2 of 8,0 of 1,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+
+                request = factory.get(
+                    "/api/ufc/radar/batch/?fighter=Fighter%20B&fighter=Nobody&fighter=Fighter%20A&last=5"
+                )
+                response = ufc_radar_batch(request)
+                self.assertEqual(response.status_code, 200)
+                results = response.data["results"]
+                self.assertEqual([r["fighter"] for r in results], ["Fighter B", "Nobody", "Fighter A"])
+                self.assertEqual(results[0]["metrics"]["sig_str_acc_pct"], 25.0)
+                self.assertIn("error", results[1])
+                self.assertEqual(results[2]["metrics"]["kd_per15"], 15.0)
+
+                request = factory.post(
+                    "/api/ufc/radar/batch/", {"fighters": ["Fighter A"], "last": 1}, format="json"
+                )
+                response = ufc_radar_batch(request)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["last"], 1)
+                self.assertEqual(response.data["results"][0]["fights_count"], 1)
+
+    def test_batch_view_returns_400_when_no_fighters(self):
+        factory = APIRequestFactory()
+        response = ufc_radar_batch(factory.get("/api/ufc/radar/batch/"))
+        self.assertEqual(response.status_code, 400)
+
+    def test_view_honors_if_none_match_before_aggregating(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(events_csv, "EVENT,DATE\nEV1,\"January 01, 2024\"\n")
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,Win,KO,1,1:00,Lightweight\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,2,10 of 20,1 of 3,0:30\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+                url = "/api/ufc/radar/?fighter=John%20Doe&last=5"
+
+                response = ufc_radar(factory.get(url))
+                self.assertEqual(response.status_code, 200)
+                etag = response["ETag"]
+                self.assertTrue(response.has_header("Last-Modified"))
+
+                with patch("ufcstats.api.ufc_radar._aggregate_many") as aggregate:
+                    response = ufc_radar(factory.get(url, HTTP_IF_NONE_MATCH=etag))
+                    self.assertEqual(response.status_code, 304)
+                    aggregate.assert_not_called()
+
+                other = ufc_radar(factory.get("/api/ufc/radar/?fighter=John%20Doe&last=3"))
+                self.assertNotEqual(other["ETag"], etag)
+
+    @override_settings(UFCSTATS_DATASET_CHECK_INTERVAL=0)
+    def test_conditional_requests_pick_up_changed_csv_files(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(events_csv, "EVENT,DATE\nEV1,\"January 01, 2024\"\n")
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,Win,KO,1,1:00,Lightweight\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,2,10 of 20,1 of 3,0:30\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+                url = "/api/ufc/radar/?fighter=John%20Doe&last=5"
+                etag = ufc_radar(factory.get(url))["ETag"]
+
+                # a kis- és nagybetűs név más választ ad, így más ETag-et is
+                self.assertNotEqual(ufc_radar(factory.get("/api/ufc/radar/?fighter=john%20doe&last=5"))["ETag"], etag)
+
+                self._write(
+                    stats_csv,
+                    "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                    "EV1,B1,John Doe,3,2,10 of 20,1 of 3,0:30\n",
+                )
+                st = stats_csv.stat()
+                os.utime(stats_csv, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+                # csak feltételes kérések: a háttérben újraépített adatnak így is meg kell jönnie
+                deadline = time.monotonic() + 2.0
+                while True:
+                    response = ufc_radar(factory.get(url, HTTP_IF_NONE_MATCH=etag))
+                    if response.status_code != 304 or time.monotonic() > deadline:
+                        break
+                    time.sleep(0.01)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], etag)
+                self.assertEqual(response.data["metrics"]["kd_per15"], 45.0)
+
+    def test_view_returns_division_percentiles(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(events_csv, "EVENT,DATE\nEV1,\"January 01, 2024\"\n")
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,A vs. B,W/L,Decision,3,5:00,UFC Lightweight Title Bout\n"
+                "EV1,C vs. D,W/L,Decision,3,5:00,Lightweight Bout\n"
+                "EV1,E vs. F,W/L,Decision,3,5:00,Women's Flyweight Bout\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,A vs. B,Fighter A,0,0,40 of 100,0 of 0,0:00\n"
+                "EV1,A vs. B,Fighter B,0,0,10 of 100,0 of 0,0:00\n"
+                "EV1,C vs. D,Fighter C,0,0,20 of 100,0 of 0,0:00\n"
+                "EV1,C vs. D,Fighter D,0,0,30 of 100,0 of 0,0:00\n"
+                "EV1,E vs. F,Fighter E,0,0,99 of 100,0 of 0,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+                response = ufc_radar(factory.get("/api/ufc/radar/?fighter=Fighter%20A&last=5&percentiles=1"))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["division"], "Lightweight")
+                self.assertEqual(response.data["division_size"], 4)
+                # A a legjobb a 4 lightweight közül: (3 + 4) / 2 / 4 = 87.5
+                self.assertEqual(response.data["percentiles"]["sig_str_acc_pct"], 87.5)
+
+                response = ufc_radar(factory.get("/api/ufc/radar/?fighter=Fighter%20E&last=5"))
+                self.assertNotIn("percentiles", response.data)
+
+                response = ufc_radar(factory.get("/api/ufc/radar/?fighter=Fighter%20A&last=5&percentiles=division"))
+                self.assertEqual(response.data["percentiles"]["sig_str_acc_pct"], 87.5)
+
+    def test_view_filters_by_date_range_weightclass_and_title(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(
+                events_csv,
+                "EVENT,DATE\n"
+                "EV1,\"January 01, 2021\"\n"
+                "EV2,\"January 01, 2022\"\n"
+                "EV3,\"January 01, 2023\"\n"
+                "EV4,\"January 01, 2024\"\n",
+            )
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,W/L,KO,1,1:00,Featherweight Bout\n"
+                "EV2,B2,W/L,KO,1,1:00,Lightweight Bout\n"
+                "EV3,B3,W/L,KO,1,1:00,UFC Lightweight Title Bout\n"
+                "EV4,B4,W/L,KO,1,1:00,Lightweight Bout\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,0,1 of 2,0 of 0,0:00\n"
+                "EV2,B2,John Doe,2,0,1 of 2,0 of 0,0:00\n"
+                "EV3,B3,John Doe,4,0,1 of 2,0 of 0,0:00\n"
+                "EV4,B4,John Doe,8,0,1 of 2,0 of 0,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+
+                def get(qs):
+                    return ufc_radar(factory.get(f"/api/ufc/radar/?fighter=John%20Doe&{qs}"))
+
+                # 2022-2023: EV2 + EV3, 'last' nélkül minden illeszkedő meccs
+                response = get("since=2022-01-01&until=2023-12-31")
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["fights_count"], 2)
+                self.assertEqual(response.data["metrics"]["kd_per15"], round(6 / 2 * 15, 3))
+                self.assertEqual(response.data["filters"]["since"], "2022-01-01")
+
+                response = get("weightclass=lightweight&last=2")
+                self.assertEqual(response.data["fights_count"], 2)
+                self.assertEqual(response.data["metrics"]["kd_per15"], round(12 / 2 * 15, 3))
+
+                response = get("title=1")
+                self.assertEqual(response.data["fights_count"], 1)
+                self.assertEqual(response.data["metrics"]["kd_per15"], 60.0)
+
+                # a "division" csak a percentiles paraméternél érvényes
+                response = get("title=division&last=5")
+                self.assertEqual(response.data["fights_count"], 4)
+                self.assertNotIn("filters", response.data)
+
+                self.assertEqual(get("since=2030-01-01").status_code, 404)
+                self.assertEqual(get("since=yesterday").status_code, 400)
+                self.assertEqual(get("weightclass=Sumo").status_code, 400)
+
+    def test_date_filters_exclude_bouts_of_unknown_date(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            # EV9 nincs az events CSV-ben: ismeretlen dátum (ordinal 0)
+            self._write(
+                events_csv,
+                "EVENT,DATE\n"
+                "EV1,\"January 01, 2021\"\n"
+                "EV2,\"January 01, 2022\"\n",
+            )
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,W/L,KO,1,1:00,Lightweight Bout\n"
+                "EV2,B2,W/L,KO,1,1:00,Lightweight Bout\n"
+                "EV9,B9,W/L,KO,1,1:00,Lightweight Bout\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,0,1 of 2,0 of 0,0:00\n"
+                "EV2,B2,John Doe,2,0,1 of 2,0 of 0,0:00\n"
+                "EV9,B9,John Doe,4,0,1 of 2,0 of 0,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+
+                def get(qs):
+                    return ufc_radar(factory.get(f"/api/ufc/radar/?fighter=John%20Doe&{qs}"))
+
+                self.assertEqual(get("last=5").data["fights_count"], 3)
+
+                response = get("until=2021-12-31")
+                self.assertEqual(response.data["fights_count"], 1)
+                self.assertEqual(response.data["metrics"]["kd_per15"], 15.0)
+
+                response = get("since=2022-01-01")
+                self.assertEqual(response.data["fights_count"], 1)
+                self.assertEqual(response.data["metrics"]["kd_per15"], 30.0)
+
+                self.assertEqual(get("since=2021-01-01&until=2022-12-31").data["fights_count"], 2)
+
+    def test_rounds_view_splits_metrics_by_round(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+
+            self._write(
+                events_csv,
+                "EVENT,DATE\n"
+                "EV1,\"January 01, 2024\"\n"
+                "EV2,\"February 01, 2024\"\n",
+            )
+            # EV1: 2. menetben 1:00-kor vége, EV2: 5 menet döntés
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,W/L,KO,2,1:00,Lightweight Bout\n"
+                "EV2,B2,W/L,Decision,5,5:00,UFC Lightweight Title Bout\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,ROUND,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,Round 1,John Doe,0,0,10 of 20,0 of 0,0:00\n"
+                "EV1,B1,Round 2,John Doe,1,0,5 of 5,0 of 0,0:00\n"
+                "EV2,B2,Round 1,John Doe,0,0,10 of 10,0 of 0,0:00\n"
+                "EV2,B2,Round 2,John Doe,0,0,0 of 0,0 of 0,0:00\n"
+                "EV2,B2,Round 3,John Doe,0,0,0 of 0,0 of 0,0:00\n"
+                "EV2,B2,Round 4,John Doe,0,0,4 of 8,0 of 0,0:00\n"
+                "EV2,B2,Round 5,John Doe,0,0,2 of 8,0 of 0,0:00\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv):
+                factory = APIRequestFactory()
+                response = ufc_radar_rounds(factory.get("/api/ufc/radar/rounds/?fighter=John%20Doe&last=5"))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data["fights_count"], 2)
+
+                rounds = {r["round"]: r for r in response.data["rounds"]}
+                self.assertEqual(sorted(rounds), [1, 2, 3, 4, 5])
+                self.assertEqual(rounds[1]["fights_count"], 2)
+                self.assertEqual(rounds[1]["duration_total_sec"], 600)
+                self.assertEqual(rounds[1]["metrics"]["sig_str_acc_pct"], round(20 / 30 * 100, 2))
+                # 2. menet: EV1-ben csak 60 mp, EV2-ben teljes 300
+                self.assertEqual(rounds[2]["duration_total_sec"], 360)
+                self.assertEqual(rounds[2]["metrics"]["kd_per15"], round(1 / 6 * 15, 3))
+                self.assertEqual(rounds[4]["fights_count"], 1)
+
+                championship = response.data["championship_rounds"]
+                self.assertEqual(championship["fights_count"], 1)
+                self.assertEqual(championship["duration_total_sec"], 600)
+                self.assertEqual(championship["metrics"]["sig_str_acc_pct"], 37.5)
+
+                # az összesített radar ugyanaz marad
+                agg = _aggregate_for_fighter("John Doe", last_n=5)
+                self.assertEqual((agg.sig_landed, agg.dur_sec), (31, 60 + 300 + 1500))
@@ -0,0 +1,116 @@
+from datetime import date
+from importlib import import_module
+
+from django.apps import apps
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from ufcstats.api.radar_db import aggregate_for_fighters
+from ufcstats.services.career_summary import refresh_career_summaries
+from ufcstats.api.ufc_radar import ufc_radar, ufc_radar_batch
+from ufcstats.models import UFCEvent, UFCFight, UFCFightStats
+
+
+class RadarDbBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ev1 = UFCEvent.objects.create(event_id=1, name="EV1", date=date(2024, 1, 1), location="")
+        ev2 = UFCEvent.objects.create(event_id=2, name="EV2", date=date(2024, 2, 1), location="")
+
+        f1 = UFCFight.objects.create(
+            event=ev1, bout="John Doe vs. Jane Roe", url="http://ufcstats.com/fight-details/1",
+            round=1, time="1:00",
+        )
+        f2 = UFCFight.objects.create(
+            event=ev2, bout="John Doe vs. Max Moe", url="http://ufcstats.com/fight-details/2",
+            round=3, time="5:00",
+        )
+
+        UFCFightStats.objects.create(
+            fight=f1, fighter_name="John Doe", round=1, kd=1, sub_att=0,
+            sig_str="10 of 20", td="0 of 0", ctrl="0:00",
+            sig_str_landed=10, sig_str_att=20,
+        )
+        # f2: két menet ugyanarra a meccsre -> össze kell adni
+        UFCFightStats.objects.create(
+            fight=f2, fighter_name="John Doe", round=1, kd=0, sub_att=1,
+            sig_str="20 of 30", td="1 of 2", ctrl="1:30",
+            sig_str_landed=20, sig_str_att=30, td_landed=1, td_att=2, ctrl_seconds=90,
+        )
+        UFCFightStats.objects.create(
+            fight=f2, fighter_name="John Doe", round=2, kd=0, sub_att=0,
+            sig_str="10 of 10", td="---", ctrl="0:30",
+            sig_str_landed=10, sig_str_att=10, ctrl_seconds=30,
+        )
+        UFCFightStats.objects.create(
+            fight=f1, fighter_name="Jane Roe", round=1, kd=0, sub_att=0,
+            sig_str="5 of 50", td="0 of 3", ctrl="0:00",
+            sig_str_landed=5, sig_str_att=50, td_att=3,
+        )
+
+    def test_last_n_uses_newest_fights_and_sums_rounds(self):
+        aggs = aggregate_for_fighters(["John Doe"], last_n=1)
+        agg = aggs["John Doe"]
+        self.assertEqual(agg.fights, 1)
+        self.assertEqual(agg.sig_landed, 30)
+        self.assertEqual(agg.sig_att, 40)
+        self.assertEqual(agg.td_landed, 1)
+        self.assertEqual(agg.td_att, 2)
+        self.assertEqual(agg.sub_att, 1)
+        self.assertEqual(agg.ctrl_sec, 120)
+        self.assertEqual(agg.dur_sec, 900)
+
+    def test_many_fighters_in_one_query(self):
+        # last=4: nincs materializált ablak -> identity + nyers stats lekérdezés
+        with self.assertNumQueries(2):
+            aggs = aggregate_for_fighters(["John Doe", "Jane Roe", "Nobody"], last_n=4)
+
+        self.assertEqual(aggs["John Doe"].fights, 2)
+        self.assertEqual(aggs["John Doe"].kd, 1)
+        self.assertEqual(aggs["John Doe"].dur_sec, 960)
+        self.assertEqual(aggs["Jane Roe"].td_att, 3)
+        self.assertIsNone(aggs["Nobody"])
+
+    @override_settings(UFC_RADAR_BACKEND="db")
+    def test_views_use_db_backend_when_configured(self):
+        factory = APIRequestFactory()
+
+        response = ufc_radar(factory.get("/api/ufc/radar/?fighter=John%20Doe&last=5"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["fights_count"], 2)
+        self.assertEqual(response.data["duration_total_sec"], 960)
+
+        response = ufc_radar_batch(
+            factory.get("/api/ufc/radar/batch/?fighter=Jane%20Roe&fighter=Nobody&last=5")
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["metrics"]["sig_str_acc_pct"], 10.0)
+        self.assertIn("error", response.data["results"][1])
+
+    def test_data_migration_fills_numeric_columns_from_text(self):
+        migration = import_module("ufcstats.migrations.0006_fill_ufcfightstats_numeric_columns")
+        UFCFightStats.objects.update(sig_str_landed=0, sig_str_att=0, td_landed=0, td_att=0, ctrl_seconds=0)
+        UFCFightStats.objects.filter(fighter_name="Jane Roe").update(head="3 of 7")
+
+        migration.fill_numeric_columns(apps, None)
+
+        aggs = aggregate_for_fighters(["John Doe"], last_n=1)
+        self.assertEqual((aggs["John Doe"].sig_landed, aggs["John Doe"].td_att, aggs["John Doe"].ctrl_sec), (30, 2, 120))
+        jane = UFCFightStats.objects.get(fighter_name="Jane Roe")
+        self.assertEqual((jane.td_landed, jane.td_att, jane.head_landed, jane.head_att), (0, 3, 3, 7))
+
+    def test_summary_windows_read_one_row_per_fighter(self):
+        self.assertEqual(refresh_career_summaries(), 2)
+        raw = aggregate_for_fighters(["John Doe", "Jane Roe"], last_n=4)
+
+        with self.assertNumQueries(2):
+            aggs = aggregate_for_fighters(["John Doe", "Jane Roe"], last_n=5)
+        self.assertEqual(aggs, raw)
+
+        # csak John összesítője frissül; Nobody-nak nincs sora -> nyers lekérdezés
+        self.assertEqual(refresh_career_summaries(["John Doe"]), 1)
+        with self.assertNumQueries(3):
+            aggs = aggregate_for_fighters(["John Doe", "Nobody"], last_n=3)
+        self.assertEqual(aggs["John Doe"], raw["John Doe"])
+        self.assertIsNone(aggs["Nobody"])
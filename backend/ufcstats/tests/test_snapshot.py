@@ -0,0 +1,146 @@
+import os
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from fighters.services import ufcstats_registry
+from ufcstats.api import ufc_radar
+from ufcstats.services.snapshot import (
+    SortedStrings,
+    StringTable,
+    file_digest,
+    read_snapshot_part,
+    sorted_strings_array,
+    write_snapshot,
+)
+
+
+class SnapshotTests(SimpleTestCase):
+    def setUp(self):
+        ufc_radar.clear_cache()
+        ufcstats_registry.clear_cache()
+
+    def tearDown(self):
+        ufc_radar.clear_cache()
+        ufcstats_registry.clear_cache()
+
+    def _write(self, path: Path, content: str):
+        path.write_text(content, encoding="utf-8")
+
+    def test_compiled_snapshot_matches_csv_and_skips_parsing(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            events_csv = td / "ufc_event_details.csv"
+            results_csv = td / "ufc_fight_results.csv"
+            stats_csv = td / "ufc_fight_stats.csv"
+            fighters_csv = td / "ufc_fighter_details.csv"
+            snapshot_dir = td / "snapshot"
+
+            self._write(
+                events_csv,
+                "EVENT,DATE\n"
+                "EV1,\"January 01, 2024\"\n"
+                "EV2,\"February 01, 2024\"\n",
+            )
+            self._write(
+                results_csv,
+                "EVENT,BOUT,OUTCOME,METHOD,ROUND,TIME,WEIGHTCLASS\n"
+                "EV1,B1,W/L,KO,1,1:00,Lightweight\n"
+                "EV2,B2,W/L,Decision,3,5:00,Lightweight\n",
+            )
+            self._write(
+                stats_csv,
+                "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                "EV1,B1,John Doe,1,0,10 of 20,0 of 0,0:00\n"
+                "EV2,B2,John Doe,0,1,30 of 40,2 of 4,3:00\n",
+            )
+            self._write(
+                fighters_csv,
+                "FIRST,LAST,NICKNAME,URL\n"
+                "John,Doe,,http://ufcstats.com/fighter-details/x\n",
+            )
+
+            with patch("ufcstats.api.ufc_radar.EVENTS_CSV", events_csv), patch(
+                "ufcstats.api.ufc_radar.RESULTS_CSV", results_csv
+            ), patch("ufcstats.api.ufc_radar.STATS_CSV", stats_csv), patch(
+                "fighters.services.ufcstats_registry.FIGHTERS_CSV", fighters_csv
+            ), patch("ufcstats.services.snapshot.SNAPSHOT_DIR", snapshot_dir), patch(
+                "ufcstats.management.commands.compile_ufcstats_snapshot.SNAPSHOT_DIR", snapshot_dir
+            ):
+                expected_keys = ufc_radar._fighter_last_fights_keys("John Doe", 5)
+                expected_agg = ufc_radar._aggregate_for_fighter("John Doe", 5)
+                expected_results = ufc_radar._fight_results_map()
+
+                call_command("compile_ufcstats_snapshot", stdout=StringIO())
+                self.assertTrue((snapshot_dir / "CURRENT").exists())
+
+                ufc_radar.clear_cache()
+                ufcstats_registry.clear_cache()
+                with patch("ufcstats.api.ufc_radar._dataset_from_csv") as from_csv, patch(
+                    "fighters.services.ufcstats_registry._read_registry"
+                ) as read_registry, patch.object(
+                    ufcstats_registry.BKTree, "build"
+                ) as build_tree, patch.object(ufcstats_registry.NameIndex, "build") as build_index:
+                    self.assertEqual(ufc_radar._fighter_last_fights_keys("John Doe", 5), expected_keys)
+                    self.assertEqual(ufc_radar._aggregate_for_fighter("John Doe", 5), expected_agg)
+                    self.assertEqual(ufc_radar._fight_results_map(), expected_results)
+                    self.assertTrue(ufcstats_registry.is_known_fighter("John Doe"))
+                    registry = ufcstats_registry.registry_snapshot()
+                    self.assertIsInstance(registry.names, SortedStrings)
+                    self.assertEqual(registry.url_by_name["john doe"], "http://ufcstats.com/fighter-details/x")
+                    self.assertEqual(dict(registry.display_by_name), {"john doe": "John Doe"})
+                    self.assertEqual(
+                        dict(registry.display_by_url), {"http://ufcstats.com/fighter-details/x": "John Doe"}
+                    )
+                    self.assertFalse(ufcstats_registry.is_known_fighter("John"))
+                    # a fa és a prefix index a snapshotból jön, workerenként nem épül újra
+                    self.assertEqual(ufcstats_registry.did_you_mean("Jon Doe"), ["John Doe"])
+                    self.assertEqual(ufcstats_registry.suggest_fighters("doe")[0]["name"], "John Doe")
+                    from_csv.assert_not_called()
+                    read_registry.assert_not_called()
+                    build_tree.assert_not_called()
+                    build_index.assert_not_called()
+
+                # a CSV tartalma megváltozott -> a snapshot elavult, vissza a CSV-re
+                self._write(
+                    stats_csv,
+                    "EVENT,BOUT,FIGHTER,KD,SUB.ATT,SIG.STR.,TD,CTRL\n"
+                    "EV2,B2,John Doe,0,1,30 of 40,2 of 4,3:00\n",
+                )
+                ufc_radar.clear_cache()
+                self.assertEqual(ufc_radar._fighter_last_fights_keys("John Doe", 5), [("EV2", "B2")])
+
+    def test_sources_are_hashed_only_when_their_stat_changes(self):
+        with TemporaryDirectory() as td:
+            td = Path(td)
+            source = td / "ufc_fighter_details.csv"
+            self._write(source, "FIRST,LAST\nJohn,Doe\n")
+            write_snapshot({"p": ({}, StringTable())}, [source], td / "snapshot")
+
+            with patch("ufcstats.services.snapshot.file_digest", wraps=file_digest) as digest:
+                self.assertIsNotNone(read_snapshot_part("p", [source], td / "snapshot"))
+                digest.assert_not_called()
+
+                # ugyanaz a tartalom, új mtime (pl. deploy másolás): hash, de érvényes marad
+                st = source.stat()
+                os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+                self.assertIsNotNone(read_snapshot_part("p", [source], td / "snapshot"))
+                self.assertEqual(digest.call_count, 1)
+
+                self._write(source, "FIRST,LAST\nJane,Roe\n")
+                self.assertIsNone(read_snapshot_part("p", [source], td / "snapshot"))
+
+    def test_sorted_strings_binary_search(self):
+        names = SortedStrings(sorted_strings_array(["jon jones", "alex pereira", "jose aldo", "jon"]))
+        self.assertEqual(list(names), ["alex pereira", "jon", "jon jones", "jose aldo"])
+        self.assertIn("jon jones", names)
+        self.assertIn("jon", names)
+        self.assertNotIn("jo", names)
+        self.assertNotIn("jon jones junior", names)  # hosszabb a tömb szélességénél
+        self.assertNotIn("", names)
+        self.assertEqual(names.index("jose aldo"), 3)
+        self.assertEqual(len(SortedStrings(sorted_strings_array([]))), 0)
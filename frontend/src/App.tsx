@@ -8,18 +8,17 @@ import ComparePanel from "./components/compare/ComparePanel";
 import AuthPanel from "./components/auth/AuthPanel";
 import AuthHero from "./components/auth/AuthHero";
 
-import type { Fighter } from "./types";
+import type { Fighter, FighterListItem } from "./types";
 import { fetchMe, logout, type MeResponse } from "./api/authApi";
+import { fetchFighter, fetchFighterList } from "./api/fighterApi";
 import CategoriesPage from "./components/MmaForum";
 
 type Ful = "Fighters" | "Details" | "Compare" | "Auth" | "Forum";
 
-const API_URL = "http://127.0.0.1:8000/api";
-
 export default function App() {
   const NAV_H = 64;
 
-  const [fighters, setFighters] = useState<Fighter[]>([]);
+  const [fighters, setFighters] = useState<FighterListItem[]>([]);
   const [hiba, setHiba] = useState<string>("");
 
   const [kivalasztott, setKivalasztott] = useState<Fighter | null>(null);
@@ -52,17 +51,37 @@ export default function App() {
       });
   }, []);
 
-  useEffect(() => {
-    fetch(`${API_URL}/fighters/`)
-      .then((res) => {
-        if (!res.ok) throw new Error("Failed to retrieve the data.");
-        return res.json();
-      })
-      .then((data: Fighter[]) => {
-        setFighters(data);
-        setKivalasztott((prev) => prev ?? (data.length > 0 ? data[0] : null));
-      })
+  // a lista kompakt sorokat ad, a kiválasztott fighter teljes profilját külön kérjük le
+  function selectFighter(f: FighterListItem | null, set: (f: Fighter | null) => void) {
+    if (!f) {
+      set(null);
+      return;
+    }
+    fetchFighter(f.id)
+      .then(set)
       .catch((err) => setHiba(err.message));
+  }
+
+  useEffect(() => {
+    let cancelled = false;
+    let first = true;
+
+    fetchFighterList((rows) => {
+      if (cancelled) return;
+      setFighters((prev) => [...prev, ...rows]);
+      if (first && rows.length > 0) {
+        first = false;
+        fetchFighter(rows[0].id)
+          .then((f) => setKivalasztott((prev) => prev ?? f))
+          .catch((err) => setHiba(err.message));
+      }
+    }).catch((err) => {
+      if (!cancelled) setHiba(err.message);
+    });
+
+    return () => {
+      cancelled = true;
+    };
   }, []);
 
   function handleLogout() {
@@ -117,7 +136,7 @@ export default function App() {
             <FighterGrid
               fighters={fighters}
               selectedId={kivalasztott?.id ?? null}
-              onSelect={(f) => setKivalasztott(f)}
+              onSelect={(f) => selectFighter(f, setKivalasztott)}
             />
           </Box>
 
@@ -172,8 +191,8 @@ export default function App() {
           fighters={fighters}
           left={left}
           right={right}
-          setLeft={setLeft}
-          setRight={setRight}
+          setLeft={(f) => selectFighter(f, setLeft)}
+          setRight={(f) => selectFighter(f, setRight)}
         />
       )}
 
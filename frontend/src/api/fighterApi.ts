@@ -0,0 +1,26 @@
+import type { CursorPage, Fighter, FighterListItem } from "../types";
+
+const API_URL = "http://127.0.0.1:8000/api";
+
+// Végigmegy a cursor lapokon; minden lap megérkezésekor szól, így a grid fokozatosan töltődik.
+export async function fetchFighterList(
+  onPage: (rows: FighterListItem[]) => void,
+  pageSize = 100
+) {
+  let url: string | null = `${API_URL}/fighters/?page_size=${pageSize}`;
+
+  while (url) {
+    const res: Response = await fetch(url);
+    if (!res.ok) throw new Error("Failed to retrieve the data.");
+
+    const page: CursorPage<FighterListItem> = await res.json();
+    onPage(page.results);
+    url = page.next;
+  }
+}
+
+export async function fetchFighter(id: number): Promise<Fighter> {
+  const res = await fetch(`${API_URL}/fighters/${id}/`);
+  if (!res.ok) throw new Error("Failed to retrieve the fighter.");
+  return res.json();
+}
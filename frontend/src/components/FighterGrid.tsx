@@ -1,9 +1,9 @@
 import { Card, CardContent, Chip, Box, Typography } from "@mui/material";
-import type { Fighter } from "../types";
+import type { FighterListItem } from "../types";
 
 type Props = {
-  fighters: Fighter[];
-  onSelect: (f: Fighter) => void;
+  fighters: FighterListItem[];
+  onSelect: (f: FighterListItem) => void;
   selectedId: number | null;
 };
 
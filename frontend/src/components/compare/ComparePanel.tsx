@@ -1,6 +1,6 @@
 import { Autocomplete, Box, TextField } from "@mui/material";
 import { useEffect, useMemo, useState } from "react";
-import type { Fighter } from "../../types";
+import type { Fighter, FighterListItem } from "../../types";
 import FighterCompareCard from "./FighterCompareCard";
 import TaleOfTheTape from "./TaleOfTheTape";
 import UfcRadarChart from "./UfcRadarChart";
@@ -14,11 +14,12 @@ type Metrics = {
 };
 
 type Props = {
-  fighters: Fighter[];
+  fighters: FighterListItem[];
   left: Fighter | null;
   right: Fighter | null;
-  setLeft: (f: Fighter | null) => void;
-  setRight: (f: Fighter | null) => void;
+  // a listából választott sor; a teljes profilt a szülő tölti be
+  setLeft: (f: FighterListItem | null) => void;
+  setRight: (f: FighterListItem | null) => void;
 };
 
 const inputSx = {
@@ -91,37 +92,34 @@ export default function ComparePanel({
 
   useEffect(() => {
     async function load() {
-      if (!left) {
-        setLeftRadar(null);
-        return;
-      }
-      const res = await fetch(
-        `http://127.0.0.1:8000/api/ufc/radar/?fighter=${encodeURIComponent(
-          left.name
-        )}&last=5`
+      const names = [left?.name, right?.name].filter(
+        (n): n is string => !!n
       );
-      const data = await res.json();
-      setLeftRadar(data.metrics ?? null);
-    }
-    load();
-  }, [left]);
-
-  useEffect(() => {
-    async function load() {
-      if (!right) {
+      if (names.length === 0) {
+        setLeftRadar(null);
         setRightRadar(null);
         return;
       }
+      const qs = names
+        .map((n) => `fighter=${encodeURIComponent(n)}`)
+        .join("&");
       const res = await fetch(
-        `http://127.0.0.1:8000/api/ufc/radar/?fighter=${encodeURIComponent(
-          right.name
-        )}&last=5`
+        `http://127.0.0.1:8000/api/ufc/radar/batch/?${qs}&last=5`
       );
       const data = await res.json();
-      setRightRadar(data.metrics ?? null);
+      const byName = new Map<string, Metrics | null>(
+        (data.results ?? []).map(
+          (r: { fighter: string; metrics?: Metrics }) => [
+            r.fighter,
+            r.metrics ?? null,
+          ]
+        )
+      );
+      setLeftRadar(left ? byName.get(left.name.trim()) ?? null : null);
+      setRightRadar(right ? byName.get(right.name.trim()) ?? null : null);
     }
     load();
-  }, [right]);
+  }, [left, right]);
 
   return (
     <Box
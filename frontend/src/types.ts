@@ -31,6 +31,20 @@ export type Fighter = {
   nickname?: string | null;
 };
 
+// GET /fighters/ sora: a teljes profil csak a /fighters/:id/ végpontról jön
+export type FighterListItem = Pick<
+  Fighter,
+  "id" | "name" | "nickname" | "wins" | "losses" | "draw" | "upload_image"
+> & {
+  division: Pick<Division, "id" | "name">;
+};
+
+export type CursorPage<T> = {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+};
+
 export type AuthUser = {
   id: number;
   username: string;